@@ -7,74 +7,57 @@
 # ࿄ ࿅ ࿇
 # -----------------------------------------------------------------------------
 
-from PySide6.QtWidgets import QGraphicsEllipseItem, QGraphicsRectItem
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor, QPen
+from functools import lru_cache
 
-class NoBorderEllipseItem(QGraphicsEllipseItem):
-    def __init__(self, parent=None):
-        super().__init__(parent)
+from qt_exports import lazyQtExports
 
-        # Set the pen to transparent color (no border)
-        self.setPen(QPen(Qt.transparent))
+# The catalog of inlays is Qt free, its Qt side (items, colours and pens) is
+# in qt_drawing, only imported when first asked for
+QT_NAMES = ('NoBorderEllipseItem', 'NoBorderRectItem', 'hex_to_qcolor', 'inlayColour', 'inlayPen', 'inlayItem')
 
-class NoBorderRectItem(QGraphicsRectItem):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-
-        # Set the pen to transparent color (no border)
-        self.setPen(QPen(Qt.transparent))
-
-def hex_to_qcolor(hex_color):
-    # Remove '#' from the beginning of the hexadecimal string if present
-    hex_color = hex_color.lstrip('#')
-
-    # Convert hexadecimal color code to RGB values
-    red = int(hex_color[0:2], 16)
-    green = int(hex_color[2:4], 16)
-    blue = int(hex_color[4:6], 16)
-
-    # Create a QColor object with the RGB values
-    qcolor = QColor(red, green, blue)
-
-    return qcolor
-
-strandbergPen = QPen(hex_to_qcolor("#1A120B"))
-strandbergPen.setWidth(2)
+__getattr__ = lazyQtExports(__name__, 'qt_drawing', QT_NAMES)
 
+# Generic inlay of each style. shape is 'ellipse' or 'rect', pen is None for
+# no border or (hex colour, width); sizes are in pixels, delta_x is the
+# position between the fret and the next one (0 to 1) and delta_y the position
+# across the neck (-1 to 1 from the middle line, beyond for the side of the neck)
 inlaysGeneralParameters = {
 "black_dot": {
-    'type': NoBorderEllipseItem,
-    'color': Qt.black,
+    'shape': 'ellipse',
+    'color': "#000000",
+    'pen': None,
     'size_x': 20,
     'size_y': 20,
     'delta_x': 0.5,
     'delta_y': 0.0},
 "white_dot": {
-    'type': NoBorderEllipseItem,
-    'color': hex_to_qcolor("#FAF8F1"),
+    'shape': 'ellipse',
+    'color': "#FAF8F1",
+    'pen': None,
     'size_x': 25,
     'size_y': 25,
     'delta_x': 0.5,
     'delta_y': 0.0},
 ".strandberg＊": {
-    'type': QGraphicsEllipseItem,
-    'color': hex_to_qcolor("#E5E5CB"),
-    'pen': strandbergPen,
+    'shape': 'ellipse',
+    'color': "#E5E5CB",
+    'pen': ("#1A120B", 2),
     'size_x': 9,
     'size_y': 9,
     'delta_x': 0.5,
     'delta_y': 0.8},
 "Celeste": {
-    'type': NoBorderRectItem,
-    'color': hex_to_qcolor("#E3CAA5"),
+    'shape': 'rect',
+    'color': "#E3CAA5",
+    'pen': None,
     'size_x': 7,
     'size_y': 40,
     'delta_x': 0.5,
     'delta_y': 0.8},
 "Millimetric": {
-    'type': NoBorderRectItem,
-    'color': Qt.black,
+    'shape': 'rect',
+    'color': "#000000",
+    'pen': None,
     'size_x': 2.5,
     'size_y': 45,
     'delta_x': 0.5,
@@ -86,43 +69,48 @@ sideInlaysDeltaY = 1.3
 
 sideInlaysGeneralParameters = {
 "black_dot": {
-    'type': NoBorderEllipseItem,
-    'color': Qt.black,
+    'shape': 'ellipse',
+    'color': "#000000",
+    'pen': None,
     'size_x': sideInlaysRoundSize,
     'size_y': sideInlaysRoundSize,
     'delta_x': 0.5,
     'delta_y': sideInlaysDeltaY},
 "white_dot": {
-    'type': NoBorderEllipseItem,
-    'color': hex_to_qcolor("#FAF8F1"),
+    'shape': 'ellipse',
+    'color': "#FAF8F1",
+    'pen': None,
     'size_x': sideInlaysRoundSize,
     'size_y': sideInlaysRoundSize,
     'delta_x': 0.5,
     'delta_y': sideInlaysDeltaY},
 ".strandberg＊": {
-    'type': QGraphicsEllipseItem,
-    'color': hex_to_qcolor("#E5E5CB"),
-    'pen': strandbergPen,
+    'shape': 'ellipse',
+    'color': "#E5E5CB",
+    'pen': ("#1A120B", 2),
     'size_x': 9,
     'size_y': 9,
     'delta_x': 0.5,
     'delta_y': sideInlaysDeltaY},
 "Celeste": {
-    'type': NoBorderRectItem,
-    'color': hex_to_qcolor("#E3CAA5"),
+    'shape': 'rect',
+    'color': "#E3CAA5",
+    'pen': None,
     'size_x': 7,
     'size_y': 12,
     'delta_x': 0.5,
     'delta_y': sideInlaysDeltaY-.1},
 "Millimetric": {
-    'type': NoBorderRectItem,
-    'color': Qt.black,
+    'shape': 'rect',
+    'color': "#000000",
+    'pen': None,
     'size_x': 2.5,
     'size_y': 12,
     'delta_x': 0.5,
     'delta_y': sideInlaysDeltaY-.1},
 }
 
+# number of inlays on each marked fret
 inlaymarkings = {
 2: 1,
 4: 1,
@@ -136,77 +124,87 @@ inlaymarkings = {
 23: 2
 }
 
-# based on the generic inlay of each type, we generate all the inlays for every
-# position on the neck
-inlays = {}
-sideInlays = {}
-for inlayType in inlaysGeneralParameters.keys():
-    inlays[inlayType] = {}
-    sideInlays[inlayType] = {}
-    for inlaymarking in inlaymarkings.keys():
-        inlays[inlayType][inlaymarking] = []
-        sideInlays[inlayType][inlaymarking] = []
-        for i in range(inlaymarkings[inlaymarking]):
-            inlays[inlayType][inlaymarking].append({})
-            sideInlays[inlayType][inlaymarking].append({})
-            for param in inlaysGeneralParameters[inlayType].keys():
-                inlays[inlayType][inlaymarking][i][param] = inlaysGeneralParameters[inlayType][param]
-                sideInlays[inlayType][inlaymarking][i][param] = sideInlaysGeneralParameters[inlayType][param]
-
-# and according to each type, we tune the positions and or size of certain inlays
-inlays["black_dot"][11][0]['delta_y'] = 0.75
-inlays["black_dot"][11][1]['delta_y'] = -0.75
-inlays["black_dot"][23][0]['delta_y'] = 0.75
-inlays["black_dot"][23][1]['delta_y'] = -0.75
-
-inlays["white_dot"][11][0]['delta_y'] = 0.75
-inlays["white_dot"][11][1]['delta_y'] = -0.75
-inlays["white_dot"][23][0]['delta_y'] = 0.75
-inlays["white_dot"][23][1]['delta_y'] = -0.75
-
-inlays[".strandberg＊"][11][1]['delta_y'] = inlays[".strandberg＊"][11][1]['delta_y']-0.4
-inlays[".strandberg＊"][14][0]['delta_y'] = -inlays[".strandberg＊"][14][0]['delta_y']
-inlays[".strandberg＊"][16][0]['delta_y'] = -inlays[".strandberg＊"][16][0]['delta_y']
-inlays[".strandberg＊"][18][0]['delta_y'] = -inlays[".strandberg＊"][18][0]['delta_y']
-inlays[".strandberg＊"][20][0]['delta_y'] = -inlays[".strandberg＊"][20][0]['delta_y']
-inlays[".strandberg＊"][23][0]['delta_y'] = -inlays[".strandberg＊"][23][0]['delta_y']
-inlays[".strandberg＊"][23][1]['delta_y'] = -(inlays[".strandberg＊"][23][1]['delta_y']-0.4)
-
-inlays["Celeste"][11][0]['size_y'] = inlays["Celeste"][11][0]['size_y']*1.7
-inlays["Celeste"][11][1]['size_y'] = inlays["Celeste"][11][1]['size_y']*1.7
-inlays["Celeste"][11][0]['delta_y'] = inlays["Celeste"][11][0]['delta_y']-0.18
-inlays["Celeste"][11][1]['delta_y'] = -(inlays["Celeste"][11][1]['delta_y']-0.18)
-inlays["Celeste"][23][1]['delta_y'] = -inlays["Celeste"][23][1]['delta_y']
-
-inlays["Millimetric"][11][0]['delta_x'] -= 0.17
-inlays["Millimetric"][11][1]['delta_x'] += 0.17
-inlays["Millimetric"][23][0]['delta_x'] -= 0.17
-inlays["Millimetric"][23][1]['delta_x'] += 0.17
-
-inlays["None"]= {}
-
-# and according to each type, we tune the positions and or size of certain sideInlays
-sideInlays["black_dot"][11][0]['delta_x'] -= 0.17
-sideInlays["black_dot"][11][1]['delta_x'] += 0.17
-sideInlays["black_dot"][23][0]['delta_x'] -= 0.17
-sideInlays["black_dot"][23][1]['delta_x'] += 0.17
-
-sideInlays["white_dot"][11][0]['delta_x'] -= 0.17
-sideInlays["white_dot"][11][1]['delta_x'] += 0.17
-sideInlays["white_dot"][23][0]['delta_x'] -= 0.17
-sideInlays["white_dot"][23][1]['delta_x'] += 0.17
-
-sideInlays[".strandberg＊"][11][0]['delta_x'] -= 0.17
-sideInlays[".strandberg＊"][11][1]['delta_x'] += 0.17
-sideInlays[".strandberg＊"][23][0]['delta_x'] -= 0.17
-sideInlays[".strandberg＊"][23][1]['delta_x'] += 0.17
-
-sideInlays["Millimetric"][11][0]['delta_x'] -= 0.17
-sideInlays["Millimetric"][11][1]['delta_x'] += 0.17
-sideInlays["Millimetric"][23][0]['delta_x'] -= 0.17
-sideInlays["Millimetric"][23][1]['delta_x'] += 0.17
-
-sideInlays["None"]= {}
+# and according to each style, the positions and or size of certain inlays
+# differ from the generic one: {style: {fret: (changes of each inlay of the fret)}}
+doubleMarksAbove = {
+11: ({'delta_y': 0.75}, {'delta_y': -0.75}),
+23: ({'delta_y': 0.75}, {'delta_y': -0.75})}
+doubleMarksAside = {
+11: ({'delta_x': 0.5-0.17}, {'delta_x': 0.5+0.17}),
+23: ({'delta_x': 0.5-0.17}, {'delta_x': 0.5+0.17})}
+
+inlaysOverrides = {
+"black_dot": doubleMarksAbove,
+"white_dot": doubleMarksAbove,
+".strandberg＊": {
+    11: ({}, {'delta_y': 0.8-0.4}),
+    14: ({'delta_y': -0.8},),
+    16: ({'delta_y': -0.8},),
+    18: ({'delta_y': -0.8},),
+    20: ({'delta_y': -0.8},),
+    23: ({'delta_y': -0.8}, {'delta_y': -(0.8-0.4)})},
+"Celeste": {
+    11: ({'size_y': 40*1.7, 'delta_y': 0.8-0.18}, {'size_y': 40*1.7, 'delta_y': -(0.8-0.18)}),
+    23: ({}, {'delta_y': -0.8})},
+"Millimetric": doubleMarksAside,
+}
+
+sideInlaysOverrides = {
+"black_dot": doubleMarksAside,
+"white_dot": doubleMarksAside,
+".strandberg＊": doubleMarksAside,
+"Millimetric": doubleMarksAside,
+}
+
+inlayStyles = list(inlaysGeneralParameters.keys()) + ["None"]
+
+class InlayMark:
+    '''
+    One inlay of a style, Qt free and with everything but the neck dimensions
+    resolved: side tells a side of the neck inlay, widening is the factor (-1,
+    0 or 1) of the neck widening at its fret to add to its y
+    '''
+    __slots__ = ('fret', 'side', 'shape', 'colour', 'pen', 'sizeX', 'sizeY', 'deltaX', 'deltaY', 'widening')
+
+    def __init__(self, fret, side, parameters, widening):
+        self.fret = fret
+        self.side = side
+        self.shape = parameters['shape']
+        self.colour = parameters['color']
+        self.pen = parameters['pen']
+        self.sizeX = parameters['size_x']
+        self.sizeY = parameters['size_y']
+        self.deltaX = parameters['delta_x']
+        self.deltaY = parameters['delta_y']
+        self.widening = widening
+
+@lru_cache(maxsize=None)
+def compiledInlays(style):
+    '''
+    Tuple of the InlayMark of a style ordered by fret, the neck inlays of
+    a fret before its side inlays; compiled on first use
+    '''
+    if style not in inlaysGeneralParameters:
+        return ()
+    compiled = []
+    for fret, numberOfMarks in inlaymarkings.items():
+        # the neck widening goes up for inlays below the middle line and
+        # is dropped once an inlay sits on it, for the following inlays of
+        # the fret and its side inlays too
+        widening = 1
+        for i in range(numberOfMarks):
+            parameters = dict(inlaysGeneralParameters[style])
+            parameters.update(inlaysOverrides.get(style, {}).get(fret, ({},)*numberOfMarks)[i])
+            if parameters['delta_y'] < 0:
+                widening = -widening
+            elif parameters['delta_y'] == 0:
+                widening = 0
+            compiled.append(InlayMark(fret, False, parameters, widening))
+        for i in range(numberOfMarks):
+            parameters = dict(sideInlaysGeneralParameters[style])
+            parameters.update(sideInlaysOverrides.get(style, {}).get(fret, ({},)*numberOfMarks)[i])
+            compiled.append(InlayMark(fret, True, parameters, abs(widening)))
+    return tuple(compiled)
 
 
 customColours = {
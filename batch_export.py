@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+#
+# -----------------------------------------------------------------------------
+# Author: Gregoire Vandenschrick
+# Date:   17/10/2026
+# ࿄ ࿅ ࿇
+# -----------------------------------------------------------------------------
+'''
+Offscreen batch export of the diagrams to PNG and/or SVG.
+The circle view of the degree frame only depends on the scale and mode, it is
+exported once per (scale, mode) as circle/<scale>/<mode>.<format>.
+The neck window is exported for every (tuning, root, scale, mode) as
+neck/<tuning>/<root>/<scale>/<mode>.<format>.
+The work is split in tasks (one per scale for the circles, one per tuning and
+root for the necks) shared between worker processes, each driving its own
+offscreen QApplication, MainWindow and NeckWindow through their widgets.
+Outputs newer than all the sources of the application are up to date and
+skipped, unless --force is given.
+
+    python batch_export.py output_directory [--formats png svg] [--views circle neck]
+                           [--scales ...] [--tunings ...] [--roots ...] [--workers N]
+'''
+
+import argparse
+import glob
+import multiprocessing
+import os
+import re
+import sys
+
+# Qt must run offscreen, in this process and the workers it spawns
+os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+from catalogs import scales, tunings, notes
+from pitch_class_index import linkModesToScales
+
+SOURCES_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+FORMATS = ("png", "svg")
+VIEWS = ("circle", "neck")
+MARGIN = 10
+BACKGROUND = "#C0C0C0" # Qt.lightGray, as in the application views
+
+# -----------------------------------------------------------------------------
+
+def slug(name):
+    '''
+    File name friendly version of catalog names
+    '''
+    name = name.replace('♯', 's').replace('♭', 'b')
+    return re.sub(r'[^A-Za-z0-9]+', '-', name).strip('-')
+
+def modeFileName(modeIndex, modeName):
+    return "%02d-%s" % (modeIndex+1, slug(modeName))
+
+def sourcesTime():
+    '''
+    Time of the last modification of the sources the diagrams depend on
+    '''
+    return max(os.path.getmtime(path) for path in glob.glob(os.path.join(SOURCES_DIRECTORY, "*.py")))
+
+def isUpToDate(path, referenceTime):
+    return os.path.exists(path) and os.path.getmtime(path) > referenceTime
+
+def exportTasks(outputDirectory, formats, views, scaleNames, tuningNames, rootNotes, force=False):
+    '''
+    List of the tasks still to do, each one being (view, tuning, root, scale,
+    [(mode index, [paths to write]), ...]), tuning and root being None for
+    the circle view. Tasks of the neck view regroup all the scales of a
+    tuning and root, so that a worker changes these only once
+    '''
+    modesByScale = linkModesToScales()
+    referenceTime = sourcesTime()
+    tasks = list()
+
+    def modesToDo(directory, scaleName):
+        todo = list()
+        for modeIndex, modeName in enumerate(modesByScale[scaleName]):
+            baseName = os.path.join(directory, slug(scaleName), modeFileName(modeIndex, modeName))
+            paths = [baseName + "." + fileFormat for fileFormat in formats]
+            if force or not all(isUpToDate(path, referenceTime) for path in paths):
+                todo.append((modeIndex, paths))
+        return todo
+
+    if "circle" in views:
+        for scaleName in scaleNames:
+            todo = modesToDo(os.path.join(outputDirectory, "circle"), scaleName)
+            if todo:
+                tasks.append(("circle", None, None, [(scaleName, todo)]))
+    if "neck" in views:
+        for tuningName in tuningNames:
+            for rootNote in rootNotes:
+                directory = os.path.join(outputDirectory, "neck", slug(tuningName), slug(rootNote))
+                todoByScale = [(scaleName, modesToDo(directory, scaleName)) for scaleName in scaleNames]
+                todoByScale = [(scaleName, todo) for (scaleName, todo) in todoByScale if todo]
+                if todoByScale:
+                    tasks.append(("neck", tuningName, rootNote, todoByScale))
+    return tasks
+
+# -----------------------------------------------------------------------------
+
+def renderScene(scene, path):
+    '''
+    Renders all the items of scene, on the background of the views, to path,
+    a png or svg file. Written under a temporary name first so that an
+    interrupted export never leaves an up to date looking file
+    '''
+    from PySide6.QtCore import QRectF, QSize
+    from PySide6.QtGui import QImage, QPainter, QColor
+    from PySide6.QtSvg import QSvgGenerator
+
+    source = scene.itemsBoundingRect().adjusted(-MARGIN, -MARGIN, MARGIN, MARGIN)
+    size = QSize(int(source.width())+1, int(source.height())+1)
+    target = QRectF(0, 0, size.width(), size.height())
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temporaryPath = path + ".part"
+
+    if path.endswith(".svg"):
+        device = QSvgGenerator()
+        device.setFileName(temporaryPath)
+        device.setSize(size)
+        device.setViewBox(target)
+        device.setTitle(os.path.basename(path))
+    else:
+        device = QImage(size, QImage.Format_ARGB32)
+    painter = QPainter(device)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.fillRect(target, QColor(BACKGROUND))
+    scene.render(painter, target, source)
+    painter.end()
+    if not path.endswith(".svg"):
+        device.save(temporaryPath, "PNG")
+    os.replace(temporaryPath, path)
+
+class DiagramRenderer:
+    '''
+    The application of one worker process, driven through its widgets as a
+    user would, the neck window being open
+    '''
+    def __init__(self, scaleFactor=1.0):
+        from PySide6.QtWidgets import QApplication
+        import scale_circle
+
+        self.application = QApplication.instance() or QApplication(sys.argv[:1])
+        self.window = scale_circle.MainWindow(scale_factor=scaleFactor)
+        self.window.show()
+        self.window.full_neck_radioButton.setChecked(True)
+        self.neckWindow = self.window.neckGeneralView
+
+    def set_diagram(self, scaleName, modeIndex, tuningName=None, rootNote=None):
+        # comboboxes only signal actual changes, settings already in place cost nothing
+        if tuningName is not None:
+            self.window.tunings_combobox.setCurrentText(tuningName)
+        if rootNote is not None:
+            self.neckWindow.root_note_combobox.setCurrentText(rootNote)
+        self.window.scales_combobox.setCurrentText(scaleName)
+        self.window.mode_combobox.setCurrentIndex(modeIndex)
+        self.window.render_scheduler.flush()
+
+    def render(self, view, paths):
+        if view == "circle":
+            scene = self.window.degreesFrames[0].circle_scene
+        else:
+            scene = self.neckWindow.neck_scene
+        for path in paths:
+            renderScene(scene, path)
+
+# the renderer of the worker process
+renderer = None
+
+def initWorker(scaleFactor):
+    global renderer
+    renderer = DiagramRenderer(scaleFactor)
+
+def runTask(task):
+    '''
+    Exports the diagrams of a task in the worker process, returns the paths written
+    '''
+    view, tuningName, rootNote, todoByScale = task
+    written = list()
+    for scaleName, todo in todoByScale:
+        for modeIndex, paths in todo:
+            renderer.set_diagram(scaleName, modeIndex, tuningName, rootNote)
+            renderer.render(view, paths)
+            written.extend(paths)
+    return written
+
+def export(outputDirectory, formats=FORMATS, views=VIEWS, scaleNames=None, tuningNames=None, rootNotes=None,
+           workers=None, scaleFactor=1.0, force=False, progress=None):
+    '''
+    Exports all the diagrams not up to date, returns the number of files written
+    '''
+    tasks = exportTasks(outputDirectory, formats, views,
+                        scaleNames or list(scales.keys()),
+                        tuningNames or list(tunings.keys()),
+                        rootNotes or list(notes.keys()),
+                        force=force)
+    if not tasks:
+        return 0
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    numberWritten = 0
+    # spawned, not forked, workers: each one starts its own QApplication
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(workers, initializer=initWorker, initargs=(scaleFactor,)) as pool:
+        for written in pool.imap_unordered(runTask, tasks):
+            numberWritten += len(written)
+            if progress is not None:
+                progress(numberWritten, written)
+    return numberWritten
+
+# -----------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Offscreen batch export of the scale circle and neck diagrams")
+    parser.add_argument("output", help="output directory")
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=list(FORMATS))
+    parser.add_argument("--views", nargs="+", choices=VIEWS, default=list(VIEWS))
+    parser.add_argument("--scales", nargs="+", choices=list(scales.keys()), help="default: all the scales")
+    parser.add_argument("--tunings", nargs="+", choices=list(tunings.keys()), help="default: all the tunings")
+    parser.add_argument("--roots", nargs="+", choices=list(notes.keys()), help="default: all the notes")
+    parser.add_argument("--workers", type=int, help="number of worker processes, default: number of CPUs")
+    parser.add_argument("--scale-factor", type=float, default=1.0)
+    parser.add_argument("--force", action="store_true", help="also export the diagrams already up to date")
+    parser.add_argument("--dry-run", action="store_true", help="only tell how many diagrams are to be exported")
+    arguments = parser.parse_args()
+
+    if arguments.dry_run:
+        tasks = exportTasks(arguments.output, arguments.formats, arguments.views,
+                            arguments.scales or list(scales.keys()),
+                            arguments.tunings or list(tunings.keys()),
+                            arguments.roots or list(notes.keys()),
+                            force=arguments.force)
+        numberOfFiles = sum(len(paths) for task in tasks for (scaleName, todo) in task[3] for (modeIndex, paths) in todo)
+        print("%s files to export in %s tasks" % (numberOfFiles, len(tasks)))
+    else:
+        def printProgress(numberWritten, written):
+            print("%s files written (last: %s)" % (numberWritten, written[-1] if written else "-"))
+        numberWritten = export(arguments.output, arguments.formats, arguments.views,
+                               arguments.scales, arguments.tunings, arguments.roots,
+                               arguments.workers, arguments.scale_factor, arguments.force,
+                               progress=printProgress)
+        print("Done, %s files written" % numberWritten)
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+#
+# -----------------------------------------------------------------------------
+# Author: Gregoire Vandenschrick
+# Date:   17/10/2026
+# ࿄ ࿅ ࿇
+# -----------------------------------------------------------------------------
+'''
+Cold start timing report of scale_circle.
+Each run is a fresh Python process timing, one after the other: the import of
+the Qt free modules (checking Qt is not pulled in), the import of Qt and
+creation of the QApplication, the import of scale_circle, the construction of
+MainWindow and its first display. The number of circle and neck drawings done
+until then is reported too. Runs are offscreen unless --onscreen is given.
+
+    python benchmarks/cold_start.py [--runs 10] [--json report.json] [--onscreen]
+'''
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PHASES = ("import_theory", "import_qt", "import_app", "construct", "first_show", "total")
+
+# -----------------------------------------------------------------------------
+
+def measureOnce():
+    '''
+    Run in the child process: returns the timings of one cold start
+    '''
+    sys.path.insert(0, REPOSITORY)
+    timings = dict()
+    start = time.perf_counter()
+
+    import catalogs, pitch_class_sets, pitch_class_index, chord_voicings, fretboard, colour_tables, Inlays, scale_circle_library
+    timings["import_theory"] = time.perf_counter() - start
+    qtFreeImport = "PySide6" not in sys.modules
+
+    step = time.perf_counter()
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import QCoreApplication
+    app = QApplication(sys.argv[:1])
+    timings["import_qt"] = time.perf_counter() - step
+
+    step = time.perf_counter()
+    import scale_circle
+    timings["import_app"] = time.perf_counter() - step
+
+    drawings = {"draw_scale": 0, "draw_notes_on_neck": 0}
+    for name in drawings.keys():
+        method = getattr(scale_circle.CircleAndNeckVBoxFrame, name)
+        def countedMethod(self, *args, _method=method, _name=name, **kwargs):
+            drawings[_name] += 1
+            return _method(self, *args, **kwargs)
+        setattr(scale_circle.CircleAndNeckVBoxFrame, name, countedMethod)
+
+    step = time.perf_counter()
+    window = scale_circle.MainWindow(scale_factor=1.0)
+    timings["construct"] = time.perf_counter() - step
+
+    step = time.perf_counter()
+    window.show()
+    QCoreApplication.processEvents()
+    timings["first_show"] = time.perf_counter() - step
+
+    timings["total"] = time.perf_counter() - start
+    window.close()
+    return {"timings": timings, "drawings": drawings, "qtFreeImport": qtFreeImport}
+
+def runChild(onscreen):
+    environment = dict(os.environ)
+    if not onscreen:
+        environment["QT_QPA_PLATFORM"] = "offscreen"
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), "--child"],
+                            env=environment, capture_output=True, text=True, check=True).stdout
+    # only the last line is ours, the application may print before it
+    return json.loads(output.strip().splitlines()[-1])
+
+def report(runs, onscreen):
+    results = [runChild(onscreen) for run in range(runs)]
+    summary = {"python": platform.python_version(),
+               "platform": platform.platform(),
+               "qt_platform": "default" if onscreen else "offscreen",
+               "runs": runs,
+               "qt_free_import": all(result["qtFreeImport"] for result in results),
+               "drawings": results[-1]["drawings"],
+               "phases": dict()}
+    try:
+        import PySide6
+        summary["pyside6"] = PySide6.__version__
+    except ImportError:
+        summary["pyside6"] = None
+    for phase in PHASES:
+        values = [result["timings"][phase] for result in results]
+        summary["phases"][phase] = {"median": statistics.median(values), "min": min(values), "max": max(values)}
+    return summary
+
+def printReport(summary):
+    print("Cold start of scale_circle, %s runs (Python %s, PySide6 %s, %s, Qt platform %s)"
+          % (summary["runs"], summary["python"], summary["pyside6"], summary["platform"], summary["qt_platform"]))
+    print("%-14s %10s %10s %10s" % ("phase", "median ms", "min ms", "max ms"))
+    for phase in PHASES:
+        values = summary["phases"][phase]
+        print("%-14s %10.1f %10.1f %10.1f" % (phase, 1000*values["median"], 1000*values["min"], 1000*values["max"]))
+    print("Qt free modules imported without Qt: %s" % summary["qt_free_import"])
+    print("Drawings until first display: %s" % ", ".join("%s %s" % item for item in summary["drawings"].items()))
+
+# -----------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cold start timing report of scale_circle")
+    parser.add_argument("--runs", type=int, default=10, help="number of fresh processes to time")
+    parser.add_argument("--json", help="also write the report to this json file")
+    parser.add_argument("--onscreen", action="store_true", help="use the default Qt platform instead of offscreen")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    arguments = parser.parse_args()
+
+    if arguments.child:
+        print(json.dumps(measureOnce()))
+    else:
+        summary = report(arguments.runs, arguments.onscreen)
+        printReport(summary)
+        if arguments.json:
+            with open(arguments.json, 'w', encoding='utf-8') as reportFile:
+                json.dump(summary, reportFile, indent=1)
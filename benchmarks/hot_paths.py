@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+#
+# -----------------------------------------------------------------------------
+# Author: Gregoire Vandenschrick
+# Date:   17/10/2026
+# ࿄ ࿅ ࿇
+# -----------------------------------------------------------------------------
+'''
+Timings of the drawing and theory hot paths of scale_circle, compared to a
+JSON baseline.
+One MainWindow, with its neck window open, is driven offscreen (unless
+--onscreen is given) through tunings of 4 to 8 strings and arrangements of
+1 to 7 degrees. Each case is timed --repeat times, in rounds timing all the
+cases after a round to warm up; cases quicker than SAMPLE_DURATION are
+called several times per timing. The medians are compared, and only from
+MINIMUM_REPEAT timings on: fewer are printed but not compared. A case
+regresses when its median exceeds the one of the baseline by more than its
+threshold: the threshold of the baseline (a ratio, 0.25 by default), raised
+to NOISE_FACTOR times the noise of the case, the spread of its timings
+under their median in the run or in the baseline. Differences under
+MINIMUM_DIFFERENCE are taken as noise too.
+The baseline holds absolute timings of the machine that recorded it: record
+one (--save-baseline) on each machine before comparing, and only commit a
+re-recorded baseline with a change meant to move it.
+Setters only ask for a drawing, the timed set_arrangement and refresh
+include the render pass drawing what they asked for. set_arrangement is
+timed switching from another arrangement of the same number of degrees, or
+from one of 1 degree when there is no other. The paint cases time
+the painting of the view of the neck window, whole or around the notes
+(un)highlighted by a hover.
+
+    python benchmarks/hot_paths.py [--repeat 15] [--baseline benchmarks/baselines/hot_paths.json]
+                                   [--save-baseline] [--threshold 0.25] [--json results.json] [--onscreen]
+
+The exit status is 1 when a case regresses.
+'''
+
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(REPOSITORY, "benchmarks", "baselines", "hot_paths.json")
+
+# one tuning for each number of strings
+TUNINGS = ("Standard bass 4 \tEADG", "Standard bass 5 \tBEADG", "Standard 6 \tEADGBE", "Standard 7 \tBEADGBE", "Standard 8 \tF♯BEADGBE")
+ARRANGEMENTS_TUNING = "Standard 6 \tEADGBE"
+THRESHOLD = 0.25
+NOISE_FACTOR = 2.0 # the threshold of a case is at least this many times its noise
+MINIMUM_REPEAT = 10 # fewer timings are not compared
+MINIMUM_DIFFERENCE = 0.00005 # seconds
+SAMPLE_DURATION = 0.002 # seconds, quicker cases are called several times per sample
+
+# -----------------------------------------------------------------------------
+
+class HotPaths:
+    '''
+    The application, shown with its neck window, and the cases to time on it
+    '''
+    def __init__(self):
+        sys.path.insert(0, REPOSITORY)
+        from PySide6.QtWidgets import QApplication
+        from PySide6.QtCore import QCoreApplication
+        import scale_circle
+        from catalogs import degreeArrangements
+
+        self.processEvents = QCoreApplication.processEvents
+        self.application = QApplication.instance() or QApplication(sys.argv[:1])
+        self.window = scale_circle.MainWindow(scale_factor=1.0)
+        self.window.show()
+        self.window.full_neck_radioButton.setChecked(True)
+        self.neckWindow = self.window.neckGeneralView
+        self.processEvents()
+        # first arrangement of each number of degrees, and the arrangement a
+        # switch to it is timed from: the next one of the same number of
+        # degrees, or else the first one of 1 degree
+        self.arrangements = dict()
+        for arrIndex, arrangement in enumerate(degreeArrangements):
+            self.arrangements.setdefault(len(arrangement), arrIndex)
+        self.previousArrangements = dict()
+        for numberOfDegrees, arrIndex in self.arrangements.items():
+            others = [index for index, arrangement in enumerate(degreeArrangements)
+                      if len(arrangement) == numberOfDegrees and index != arrIndex]
+            self.previousArrangements[arrIndex] = others[0] if others else self.arrangements[1]
+
+    def set_state(self, tuningName, arrIndex):
+        self.window.arrangement_combobox.setCurrentIndex(arrIndex)
+        self.window.tunings_combobox.setCurrentText(tuningName)
+        self.processEvents()
+
+    def rendered(self, function, *args):
+        '''
+        Calls function and the render pass drawing what it asked for
+        '''
+        function(*args)
+        self.window.render_scheduler.flush()
+
+    def arrangement_switch(self, arrIndex):
+        '''
+        Function switching the main window to the arrangement arrIndex, once
+        the arrangement it is timed from is shown. A switch lasting more than
+        SAMPLE_DURATION, it is called once per timing
+        '''
+        previousIndex = self.previousArrangements[arrIndex]
+        self.rendered(self.window.set_arrangement, self.window.arrangement_combobox.itemText(previousIndex), previousIndex)
+        self.processEvents()
+        arrangement = self.window.arrangement_combobox.itemText(arrIndex)
+        return lambda: self.rendered(self.window.set_arrangement, arrangement, arrIndex)
+
+    def chord_search(self):
+        '''
+        Complete search of the voicings of the chord with the most notes of the
+        first frame, on all its strings
+        '''
+        frame = self.window.degreesFrames[0]
+        chord = max(frame.availableChords, key=len)
+        frame.lowStringLimit, frame.highStringLimit = 1, frame.num_strings
+        def search():
+            notes_positions = frame.get_positions_of_chord_notes(chord)
+            return list(frame.get_positions_combinations_for_chord(chord, notes_positions))
+        return search
+
+    def neck_repaint(self, hovered=False):
+        '''
+        Function painting the neck window: all of its view, or only the
+        notes of a pitch class highlighted then unhighlighted, as when a note
+        is hovered then left
+        '''
+        viewport = self.neckWindow.neck_graphics_view.viewport()
+        if not hovered:
+            return viewport.repaint
+        note = max(self.neckWindow.identifiedNotes.values(), key=len)[0][0]
+        def hover():
+            note.colourNotes()
+            self.processEvents()
+            note.uncolourNotesConditionally()
+            self.processEvents()
+        return hover
+
+    def groups(self):
+        '''
+        List of (setup, cases), setup putting the application in the state its
+        cases are timed in, a case being (name, case, function returning the
+        function to time once the setup is done)
+        '''
+        from catalogs import tunings
+        groups = list()
+        for tuningName in TUNINGS:
+            case = "%s strings" % len(tunings[tuningName])
+            groups.append((lambda tuningName=tuningName: self.set_state(tuningName, self.arrangements[1]), (
+                ("NeckWindow.draw_notes_on_neck", case, lambda: self.neckWindow.draw_notes_on_neck),
+                ("NeckWindow.label_degrees_on_neck", case, lambda: self.neckWindow.label_degrees_on_neck),
+                ("CircleAndNeckVBoxFrame.draw_scale", case, lambda: self.window.degreesFrames[0].draw_scale),
+                ("CircleAndNeckVBoxFrame.get_positions_combinations_for_chord", case, self.chord_search))))
+        for numberOfDegrees, arrIndex in sorted(self.arrangements.items()):
+            case = "%s degrees" % numberOfDegrees
+            groups.append((lambda arrIndex=arrIndex: self.set_state(ARRANGEMENTS_TUNING, arrIndex), (
+                ("MainWindow.set_arrangement", case, lambda arrIndex=arrIndex: self.arrangement_switch(arrIndex)),
+                ("MainWindow.refresh", case, lambda: lambda: self.rendered(self.window.refresh)))))
+        groups.append((lambda: self.set_state(ARRANGEMENTS_TUNING, self.arrangements[1]), (
+            ("NeckWindow paint", "whole view", lambda: self.neck_repaint()),
+            ("NeckWindow paint", "hovered note", lambda: self.neck_repaint(hovered=True)))))
+        return groups
+
+    def run(self, repeat):
+        '''
+        Times all the cases once per round, so that a slow period of the
+        machine only spoils one timing of the cases it overlaps. The first
+        round warms up and tells how many calls make a measurable timing
+        '''
+        timings = dict()
+        numbers = dict()
+        groups = self.groups()
+        for round in range(repeat + 1):
+            for setup, cases in groups:
+                setup()
+                for name, case, timedFunction in cases:
+                    key = "%s / %s" % (name, case)
+                    function = timedFunction()
+                    start = time.perf_counter()
+                    if round == 0:
+                        function()
+                        numbers[key] = max(1, min(1000, math.ceil(SAMPLE_DURATION/(time.perf_counter() - start))))
+                        timings[key] = list()
+                    else:
+                        for call in range(numbers[key]):
+                            function()
+                        timings[key].append((time.perf_counter() - start)/numbers[key])
+                    # deferred deletions and redraws are not part of the call
+                    self.processEvents()
+        return {key: {"median": statistics.median(values), "min": min(values), "max": max(values), "calls": numbers[key]}
+                for key, values in timings.items()}
+
+# -----------------------------------------------------------------------------
+
+def environment(onscreen, repeat):
+    import PySide6
+    return {"python": platform.python_version(),
+            "pyside6": PySide6.__version__,
+            "platform": platform.platform(),
+            "qt_platform": "default" if onscreen else "offscreen",
+            "repeat": repeat}
+
+def noise(result):
+    '''
+    Spread of the timings of a case under their median, as a ratio of the median
+    '''
+    return (result["median"] - result["min"])/result["median"] if result["median"] else 0.0
+
+def compare(results, baseline, threshold=None):
+    '''
+    List of (key, median, baseline median, change ratio, threshold, status),
+    status being 'ok', 'faster', 'REGRESSION' or 'new'
+    '''
+    comparison = list()
+    for key, result in results.items():
+        reference = baseline["results"].get(key)
+        if reference is None:
+            comparison.append((key, result["median"], None, None, None, "new"))
+            continue
+        caseThreshold = threshold if threshold is not None else reference.get("threshold", baseline.get("threshold", THRESHOLD))
+        caseThreshold = max(caseThreshold, NOISE_FACTOR*max(noise(result), noise(reference)))
+        change = result["median"]/reference["median"] - 1 if reference["median"] else 0.0
+        difference = result["median"] - reference["median"]
+        if change > caseThreshold and difference > MINIMUM_DIFFERENCE:
+            status = "REGRESSION"
+        elif change < -caseThreshold and -difference > MINIMUM_DIFFERENCE:
+            status = "faster"
+        else:
+            status = "ok"
+        comparison.append((key, result["median"], reference["median"], change, caseThreshold, status))
+    return comparison
+
+def printResults(results, comparison=None):
+    print("%-75s %10s %10s %8s %8s  %s" % ("hot path / case", "median ms", "base ms", "change", "limit", "status"))
+    rows = comparison or [(key, result["median"], None, None, None, "") for key, result in results.items()]
+    for (key, median, reference, change, caseThreshold, status) in rows:
+        print("%-75s %10.2f %10s %8s %8s  %s" % (key, 1000*median,
+                                                  "%.2f" % (1000*reference) if reference is not None else "-",
+                                                  "%+.0f%%" % (100*change) if change is not None else "-",
+                                                  "%+.0f%%" % (100*caseThreshold) if caseThreshold is not None else "-",
+                                                  status))
+
+# -----------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Timings of the drawing and theory hot paths, compared to a baseline")
+    parser.add_argument("--repeat", type=int, default=15, help="number of timed calls of each case")
+    parser.add_argument("--baseline", default=BASELINE, help="json baseline to compare to or save")
+    parser.add_argument("--save-baseline", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--threshold", type=float, help="regression ratio, instead of the ones of the baseline")
+    parser.add_argument("--json", help="also write the results to this json file")
+    parser.add_argument("--onscreen", action="store_true", help="use the default Qt platform instead of offscreen")
+    arguments = parser.parse_args()
+    if arguments.save_baseline and arguments.repeat < MINIMUM_REPEAT:
+        parser.error("a baseline needs --repeat %s or more" % MINIMUM_REPEAT)
+
+    if not arguments.onscreen:
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    results = HotPaths().run(arguments.repeat)
+    report = {"environment": environment(arguments.onscreen, arguments.repeat), "results": results}
+    if arguments.json:
+        with open(arguments.json, 'w', encoding='utf-8') as resultsFile:
+            json.dump(report, resultsFile, indent=1, ensure_ascii=False)
+
+    if arguments.save_baseline:
+        report["threshold"] = arguments.threshold if arguments.threshold is not None else THRESHOLD
+        os.makedirs(os.path.dirname(arguments.baseline), exist_ok=True)
+        with open(arguments.baseline, 'w', encoding='utf-8') as baselineFile:
+            json.dump(report, baselineFile, indent=1, ensure_ascii=False)
+        printResults(results)
+        print("Baseline written to %s" % arguments.baseline)
+    elif arguments.repeat < MINIMUM_REPEAT:
+        printResults(results)
+        print("Not compared to the baseline, which needs --repeat %s or more" % MINIMUM_REPEAT)
+    elif os.path.exists(arguments.baseline):
+        with open(arguments.baseline, encoding='utf-8') as baselineFile:
+            baseline = json.load(baselineFile)
+        comparison = compare(results, baseline, arguments.threshold)
+        printResults(results, comparison)
+        regressions = [row for row in comparison if row[-1] == "REGRESSION"]
+        print("%s regression(s) against %s" % (len(regressions), arguments.baseline))
+        sys.exit(1 if regressions else 0)
+    else:
+        printResults(results)
+        print("No baseline at %s, use --save-baseline to create it" % arguments.baseline)
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+#
+# -----------------------------------------------------------------------------
+# Author: Gregoire Vandenschrick
+# Date:   17/10/2026
+# ࿄ ࿅ ࿇
+# -----------------------------------------------------------------------------
+'''
+Qt-free search of the ways to play a chord on the neck (voicings).
+A voicing uses every string that holds at least one note of the chord, once,
+and must contain all the notes of the chord. Voicings are ranked by their
+distance: the sum of the absolute fret differences from one string to the next.
+'''
+
+import heapq
+
+# -----------------------------------------------------------------------------
+
+def positionsByString(chord, notesPositions):
+    '''
+    Regroups the positions of the chord notes by string.
+    notesPositions is {note: [(string, fret, noteMarker, noteLabel), ...]}
+    Returns the sorted list of strings and, for each of them, the list of
+    (string, note, fret, noteMarker, noteLabel) candidates
+    '''
+    candidatesByString = {}
+    for note in chord:
+        for (string, fret, noteMarker, noteLabel) in notesPositions[note]:
+            candidatesByString.setdefault(string, []).append((string, note, fret, noteMarker, noteLabel))
+    strings = sorted(candidatesByString.keys())
+    return strings, [candidatesByString[string] for string in strings]
+
+def reachableNotes(chord, candidates):
+    '''
+    For each string index k, bits of the chord notes that can still be found
+    on strings k and higher; used to drop partial voicings early
+    '''
+    noteBits = {note: 1 << i for i, note in enumerate(chord)}
+    reachable = [0] * (len(candidates) + 1)
+    for k in reversed(range(len(candidates))):
+        bits = 0
+        for position in candidates[k]:
+            bits |= noteBits[position[1]]
+        reachable[k] = reachable[k+1] | bits
+    return noteBits, reachable
+
+def rankedVoicings(chord, notesPositions, limit=None):
+    '''
+    Branch and bound search of the voicings of chord.
+    Partial voicings are abandoned as soon as the remaining strings cannot
+    bring the missing notes, or once limit voicings are known and their
+    distance cannot be beaten anymore.
+    Returns up to limit (all if None) (distance, voicing) tuples sorted by
+    distance, voicing being a tuple of (string, note, fret, noteMarker, noteLabel)
+    Voicings of equal distance keep the order of itertools.product.
+    '''
+    strings, candidates = positionsByString(chord, notesPositions)
+    noteBits, reachable = reachableNotes(chord, candidates)
+    allNotes = (1 << len(chord)) - 1
+    numberOfStrings = len(strings)
+
+    # max-heap on (distance, order of discovery) of the best voicings found
+    best = []
+    voicing = [None] * numberOfStrings
+    found = 0
+
+    def search(k, covered, distance):
+        nonlocal found
+        if k == numberOfStrings:
+            # only reached incomplete when there is no string at all
+            if covered != allNotes:
+                return
+            entry = (-distance, -found, tuple(voicing))
+            found += 1
+            if limit is None or len(best) < limit:
+                heapq.heappush(best, entry)
+            else:
+                heapq.heappushpop(best, entry)
+            return
+        for position in candidates[k]:
+            newCovered = covered | noteBits[position[1]]
+            # notes missing that no higher string can bring
+            if newCovered | reachable[k+1] != allNotes:
+                continue
+            newDistance = distance
+            if k > 0:
+                newDistance += abs(position[2] - voicing[k-1][2])
+            # distances only grow with strings, so ties or worse are useless
+            if limit is not None and len(best) == limit and newDistance >= -best[0][0]:
+                continue
+            voicing[k] = position
+            search(k+1, newCovered, newDistance)
+
+    if limit is None or limit > 0:
+        search(0, 0, 0)
+    return [(-negativeDistance, chordPosition) for (negativeDistance, negativeOrder, chordPosition) in sorted(best, reverse=True)]
+
+def iterVoicings(chord, notesPositions):
+    '''
+    Best-first generator of the voicings of chord, yielding the same
+    (distance, voicing) tuples as rankedVoicings, in the same order, but
+    only computing the next one when it is asked for.
+    Partial voicings wait in a priority queue keyed by their distance and
+    the indexes of their positions, both of which can only grow when a
+    string is added, so the first complete voicing popped is the best left.
+    '''
+    strings, candidates = positionsByString(chord, notesPositions)
+    noteBits, reachable = reachableNotes(chord, candidates)
+    allNotes = (1 << len(chord)) - 1
+    numberOfStrings = len(strings)
+
+    if reachable[0] != allNotes:
+        return
+    # (distance, indexes of the chosen positions, notes covered, voicing)
+    queue = [(0, (), 0, ())]
+    while queue:
+        distance, indexes, covered, voicing = heapq.heappop(queue)
+        k = len(indexes)
+        if k == numberOfStrings:
+            yield (distance, voicing)
+            continue
+        for index, position in enumerate(candidates[k]):
+            newCovered = covered | noteBits[position[1]]
+            if newCovered | reachable[k+1] != allNotes:
+                continue
+            newDistance = distance
+            if k > 0:
+                newDistance += abs(position[2] - voicing[-1][2])
+            heapq.heappush(queue, (newDistance, indexes + (index,), newCovered, voicing + (position,)))
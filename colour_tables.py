@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+#
+# -----------------------------------------------------------------------------
+# Author: Gregoire Vandenschrick
+# Date:   17/10/2026
+# ࿄ ࿅ ࿇
+# -----------------------------------------------------------------------------
+'''
+Colours of the degrees, prebuilt once per palette of Inlays.customColours.
+Notes only ever sit on semitones (30° steps on the circle), so each palette is
+turned into a table of 12 colours indexed by semitone (rotation included).
+The QColor and QBrush tables are in qt_drawing, only imported (with Qt) when
+first asked for.
+'''
+
+from functools import lru_cache
+import math
+
+from pitch_class_sets import NUMBER_OF_PITCH_CLASSES
+from qt_exports import lazyQtExports
+
+SEMITONE_ANGLE = 360 // NUMBER_OF_PITCH_CLASSES
+
+# Palette of Inlays.customColours used by default
+DEGREE_COLOUR = 'Destorm'
+
+# QColor and QBrush tables, in qt_drawing
+QT_NAMES = ('colourTable', 'brushTable')
+
+__getattr__ = lazyQtExports(__name__, 'qt_drawing', QT_NAMES)
+
+# -----------------------------------------------------------------------------
+
+def hexToRgb(hexColour):
+    hexColour = hexColour.lstrip('#')
+    return tuple(int(hexColour[i:i+2], 16) for i in (0, 2, 4))
+
+def interpolateColours(colour1, colour2, ratio):
+    '''
+    Hex colour situated at ratio (0 to 1) between two hex colours
+    '''
+    rgbColour1 = hexToRgb(colour1)
+    rgbColour2 = hexToRgb(colour2)
+    interpolatedRgb = tuple(int(component1 + (component2 - component1) * ratio) for component1, component2 in zip(rgbColour1, rgbColour2))
+    return '#' + ''.join(format(component, '02x') for component in interpolatedRgb)
+
+def colourForAngle(angle, colours):
+    '''
+    Hex colour of an angle in degrees on the circle of colours.
+    First and last colours of the palette are the same, it's a circle of colours
+    '''
+    angle %= 360
+    numberOfColours = len(colours)-1
+    angleBetweenColours = 360.0/numberOfColours
+    index1 = int(angle // angleBetweenColours)
+    index2 = int((index1 + 1)%numberOfColours)
+    ratio = (angle - (index1 * angleBetweenColours)) / angleBetweenColours
+    return interpolateColours(colours[index1], colours[index2], ratio)
+
+@lru_cache(maxsize=None)
+def hexTable(colours):
+    '''
+    Tuple of the 12 hex colours of the semitones for a palette (tuple of hex colours)
+    '''
+    return tuple(colourForAngle(semitone*SEMITONE_ANGLE, colours) for semitone in range(NUMBER_OF_PITCH_CLASSES))
+
+def semitoneForAngle(angle):
+    '''
+    Semitone (0 to 11) of an angle in radians on the circle
+    '''
+    return round(angle*NUMBER_OF_PITCH_CLASSES/(2*math.pi)) % NUMBER_OF_PITCH_CLASSES
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+#
+# -----------------------------------------------------------------------------
+# Author: Gregoire Vandenschrick
+# Date:   17/10/2026
+# ࿄ ࿅ ࿇
+# -----------------------------------------------------------------------------
+'''
+Qt-free, NumPy backed description of the neck: which semitone sits on each
+string and fret, computed once per tuning, where the frets are drawn,
+computed once per neck size, and how the fanned frets displace them; all
+kept in LRU caches.
+The sizes of the drawings are shared by the Qt views and the SVG renderer.
+'''
+
+from functools import lru_cache
+import numpy as np
+
+from catalogs import tunings, notes
+from pitch_class_sets import NUMBER_OF_PITCH_CLASSES
+
+# -----------------------------------------------------------------------------
+
+# Sizes of the drawings, in pixels for a scale factor of 1
+SCALE_CIRCLE_RADIUS = 160
+FRET_SPACING = 50
+FRET_OVERSHOOT = 4
+STRING_SPACING = 30
+
+NECK_WIDENING = 5
+
+FONT = 'Garamond Premier Pro'
+
+# -----------------------------------------------------------------------------
+
+def lowStringNoteValue(tuningName):
+    '''
+    Semitone (0 to 11, C being 0) of the lowest string of a tuning, read from
+    the notes following the tab in its name
+    '''
+    tuningNotesComposition = tuningName.split('\t')[1].split()
+    notesByIndex = {value: key for key, value in notes.items()}
+    firstTuningNote = ''
+    if len(tuningNotesComposition)>0:
+        if tuningNotesComposition[0][1] == '♯':
+            firstTuningNote = notesByIndex[notes[tuningNotesComposition[0][0]]+1]
+        elif tuningNotesComposition[0][1] == '♭':
+            firstTuningNote = notesByIndex[notes[tuningNotesComposition[0][0]]-1]
+        else:
+            firstTuningNote = tuningNotesComposition[0][0]
+    return notes[firstTuningNote]
+
+def firstRootPosition(tuningName, rootNoteValue):
+    '''
+    Fret, counted from -1 for the open strings, of the first root on the lowest string
+    '''
+    return (rootNoteValue - lowStringNoteValue(tuningName))-1
+
+# -----------------------------------------------------------------------------
+
+class PitchMatrix:
+    '''
+    strings x frets matrices of the neck, strings from low to high as rows,
+    frets from firstFret to numFrets-1 as columns.
+    semitones are counted from the root (rootOffset is subtracted), pitchClasses
+    are the same semitones folded on one octave.
+    Arrays are read only as they are shared through the cache.
+    '''
+    def __init__(self, tuning, numFrets, rootOffset, firstFret):
+        self.tuning = tuning
+        self.numFrets = numFrets
+        self.rootOffset = rootOffset
+        self.firstFret = firstFret
+        self.frets = np.arange(firstFret, numFrets)
+        self.semitones = np.asarray(tuning)[:, np.newaxis] + self.frets[np.newaxis, :] - rootOffset
+        self.pitchClasses = self.semitones % NUMBER_OF_PITCH_CLASSES
+        for array in (self.frets, self.semitones, self.pitchClasses):
+            array.setflags(write=False)
+
+    def playableCells(self, mask):
+        '''
+        Boolean strings x frets array of the cells whose pitch class is in mask
+        '''
+        return maskBits(mask)[self.pitchClasses]
+
+    def playableArrays(self, mask):
+        '''
+        Arrays of the strings, frets and semitones of the playable cells,
+        ordered from low to high strings then from low to high frets
+        '''
+        strings, fretIndexes = np.nonzero(self.playableCells(mask))
+        return strings, fretIndexes + self.firstFret, self.semitones[strings, fretIndexes]
+
+    def playablePositions(self, mask):
+        '''
+        List of (string, fret, semitone) of the playable cells, in the order
+        of playableArrays
+        '''
+        strings, frets, semitones = self.playableArrays(mask)
+        return list(zip(strings.tolist(), frets.tolist(), semitones.tolist()))
+
+@lru_cache(maxsize=256)
+def maskBits(mask):
+    '''
+    Boolean array of length 12 telling which pitch classes are part of mask
+    '''
+    bits = np.array([(mask >> semitone) & 1 for semitone in range(NUMBER_OF_PITCH_CLASSES)], dtype=bool)
+    bits.setflags(write=False)
+    return bits
+
+@lru_cache(maxsize=64)
+def pitchMatrix(tuning, numFrets, rootOffset=0, firstFret=-1):
+    '''
+    Cached PitchMatrix for a tuning given as a tuple of semitones
+    '''
+    return PitchMatrix(tuple(tuning), numFrets, rootOffset, firstFret)
+
+def pitchMatrixForTuningName(tuningName, numFrets, rootOffset=0, firstFret=-1):
+    '''
+    Cached PitchMatrix for a tuning of catalogs.tunings
+    '''
+    return pitchMatrix(tunings[tuningName], numFrets, rootOffset, firstFret)
+
+# -----------------------------------------------------------------------------
+
+class FretGeometry:
+    '''
+    x coordinates of the frets of a drawn neck, for frets -1 (the notes
+    generated by the open strings are drawn before fret 0) to numFrets.
+    With regular spacing all frets are fretSpacing apart, otherwise they
+    follow the equal temperament over a scale length of 4/3 of the neck.
+    positions are the x of the frets, spacings the distances to the next
+    fret and midpoints the middle of these; as read only arrays indexed by
+    fret+1, or through the position, spacing and midpoint methods.
+    '''
+    def __init__(self, numFrets, fretSpacing, scaleFactor, regular):
+        self.numFrets = numFrets
+        self.regular = regular
+        frets = np.arange(-1, numFrets + 2)
+        if regular:
+            positions = frets * fretSpacing * scaleFactor
+        else:
+            neckLength = fretSpacing * (numFrets + 1) * scaleFactor
+            positions = 4/3*neckLength - (4/3*neckLength / (2**(frets/12)))
+        self.positions = positions[:-1]
+        self.spacings = np.diff(positions)
+        self.midpoints = self.positions + self.spacings / 2.0
+        for array in (self.positions, self.spacings, self.midpoints):
+            array.setflags(write=False)
+        # plain lists are quicker to index one fret at a time
+        self._positions = self.positions.tolist()
+        self._spacings = self.spacings.tolist()
+        self._midpoints = self.midpoints.tolist()
+
+    def position(self, fret):
+        return self._positions[fret + 1]
+
+    def spacing(self, fret):
+        return self._spacings[fret + 1]
+
+    def midpoint(self, fret):
+        return self._midpoints[fret + 1]
+
+@lru_cache(maxsize=32)
+def fretGeometry(numFrets, fretSpacing, scaleFactor, regular):
+    '''
+    Cached FretGeometry of a neck
+    '''
+    return FretGeometry(numFrets, fretSpacing, scaleFactor, regular)
+
+# -----------------------------------------------------------------------------
+
+class FanProjection:
+    '''
+    Whole array version of NeckWindow.transFan: displaces x coordinates
+    according to their y for the fanned frets whose apex is situated at base
+    length from the nut and height from the middle line of the neck.
+    '''
+    def __init__(self, fanBase, fanHeight, numStrings, scaleFactor, stringSpacing):
+        self.halfNeckHeight = ((stringSpacing * (numStrings - 1))/2)*scaleFactor
+        self.base = fanBase*scaleFactor
+        self.height = fanHeight*scaleFactor
+
+    def project(self, x, y):
+        '''
+        Projected x for arrays (or scalars) x and y, broadcast together
+        '''
+        x = np.asarray(x, dtype=float)
+        return x - (self.base-x)*(np.asarray(y, dtype=float)-self.halfNeckHeight)/self.height
+
+@lru_cache(maxsize=32)
+def fanProjection(fanBase, fanHeight, numStrings, scaleFactor, stringSpacing):
+    '''
+    Cached FanProjection of a neck
+    '''
+    return FanProjection(fanBase, fanHeight, numStrings, scaleFactor, stringSpacing)
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+#
+# -----------------------------------------------------------------------------
+# Author: Gregoire Vandenschrick
+# Date:   17/10/2026
+# ࿄ ࿅ ࿇
+# -----------------------------------------------------------------------------
+'''
+Qt-free answers to the questions the views answer by drawing: where the notes
+of a mode are on the whole neck (NeckWindow), which chords a degree of a mode
+holds and where their notes and voicings are on the neck of a degree frame
+(CircleAndNeckVBoxFrame).
+'''
+
+from catalogs import notes, scales, tunings, chords, semitonesToConsiderByNumberOfStrings
+from pitch_class_sets import scaleToMask, rotateMask, maskToScale, degreeIndex
+from pitch_class_index import linkModesToScales, chordsInMask, enrichedChordsInMask
+from fretboard import pitchMatrix, firstRootPosition
+from chord_voicings import rankedVoicings
+
+NOTES_BY_INDEX = {value: key for key, value in notes.items()}
+MODES_BY_SCALE = linkModesToScales()
+
+# -----------------------------------------------------------------------------
+
+def findTuning(name):
+    '''
+    Catalog name of a tuning given by its full name or by the part before
+    the tab (e.g. "Standard 7"), case and spaces ignored; None if unknown
+    '''
+    if name in tunings:
+        return name
+    wanted = " ".join(name.split()).lower()
+    for tuningName in tunings.keys():
+        if " ".join(tuningName.split('\t')[0].split()).lower() == wanted:
+            return tuningName
+    return None
+
+def findMode(scaleName, mode):
+    '''
+    Index (0 based) of a mode of scaleName given by its number (from 1) or
+    by (the beginning of) its name, case ignored; None if unknown
+    '''
+    modeNames = MODES_BY_SCALE[scaleName]
+    if str(mode).isdigit():
+        modeIndex = int(mode) - 1
+        return modeIndex if 0 <= modeIndex < len(modeNames) else None
+    for modeIndex, modeName in enumerate(modeNames):
+        if modeName.lower().startswith(str(mode).lower()):
+            return modeIndex
+    return None
+
+def degreeMask(scaleName, modeIndex=0, degree=1):
+    '''
+    Mask shown by the degree frame of degree (from 1) of the mode modeIndex
+    (0 based) of scaleName, seen from the note of that degree
+    '''
+    scale = scales[scaleName]
+    return rotateMask(scaleToMask(scale), (degree - 1 + modeIndex)%len(scale))
+
+def degreeNote(rootNote, scaleName, modeIndex=0, degree=1):
+    '''
+    Name of the note of degree (from 1) of the mode of scaleName built on
+    rootNote (see CircleAndNeckVBoxFrame.get_note_for_current_degree)
+    '''
+    modeScale = maskToScale(rotateMask(scaleToMask(scales[scaleName]), modeIndex))
+    return NOTES_BY_INDEX[(notes[rootNote] + modeScale[(degree - 1)%len(modeScale)]) % 12]
+
+# -----------------------------------------------------------------------------
+
+def neckPositions(tuningName, rootNote, scaleName, modeIndex=0, numFrets=24):
+    '''
+    Positions of the notes of the mode on the whole neck, as in NeckWindow:
+    list of (string, fret, semitone from the root, degree index) with strings
+    from the lowest (0) and frets from the open string (0)
+    '''
+    modeMask = rotateMask(scaleToMask(scales[scaleName]), modeIndex)
+    scaleLength = len(scales[scaleName])
+    pitches = pitchMatrix(tunings[tuningName], numFrets, firstRootPosition(tuningName, notes[rootNote]))
+    return [(string, fret + 1, semitone, degreeIndex(modeMask, semitone)%scaleLength)
+            for (string, fret, semitone) in pitches.playablePositions(modeMask)]
+
+def maximumSemitoneDifference(tuning):
+    '''
+    Largest interval between neighbouring strings, the highest one left
+    aside; the neck of a degree frame shows that many frets plus one
+    '''
+    maximumDifference = 0
+    for i in range(len(tuning)-2):
+        maximumDifference = max(maximumDifference, tuning[i+1]-tuning[i])
+    return maximumDifference
+
+def framePositions(tuning, mask):
+    '''
+    Positions of the notes of mask on the neck of a degree frame, as
+    (string, fret, semitone), the semitones being counted from the note of the degree
+    '''
+    numFrets = maximumSemitoneDifference(tuning) + 1
+    return pitchMatrix(tuning, numFrets, 2, firstFret=1).playablePositions(mask)
+
+def isChordPosition(string, fret, semitone, lowStringLimit, highStringLimit, numberOfStrings):
+    '''
+    True if a note of the neck of a degree frame may be part of a chord
+    played on strings lowStringLimit to highStringLimit (from 1)
+    '''
+    authorizedString = (lowStringLimit-1 <= string <= highStringLimit-1)
+    authorizedFret = (fret < 6)
+    authorizedSemitoneByNumberOfStrings = (0 <= semitone <= semitonesToConsiderByNumberOfStrings[numberOfStrings])
+    return authorizedString and authorizedFret and authorizedSemitoneByNumberOfStrings
+
+def chordsOfDegree(mask, highStringLimit=4):
+    '''
+    (notation, chord) of the chords playable on a degree, the enriched ones
+    only when chords use more than 4 strings, as in the chords combobox
+    '''
+    availableChords = [(chords[chord]["notation"], chord) for chord in chordsInMask(mask)]
+    if highStringLimit > 4:
+        availableChords.extend(enrichedChordsInMask(mask))
+    return availableChords
+
+def neckFretShift(tuningName, noteValue, frets):
+    '''
+    Frets to add to frets of the neck of a degree frame on the note noteValue
+    (0 to 11) to play the same notes on the neck of tuningName: the lowest
+    shift keeping all of them on the neck
+    '''
+    shift = (firstRootPosition(tuningName, noteValue) - 1)%12
+    if min(frets) + shift >= 12:
+        shift -= 12
+    return shift
+
+def chordVoicings(tuning, mask, chord, lowStringLimit=1, highStringLimit=4, limit=None):
+    '''
+    Voicings of chord on the neck of a degree frame, from the shortest on,
+    as (distance, ((string, note, fret, semitone, None), ...))
+    '''
+    positions = framePositions(tuning, mask)
+    notesPositions = {}
+    for note in chord:
+        notesPositions[note] = [(string, fret, semitone, None) for (string, fret, semitone) in positions
+                                if semitone%12 == note%12 and isChordPosition(string, fret, semitone, lowStringLimit, highStringLimit, len(tuning))]
+    return rankedVoicings(chord, notesPositions, limit)
@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+#
+# -----------------------------------------------------------------------------
+# Author: Gregoire Vandenschrick
+# Date:   17/10/2026
+# ࿄ ࿅ ࿇
+# -----------------------------------------------------------------------------
+'''
+Qt side of scale_circle_library: graphic items of the notes and drawing
+layers, hover highlighter, colouring store and render scheduler. Kept apart
+from scale_circle_library, which gives access to them, so that Qt is only
+imported when they are first needed.
+'''
+
+from time import perf_counter
+import json
+
+from PySide6.QtWidgets import QGraphicsPolygonItem, QGraphicsEllipseItem, QGraphicsItemGroup, QGraphicsItem
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QPen, QBrush, QColor
+
+from scale_circle_library import GenericNoteItem, HOVER_LATENCY_BUDGET
+from redraw_trace import traced
+
+# -----------------------------------------------------------------------------
+
+class GraphicNoteItem(GenericNoteItem):
+    '''
+    GenericNoteItem of a Qt shape item, reset with its position, pen and brush
+    '''
+    def resetNote(self):
+        GenericNoteItem.resetNote(self)
+        self.setPos(0, 0)
+        self.setPen(QPen())
+        self.setBrush(QBrush())
+
+class PolgonNoteItem(GraphicNoteItem, QGraphicsPolygonItem):
+    def __init__(self,  parenta=None, noteOnNeck=False, embeddingWidget=None):
+        GenericNoteItem.__init__(self, noteOnNeck=noteOnNeck, embeddingWidget=embeddingWidget)
+        QGraphicsPolygonItem.__init__(self, parenta)
+        self.setAcceptHoverEvents(True)
+
+    def setShape(self, polygon):
+        self.setPolygon(polygon)
+
+class RounNoteItem(GraphicNoteItem, QGraphicsEllipseItem):
+    def __init__(self,  parenta=None, noteOnNeck=False, embeddingWidget=None):
+        GenericNoteItem.__init__(self, noteOnNeck=noteOnNeck, embeddingWidget=embeddingWidget)
+        QGraphicsEllipseItem.__init__(self, parenta)
+        self.setAcceptHoverEvents(True)
+
+    def setShape(self, rect):
+        self.setRect(rect)
+
+fretZeroNoteItem = PolgonNoteItem
+NoteItem = RounNoteItem
+TriangleNoteItem = PolgonNoteItem
+
+class LayerGroup(QGraphicsItemGroup):
+    '''
+    Item group used as a drawing layer. It keeps record of the items it owns,
+    so that the whole layer can be taken out of its scene and emptied without
+    going through all the items of the scene.
+    The items of a static layer can be given a cacheMode (e.g.
+    DeviceCoordinateCache), so that they are painted once in a pixmap which
+    the next paints only copy
+    '''
+    def __init__(self, parent=None, cacheMode=None):
+        super().__init__(parent)
+        self.ownedItems = list()
+        self.itemsCacheMode = cacheMode
+
+    def addToGroup(self, item):
+        super().addToGroup(item)
+        if self.itemsCacheMode is not None:
+            item.setCacheMode(self.itemsCacheMode)
+        self.ownedItems.append(item)
+
+    def addToScene(self, scene):
+        '''
+        Adds the layer to the scene if not already there
+        '''
+        if self.scene() is not scene:
+            scene.addItem(self)
+
+    def clear(self):
+        '''
+        Removes the layer, and all its items with it, from its scene in one
+        operation, then lets go of the items. Returns the items it owned
+        '''
+        scene = self.scene()
+        if scene is not None:
+            scene.removeItem(self)
+        items = [item for item in self.ownedItems if item.parentItem() is self]
+        self.ownedItems = list()
+        # removeFromGroup recomputes the bounds of the group from all the
+        # remaining children, so it is only used for the last one
+        for item in items[:-1]:
+            item.setParentItem(None)
+        if items:
+            self.removeFromGroup(items[-1])
+        return items
+
+class PictureItem(QGraphicsItem):
+    '''
+    Item replaying a QPicture, which may be shared by items of several scenes
+    (one item can only be in one scene), within the bounds given with it
+    '''
+    def __init__(self, picture, bounds, parent=None):
+        super().__init__(parent)
+        self.picture = picture
+        self.bounds = bounds
+
+    def boundingRect(self):
+        return self.bounds
+
+    def paint(self, painter, option, widget=None):
+        painter.drawPicture(0, 0, self.picture)
+
+# -----------------------------------------------------------------------------
+
+class NoteHighlighter:
+    '''
+    Colours and uncolours at once all the notes of a widget sharing the pitch
+    class of a hovered note.
+    The highlight brush of each pitch class is computed once per drawing of
+    the circle the colours come from (the first degree frame for the neck
+    window, the frame itself otherwise), then the notes of the pitch class are
+    all updated in one pass with that shared brush.
+    The time taken by each hover event is measured against a latency budget
+    '''
+    def __init__(self, embeddingWidget, budget=HOVER_LATENCY_BUDGET):
+        self.embeddingWidget = embeddingWidget
+        self.budget = budget
+        self.brushes = dict()
+        self.notesOnCircle = None
+        self.colourCorrection = None
+        self.count = 0
+        self.totalTime = 0.0
+        self.maximumTime = 0.0
+        self.overBudget = 0
+
+    def referenceColours(self):
+        '''
+        Notes on circle giving the colours, and the semitone correction to
+        apply to go from the widget notes to these
+        '''
+        if hasattr(self.embeddingWidget, "mainWindowInstance"):
+            referenceVFrame = self.embeddingWidget.mainWindowInstance.degreesFrames[0]
+            colourCorrection = self.embeddingWidget.scale[referenceVFrame.degreeIndex]-self.embeddingWidget.scale[self.embeddingWidget.modeIndex]
+            return referenceVFrame.notesOnCircle, colourCorrection
+        return self.embeddingWidget.notesOnCircle, 0
+
+    def highlightBrushes(self):
+        '''
+        Brush of each pitch class, None when the circle does not show it;
+        rebuilt only when the circle has been redrawn (new notesOnCircle)
+        or the correction has changed
+        '''
+        notesOnCircle, colourCorrection = self.referenceColours()
+        if notesOnCircle is not self.notesOnCircle or colourCorrection != self.colourCorrection:
+            self.brushes = dict()
+            for note in range(12):
+                noteOnCircle = (note - colourCorrection)%12
+                if noteOnCircle in notesOnCircle.keys():
+                    self.brushes[note] = QBrush(notesOnCircle[noteOnCircle][0][2])
+                else:
+                    self.brushes[note] = None
+            self.notesOnCircle = notesOnCircle
+            self.colourCorrection = colourCorrection
+        return self.brushes
+
+    def highlight(self, hoveredNote):
+        '''
+        Colours all the notes of the pitch class of hoveredNote, keeping their
+        colour to restore unless hoveredNote is continuously coloured
+        '''
+        start = perf_counter()
+        brush = self.highlightBrushes()[hoveredNote.note]
+        if brush is None and hoveredNote.colour:
+            brush = QBrush(hoveredNote.colour)
+        keepOriginalColours = hoveredNote.continuouslyColoured is False
+        for note in self.embeddingWidget.identifiedNotes[hoveredNote.note]:
+            if keepOriginalColours:
+                note[0].originalColour = note[0].brush().color()
+            if brush is not None:
+                note[0].setBrush(brush)
+        self.record(perf_counter() - start)
+
+    def unhighlight(self, hoveredNote):
+        '''
+        Gives back their kept colour to all the notes of the pitch class of hoveredNote
+        '''
+        start = perf_counter()
+        for note in self.embeddingWidget.identifiedNotes[hoveredNote.note]:
+            # items drawn since the highlight have no colour to restore
+            if note[0].originalColour != '':
+                note[0].setBrush(note[0].originalColour)
+        self.record(perf_counter() - start)
+
+    def record(self, elapsedTime):
+        self.count += 1
+        self.totalTime += elapsedTime
+        self.maximumTime = max(self.maximumTime, elapsedTime)
+        if elapsedTime > self.budget:
+            self.overBudget += 1
+
+    def latencyStatistics(self):
+        '''
+        Number of hover updates, mean and maximum time in seconds, number over budget
+        '''
+        return {"count": self.count,
+                "mean": self.totalTime/self.count if self.count else 0.0,
+                "maximum": self.maximumTime,
+                "overBudget": self.overBudget,
+                "budget": self.budget}
+
+class NoteColouringStore:
+    '''
+    Colouring state of the notes of a neck (continuouslyColoured, originalColour
+    and colour), kept by (string, fret) position across redraws.
+    The semitone of the position is kept too: the state only goes back to a
+    note still showing the same semitone (same tuning and root)
+    '''
+    def __init__(self):
+        self.states = dict()
+
+    def keep(self, identifiedNotes):
+        '''
+        Records the state of the notes of identifiedNotes ({semitone on octave:
+        [[note item, semitone, string, fret, ...], ...]})
+        '''
+        for semitone_on_octave in identifiedNotes.keys():
+            for identifiedNote in identifiedNotes[semitone_on_octave]:
+                note, semitone, string, fret = identifiedNote[:4]
+                self.states[(string, fret)] = (semitone, note.continuouslyColoured, note.originalColour, note.colour)
+
+    def apply(self, identifiedNotes):
+        '''
+        Gives back their recorded state to the notes of identifiedNotes
+        '''
+        for semitone_on_octave in identifiedNotes.keys():
+            for identifiedNote in identifiedNotes[semitone_on_octave]:
+                note, semitone, string, fret = identifiedNote[:4]
+                state = self.states.get((string, fret))
+                if state is not None and state[0] == semitone:
+                    (semitone_old, continuouslyColoured, originalColour, colour) = state
+                    note.continuouslyColoured = continuouslyColoured
+                    note.originalColour = originalColour
+                    note.colour = colour
+
+    def clear(self):
+        self.states = dict()
+
+    def save(self, path):
+        '''
+        Writes the states to a json file, colours as #aarrggbb ('' if none)
+        '''
+        states = list()
+        for (string, fret), (semitone, continuouslyColoured, originalColour, colour) in self.states.items():
+            states.append({"string": string,
+                           "fret": fret,
+                           "semitone": semitone,
+                           "continuouslyColoured": continuouslyColoured,
+                           "originalColour": colourToText(originalColour),
+                           "colour": colourToText(colour)})
+        with open(path, 'w', encoding='utf-8') as stateFile:
+            json.dump(states, stateFile, indent=1)
+
+    def load(self, path):
+        '''
+        Reads back states written by save, adding them to the current ones
+        '''
+        with open(path, encoding='utf-8') as stateFile:
+            states = json.load(stateFile)
+        for state in states:
+            self.states[(state["string"], state["fret"])] = (state["semitone"],
+                                                             state["continuouslyColoured"],
+                                                             textToColour(state["originalColour"]),
+                                                             textToColour(state["colour"]))
+
+class RenderScheduler:
+    '''
+    Coalesces the drawings asked for while an event is handled. The setters
+    of the windows only mark some of their layers as dirty (invalidate); one
+    render pass, run by the event loop once the event is handled (or at once
+    by flush), then calls the render_layers method of each window a single
+    time with the set of its dirty layers. Windows are rendered by increasing
+    render_order, the degree frames before the neck window taking their colours.
+    The counters tell how many invalidations were coalesced in how many
+    passes, and how many windows were rendered more than once in a pass
+    '''
+    def __init__(self):
+        self.dirtyLayers = dict()
+        self.scheduled = False
+        self.invalidations = 0
+        self.passes = 0
+        self.renders = 0
+        self.repeatedRenders = 0
+        self.lastPass = list()
+
+    def invalidate(self, target, *layers):
+        '''
+        Marks layers of target (one of RENDER_LAYERS) to be redrawn by the next render pass
+        '''
+        self.invalidations += 1
+        self.dirtyLayers.setdefault(target, set()).update(layers)
+        if not self.scheduled:
+            self.scheduled = True
+            QTimer.singleShot(0, self.flush)
+
+    def discard(self, target):
+        '''
+        Forgets the dirty layers of a window about to be deleted
+        '''
+        self.dirtyLayers.pop(target, None)
+
+    @traced
+    def flush(self):
+        '''
+        Renders at once the dirty layers of all the windows
+        '''
+        self.scheduled = False
+        if not self.dirtyLayers:
+            return
+        self.passes += 1
+        rendered = list()
+        while self.dirtyLayers:
+            # a render may invalidate other windows, the order is kept by taking the first to render each time
+            target = min(self.dirtyLayers.keys(), key=lambda window: window.render_order)
+            layers = self.dirtyLayers.pop(target)
+            if any(window is target for (window, renderedLayers) in rendered):
+                self.repeatedRenders += 1
+            target.render_layers(layers)
+            rendered.append((target, layers))
+        self.renders += len(rendered)
+        self.lastPass = [(type(window).__name__, sorted(renderedLayers)) for (window, renderedLayers) in rendered]
+
+    def statistics(self):
+        return {"invalidations": self.invalidations,
+                "passes": self.passes,
+                "renders": self.renders,
+                "repeatedRenders": self.repeatedRenders,
+                "lastPass": self.lastPass}
+
+def colourToText(colour):
+    if isinstance(colour, QColor):
+        return colour.name(QColor.HexArgb)
+    return ''
+
+def textToColour(text):
+    if text:
+        return QColor(text)
+    return ''
+
+# -----------------------------------------------------------------------------
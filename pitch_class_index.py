@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+#
+# -----------------------------------------------------------------------------
+# Author: Gregoire Vandenschrick
+# Date:   17/10/2026
+# ࿄ ࿅ ࿇
+# -----------------------------------------------------------------------------
+'''
+Index of all the 4096 pitch class sets against the catalogs, built once at
+import: for each mask (see pitch_class_sets), its canonical rotation, its mode
+name, the catalog scale it is a mode of and which degree of that scale it starts on.
+The catalog chords and enrichments playable in each mode are indexed as well.
+'''
+
+from catalogs import scales, modes, chords, enrichments
+from pitch_class_sets import NUMBER_OF_MASKS, SCALES, TRANSPOSITIONS, scaleToMask, rotateMask, isSubset, maskContains
+
+# -----------------------------------------------------------------------------
+
+def _buildCanonicalRotations():
+    '''
+    For every mask, the smallest of the masks obtained by taking each of its
+    notes as root; all the modes of a scale share the same canonical rotation
+    '''
+    canonicalRotations = [0] * NUMBER_OF_MASKS
+    # masks holding the root (odd ones) are solved a whole family of modes at a time
+    for mask in range(1, NUMBER_OF_MASKS, 2):
+        if canonicalRotations[mask] == 0:
+            family = [TRANSPOSITIONS[mask][semitone] for semitone in SCALES[mask]]
+            canonical = min(family)
+            for mode in family:
+                canonicalRotations[mode] = canonical
+    # the others share the family of the mode starting on their lowest note
+    for mask in range(2, NUMBER_OF_MASKS, 2):
+        canonicalRotations[mask] = canonicalRotations[TRANSPOSITIONS[mask][SCALES[mask][0]]]
+    return tuple(canonicalRotations)
+
+def _buildModeNames():
+    modeNames = [''] * NUMBER_OF_MASKS
+    for mode, modeName in modes.items():
+        modeNames[scaleToMask(mode)] = modeName
+    return tuple(modeNames)
+
+def _buildParentScales():
+    '''
+    For every mask that is a mode of a catalog scale, the name of the first
+    such scale in the catalog and the degree (0 based) the mode starts on
+    '''
+    parentScales = [''] * NUMBER_OF_MASKS
+    rotationIndexes = [-1] * NUMBER_OF_MASKS
+    for scaleName, scale in scales.items():
+        scaleMask = scaleToMask(scale)
+        for rotation in range(len(scale)):
+            mask = rotateMask(scaleMask, rotation)
+            if parentScales[mask] == '':
+                parentScales[mask] = scaleName
+                rotationIndexes[mask] = rotation
+    return tuple(parentScales), tuple(rotationIndexes)
+
+def _chordsInMask(mask):
+    '''
+    The catalog chords whose notes are all in mask, in catalog order, and the
+    enrichments of these chords whose added note is in mask too, as a tuple of
+    (notation, enriched chord); a later enrichment replaces an earlier one of
+    the same notation
+    '''
+    availableChords = tuple(chord for chord in chords.keys() if isSubset(CHORD_MASKS[chord], mask))
+    enrichedChords = {}
+    for chord in availableChords:
+        for enrichment in enrichments.get(chords[chord]["notation"], ()):
+            if maskContains(mask, enrichment["semitones"][0]):
+                enrichedChords[enrichment["notation"]] = chord + (enrichment["semitones"][0],)
+    return availableChords, tuple(enrichedChords.items())
+
+def _buildChordsByMask():
+    '''
+    Chords of every mode (every degree rotation) of the catalog scales
+    '''
+    chordsByMask = {}
+    for scale in scales.values():
+        scaleMask = scaleToMask(scale)
+        for rotation in range(len(scale)):
+            mask = rotateMask(scaleMask, rotation)
+            chordsByMask[mask] = _chordsInMask(mask)
+    return chordsByMask
+
+CANONICAL_ROTATIONS = _buildCanonicalRotations()
+MODE_NAMES = _buildModeNames()
+PARENT_SCALES, ROTATION_INDEXES = _buildParentScales()
+CHORD_MASKS = {chord: scaleToMask(chord) for chord in chords.keys()}
+CHORDS_BY_MASK = _buildChordsByMask()
+
+# -----------------------------------------------------------------------------
+
+def modeName(mask):
+    '''
+    Catalog name of the mode, '' if unknown
+    '''
+    return MODE_NAMES[mask]
+
+def parentScale(mask):
+    '''
+    (scale name, degree index) of the catalog scale the mode belongs to, ('', -1) if none
+    '''
+    return PARENT_SCALES[mask], ROTATION_INDEXES[mask]
+
+def chordsInMask(mask):
+    '''
+    Tuple of the catalog chords playable in the mode
+    '''
+    return _indexedChords(mask)[0]
+
+def enrichedChordsInMask(mask):
+    '''
+    Tuple of (notation, enriched chord) playable in the mode
+    '''
+    return _indexedChords(mask)[1]
+
+def _indexedChords(mask):
+    # modes outside of the catalog scales are indexed on first use
+    if mask not in CHORDS_BY_MASK:
+        CHORDS_BY_MASK[mask] = _chordsInMask(mask)
+    return CHORDS_BY_MASK[mask]
+
+def namePitchClassSet(semitones, root=None):
+    '''
+    Names any set of semitones (octaves folded), seen from root, by default
+    its first semitone.
+    Returns a dict with the mask seen from root, its canonical rotation, mode
+    name, parent scale and rotation index in that scale
+    '''
+    semitones = list(semitones)
+    if root is None:
+        root = semitones[0] if semitones else 0
+    mask = TRANSPOSITIONS[scaleToMask(semitones)][root % 12]
+    return {"mask": mask,
+            "canonical": CANONICAL_ROTATIONS[mask],
+            "mode": MODE_NAMES[mask],
+            "scale": PARENT_SCALES[mask],
+            "rotation": ROTATION_INDEXES[mask]}
+
+def linkModesToScales():
+    '''
+    For each catalog scale, the list of the names of its modes, from degree I on
+    '''
+    modesListByScaleDic = dict()
+    for scaleName, scale in scales.items():
+        scaleMask = scaleToMask(scale)
+        modeNames = [MODE_NAMES[rotateMask(scaleMask, rotation)] for rotation in range(len(scale))]
+        modesListByScaleDic[scaleName] = [name for name in modeNames if name]
+    return modesListByScaleDic
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+#
+# -----------------------------------------------------------------------------
+# Author: Gregoire Vandenschrick
+# Date:   17/10/2026
+# ࿄ ࿅ ࿇
+# -----------------------------------------------------------------------------
+'''
+Qt-free representation of scales, modes and chords as 12-bit pitch class masks.
+Bit n of a mask is set when the semitone n (0 being the root of the set) is part
+of it, e.g. the major scale [0, 2, 4, 5, 7, 9, 11] is 0b101010110101.
+'''
+
+NUMBER_OF_PITCH_CLASSES = 12
+NUMBER_OF_MASKS = 1 << NUMBER_OF_PITCH_CLASSES
+FULL_MASK = NUMBER_OF_MASKS - 1
+
+# -----------------------------------------------------------------------------
+
+def _buildScales():
+    '''
+    Sorted tuple of semitones for every possible mask
+    '''
+    scalesByMask = [()]
+    for mask in range(1, NUMBER_OF_MASKS):
+        # Every mask is a smaller mask plus its highest bit
+        highestBit = mask.bit_length() - 1
+        scalesByMask.append(scalesByMask[mask ^ (1 << highestBit)] + (highestBit,))
+    return tuple(scalesByMask)
+
+def _buildDegreeIndexes():
+    '''
+    For every possible mask, the index in the sorted scale of each of the
+    12 semitones, -1 when the semitone is not part of the scale
+    '''
+    degreeIndexesByMask = []
+    for scale in SCALES:
+        degreeIndexes = [-1] * NUMBER_OF_PITCH_CLASSES
+        for index, semitone in enumerate(scale):
+            degreeIndexes[semitone] = index
+        degreeIndexesByMask.append(tuple(degreeIndexes))
+    return tuple(degreeIndexesByMask)
+
+def _buildTranspositions():
+    '''
+    For every possible mask, the 12 masks obtained by taking each semitone as
+    the new root (the set is shifted down by 0 to 11 semitones)
+    '''
+    # built shift by shift, then transposed to be indexed by mask first
+    byShift = [[((mask >> shift) | (mask << (NUMBER_OF_PITCH_CLASSES - shift))) & FULL_MASK
+                for mask in range(NUMBER_OF_MASKS)]
+               for shift in range(NUMBER_OF_PITCH_CLASSES)]
+    return tuple(zip(*byShift))
+
+SCALES = _buildScales()
+DEGREE_INDEXES = _buildDegreeIndexes()
+TRANSPOSITIONS = _buildTranspositions()
+
+# -----------------------------------------------------------------------------
+
+def scaleToMask(scale):
+    '''
+    Takes any iterable of semitones (octaves are folded) and returns its mask
+    '''
+    mask = 0
+    for semitone in scale:
+        mask |= 1 << (semitone % NUMBER_OF_PITCH_CLASSES)
+    return mask
+
+def maskToScale(mask):
+    '''
+    Returns the sorted list of semitones of a mask
+    '''
+    return list(SCALES[mask])
+
+def maskContains(mask, semitone):
+    '''
+    True if the semitone (of any octave) is part of the mask
+    '''
+    return (mask >> (semitone % NUMBER_OF_PITCH_CLASSES)) & 1 == 1
+
+def isSubset(subMask, mask):
+    '''
+    True if all the semitones of subMask are part of mask
+    '''
+    return subMask & ~mask == 0
+
+def degreeIndex(mask, semitone):
+    '''
+    Index (0 based) of the semitone in the sorted scale of the mask, -1 if absent
+    '''
+    return DEGREE_INDEXES[mask][semitone % NUMBER_OF_PITCH_CLASSES]
+
+def transposeMask(mask, semitones):
+    '''
+    Mask of the same set seen from a root situated semitones higher
+    '''
+    return TRANSPOSITIONS[mask][semitones % NUMBER_OF_PITCH_CLASSES]
+
+def rotateMask(mask, rotation):
+    '''
+    Mask of the mode starting on the degree situated rotation degrees higher
+    (negative rotations go down), as rotate_notes does one step at a time
+    '''
+    scale = SCALES[mask]
+    return TRANSPOSITIONS[mask][scale[rotation % len(scale)]]
+
+def rotateScale(scale, rotation):
+    '''
+    List version of rotateMask
+    '''
+    return list(SCALES[rotateMask(scaleToMask(scale), rotation)])
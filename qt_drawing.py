@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+#
+# -----------------------------------------------------------------------------
+# Author: Gregoire Vandenschrick
+# Date:   17/10/2026
+# ࿄ ࿅ ࿇
+# -----------------------------------------------------------------------------
+'''
+Qt side of Inlays and colour_tables: the graphic items, colours and pens of
+the inlays, and the QColor and QBrush tables of the palettes. Kept apart so
+that the catalogs and palettes can be used without Qt; both modules give
+access to these, Qt being imported when they are first needed.
+'''
+
+from functools import lru_cache
+
+from PySide6.QtWidgets import QGraphicsEllipseItem, QGraphicsRectItem
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QColor, QBrush, QPen
+
+from colour_tables import hexTable
+
+# -----------------------------------------------------------------------------
+
+class NoBorderEllipseItem(QGraphicsEllipseItem):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        # Set the pen to transparent color (no border)
+        self.setPen(QPen(Qt.transparent))
+
+class NoBorderRectItem(QGraphicsRectItem):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        # Set the pen to transparent color (no border)
+        self.setPen(QPen(Qt.transparent))
+
+def hex_to_qcolor(hex_color):
+    # Remove '#' from the beginning of the hexadecimal string if present
+    hex_color = hex_color.lstrip('#')
+
+    # Convert hexadecimal color code to RGB values
+    red = int(hex_color[0:2], 16)
+    green = int(hex_color[2:4], 16)
+    blue = int(hex_color[4:6], 16)
+
+    # Create a QColor object with the RGB values
+    qcolor = QColor(red, green, blue)
+
+    return qcolor
+
+# Items, colours and pens of the inlays
+inlayItemTypes = {
+    'ellipse': QGraphicsEllipseItem,
+    'rect': QGraphicsRectItem}
+
+@lru_cache(maxsize=None)
+def inlayColour(hexColour):
+    return hex_to_qcolor(hexColour)
+
+@lru_cache(maxsize=None)
+def inlayPen(penSpecification):
+    if penSpecification is None:
+        return QPen(Qt.transparent)
+    hexColour, width = penSpecification
+    pen = QPen(inlayColour(hexColour))
+    pen.setWidth(width)
+    return pen
+
+def inlayItem(inlayMark, rect):
+    '''
+    Graphic item of an InlayMark, drawn in rect
+    '''
+    item = inlayItemTypes[inlayMark.shape](rect)
+    item.setBrush(inlayColour(inlayMark.colour))
+    item.setPen(inlayPen(inlayMark.pen))
+    return item
+
+# -----------------------------------------------------------------------------
+
+@lru_cache(maxsize=None)
+def colourTable(colours):
+    '''
+    Tuple of the 12 QColor of the semitones for a palette; shared, not to be modified
+    '''
+    return tuple(QColor(hexColour) for hexColour in hexTable(colours))
+
+@lru_cache(maxsize=None)
+def brushTable(colours):
+    '''
+    Tuple of the 12 QBrush of the semitones for a palette; shared, not to be modified
+    '''
+    return tuple(QBrush(colour) for colour in colourTable(colours))
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+#
+# -----------------------------------------------------------------------------
+# Author: Gregoire Vandenschrick
+# Date:   17/10/2026
+# ࿄ ࿅ ࿇
+# -----------------------------------------------------------------------------
+'''
+Lazy access to the Qt side of the Qt-free modules. Kept apart from the Qt
+modules themselves (note_items, qt_drawing), which import Qt as soon as
+they are imported.
+'''
+
+from importlib import import_module
+
+# -----------------------------------------------------------------------------
+
+def lazyQtExports(moduleName, qtModuleName, names):
+    '''
+    Module __getattr__ of moduleName, handing out names of qtModuleName,
+    which is only imported (with Qt) when one of them is first asked for
+    '''
+    def __getattr__(name):
+        if name in names:
+            return getattr(import_module(qtModuleName), name)
+        raise AttributeError("module %r has no attribute %r" % (moduleName, name))
+    return __getattr__
+
+# -----------------------------------------------------------------------------
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+#
+# -----------------------------------------------------------------------------
+# Author: Gregoire Vandenschrick
+# Date:   17/10/2026
+# ࿄ ࿅ ࿇
+# -----------------------------------------------------------------------------
+'''
+Qt-free instrumentation of the drawing cascades of scale_circle.
+The draw_*, refresh, set_* (and alike) methods of its windows are wrapped by
+traceMethods; while the tracer is enabled, each call is timed and recorded in
+a call tree. A call made while no other traced call is running is taken as a
+user action (a combobox choice, a hover, a key...), the root of its tree.
+The last actions can be reported as text (see the overlay of MainWindow, F12)
+and written to a trace file (F11) in the Trace Event Format of
+chrome://tracing and Perfetto.
+Tracing starts enabled when the environment variable SCALE_CIRCLE_TRACE gives
+the trace file to write when the application is closed.
+'''
+
+from collections import deque
+from functools import wraps
+from time import perf_counter
+import json
+import os
+
+# Methods of the windows which are traced, by the beginning of their name
+TRACED_PREFIXES = ("draw_", "refresh", "set_", "setRootNote", "label_", "color_", "colour_", "change", "show_")
+
+TRACE_FILE = os.environ.get("SCALE_CIRCLE_TRACE")
+DEFAULT_TRACE_FILE = "scale_circle_trace.json"
+MAXIMUM_ACTIONS = 1000
+MAXIMUM_REPORT_METHODS = 12
+MAXIMUM_REPORT_LINES = 60
+
+# -----------------------------------------------------------------------------
+
+class TracedCall:
+    '''
+    One call of a traced method: its name, start time and duration in
+    seconds, and the traced calls it made
+    '''
+    __slots__ = ("name", "start", "duration", "children")
+
+    def __init__(self, name, start):
+        self.name = name
+        self.start = start
+        self.duration = 0.0
+        self.children = list()
+
+    def numberOfCalls(self):
+        return 1 + sum(child.numberOfCalls() for child in self.children)
+
+class RedrawTracer:
+    '''
+    Records the traced calls as call trees, one per user action, keeping the
+    last MAXIMUM_ACTIONS of them, and the number and total time of the calls
+    of each method since the last reset.
+    listeners are called with each action once it is finished.
+    '''
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.listeners = list()
+        self.reset()
+
+    def reset(self):
+        self.epoch = perf_counter()
+        self.stack = list()
+        self.actions = deque(maxlen=MAXIMUM_ACTIONS)
+        self.numberOfActions = 0
+        self.totals = dict()
+
+    def call(self, name, function, args, kwargs):
+        tracedCall = TracedCall(name, perf_counter())
+        if self.stack:
+            self.stack[-1].children.append(tracedCall)
+        self.stack.append(tracedCall)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            tracedCall.duration = perf_counter() - tracedCall.start
+            self.stack.pop()
+            total = self.totals.setdefault(name, [0, 0.0])
+            total[0] += 1
+            total[1] += tracedCall.duration
+            if not self.stack:
+                self.actions.append(tracedCall)
+                self.numberOfActions += 1
+                for listener in self.listeners:
+                    listener(tracedCall)
+
+    def report(self, action, maximumLines=MAXIMUM_REPORT_LINES):
+        '''
+        Text report of an action: the number and time of the calls of the
+        costliest methods, then the call tree, the calls of a same method made
+        by the same caller being merged
+        '''
+        calls = aggregateCalls([action])
+        byMethod = dict()
+        for (name, count, duration, children) in flattenCalls(calls):
+            byMethod.setdefault(name, [0, 0.0])
+            byMethod[name][0] += count
+            byMethod[name][1] += duration
+        lines = ["action %s: %s, %.1f ms, %s calls" % (self.numberOfActions, action.name, 1000*action.duration, action.numberOfCalls()),
+                 "",
+                 "%-52s %5s %9s" % ("method", "calls", "ms")]
+        for name, (count, duration) in sorted(byMethod.items(), key=lambda item: -item[1][1])[:MAXIMUM_REPORT_METHODS]:
+            lines.append("%-52s %5s %9.1f" % (name, count, 1000*duration))
+        lines.extend(["", "call tree"])
+        treeLines = list()
+        appendTreeLines(treeLines, calls, 0)
+        lines.extend(treeLines)
+        if len(lines) > maximumLines:
+            lines = lines[:maximumLines-1] + ["... %s more lines" % (len(lines) - maximumLines + 1)]
+        return "\n".join(lines)
+
+    def traceEvents(self):
+        '''
+        Recorded calls as complete events of the Trace Event Format, times in µs
+        '''
+        events = list()
+        firstAction = self.numberOfActions - len(self.actions)
+        for actionIndex, action in enumerate(self.actions):
+            pending = [action]
+            while pending:
+                tracedCall = pending.pop()
+                events.append({"name": tracedCall.name,
+                               "cat": "redraw",
+                               "ph": "X",
+                               "ts": 1e6*(tracedCall.start - self.epoch),
+                               "dur": 1e6*tracedCall.duration,
+                               "pid": os.getpid(),
+                               "tid": 0,
+                               "args": {"action": firstAction + actionIndex + 1}})
+                pending.extend(tracedCall.children)
+        return events
+
+    def dump(self, path=None):
+        '''
+        Writes the recorded actions and the totals by method to a trace file,
+        TRACE_FILE (or DEFAULT_TRACE_FILE) unless path is given; returns its path
+        '''
+        path = path or TRACE_FILE or DEFAULT_TRACE_FILE
+        totals = {name: {"calls": count, "ms": 1000*duration} for name, (count, duration) in self.totals.items()}
+        with open(path, 'w', encoding='utf-8') as traceFile:
+            json.dump({"traceEvents": self.traceEvents(),
+                       "displayTimeUnit": "ms",
+                       "otherData": {"actions": self.numberOfActions, "totals": totals}}, traceFile)
+        return path
+
+tracer = RedrawTracer(enabled=TRACE_FILE is not None)
+
+# -----------------------------------------------------------------------------
+
+def aggregateCalls(calls):
+    '''
+    List of (name, count, total duration, aggregated children) merging the
+    calls of a same method, in the order of their first call
+    '''
+    callsByName = dict()
+    for tracedCall in calls:
+        callsByName.setdefault(tracedCall.name, list()).append(tracedCall)
+    return [(name, len(sameCalls), sum(tracedCall.duration for tracedCall in sameCalls),
+             aggregateCalls([child for tracedCall in sameCalls for child in tracedCall.children]))
+            for name, sameCalls in callsByName.items()]
+
+def flattenCalls(aggregatedCalls):
+    for aggregatedCall in aggregatedCalls:
+        yield aggregatedCall
+        yield from flattenCalls(aggregatedCall[3])
+
+def appendTreeLines(lines, aggregatedCalls, depth):
+    for (name, count, duration, children) in aggregatedCalls:
+        lines.append("%s%s%s  %.1f ms" % ("  "*depth, name, " ×%s" % count if count > 1 else "", 1000*duration))
+        appendTreeLines(lines, children, depth + 1)
+
+# -----------------------------------------------------------------------------
+
+def traced(function, name=None):
+    '''
+    function, recorded by the tracer when it is enabled
+    '''
+    name = name or function.__qualname__
+    @wraps(function)
+    def tracedFunction(*args, **kwargs):
+        if not tracer.enabled:
+            return function(*args, **kwargs)
+        return tracer.call(name, function, args, kwargs)
+    return tracedFunction
+
+def traceMethods(tracedClass, prefixes=TRACED_PREFIXES):
+    '''
+    Wraps with traced the methods defined by tracedClass whose name starts
+    with one of prefixes
+    '''
+    for name, attribute in list(vars(tracedClass).items()):
+        if callable(attribute) and name.startswith(prefixes):
+            setattr(tracedClass, name, traced(attribute))
+    return tracedClass
@@ -8,43 +8,79 @@
 # -----------------------------------------------------------------------------
 
 from PySide6.QtWidgets import QApplication, QMainWindow, QGraphicsView, QGraphicsScene
-from PySide6.QtWidgets import QGraphicsItem, QGraphicsItemGroup, QGraphicsEllipseItem, QGraphicsSimpleTextItem, QGraphicsLineItem
+from PySide6.QtWidgets import QGraphicsItem, QGraphicsEllipseItem, QGraphicsSimpleTextItem, QGraphicsLineItem
 from PySide6.QtWidgets import QDialog, QPushButton, QCheckBox, QRadioButton, QComboBox, QSlider, QMenu, QLabel, QGridLayout, QVBoxLayout, QHBoxLayout, QWidget, QFrame, QGraphicsBlurEffect
 from PySide6.QtCore import Qt, QPointF, QRectF, QLineF, QSizeF, Slot
-from PySide6.QtGui import QPolygonF, QPen, QBrush, QPainter, QAction, QFont, QColor, QFontMetrics
-import sys, math, itertools
-
-from scale_circle_library import fretZeroNoteItem, NoteItem, TriangleNoteItem, linkModesToScales
-from catalogs import notes, scales, modes, alterations, tunings, stringSets, stringGaugeFromNumberOfString, chords, enrichments, semitonesToConsiderByNumberOfStrings, degrees, degreeArrangements
-from Inlays import NoBorderEllipseItem, inlays, sideInlays, customColours
+from PySide6.QtGui import QPolygonF, QPen, QBrush, QPainter, QAction, QFont, QColor, QFontMetrics, QTransform, QPicture
+from functools import lru_cache
+import sys, math
+import numpy as np
+
+from scale_circle_library import fretZeroNoteItem, NoteItem, TriangleNoteItem, LayerGroup, PictureItem, NoteItemPool, NoteHighlighter, NoteColouringStore
+from scale_circle_library import RenderScheduler, RENDER_LAYERS
+from pitch_class_sets import scaleToMask, maskContains, degreeIndex, rotateMask, maskToScale
+from pitch_class_index import modeName, linkModesToScales, chordsInMask, enrichedChordsInMask
+from fretboard import pitchMatrix, fretGeometry, fanProjection, lowStringNoteValue, firstRootPosition
+from fretboard import SCALE_CIRCLE_RADIUS, FRET_SPACING, FRET_OVERSHOOT, STRING_SPACING, NECK_WIDENING, FONT
+from colour_tables import colourTable, semitoneForAngle, DEGREE_COLOUR
+from chord_voicings import iterVoicings
+from neck_queries import maximumSemitoneDifference, isChordPosition
+from catalogs import notes, scales, alterations, tunings, stringSets, stringGaugeFromNumberOfString, chords, semitonesToConsiderByNumberOfStrings, degrees, degreeArrangements
+from Inlays import NoBorderEllipseItem, inlayStyles, compiledInlays, inlayItem, customColours
+from redraw_trace import tracer, traceMethods, TRACE_FILE
 
 # -----------------------------------------------------------------------------
 
-SCALE_CIRCLE_RADIUS = 160
-FRET_SPACING = 50
-FRET_OVERSHOOT = 4
-STRING_SPACING = 30
-
 GRAPHICSVIEW_WIDTH = 459
 GRAPHICSVIEW_HEIGHT = 366
 
-NECK_WIDENING = 5
+# Zoom of the views over the scenes drawn at scale_factor, changed by the +/- keys
+ZOOM = 1.0
+ZOOM_STEP = 0.1
+MINIMUM_ZOOM = 0.5
+MAXIMUM_ZOOM = 3.0
+
+# Neck backgrounds of the degree frames kept, by tuning, number of frets and scale_factor
+NECK_BACKGROUNDS_CACHE_SIZE = 32
 
-FONT = 'Garamond Premier Pro'
-DEGREE_COLOUR = 'Destorm'
+# Layers of a degree frame needing the circle, or the neck, to be redrawn
+CIRCLE_LAYERS = {"scale", "degree", "colours"}
+FRAME_NECK_LAYERS = CIRCLE_LAYERS | {"tuning"}
+# Layers of the neck window needing its notes to be redrawn
+NECK_NOTES_LAYERS = {"scale", "tuning"}
 
-ZOOM = 1.0
+# -----------------------------------------------------------------------------
+
+def zoomFonts(widget, zoom):
+    '''
+    Text scaling path of the zoom, the views only scaling their scenes: the
+    fonts of the labels, buttons and comboboxes in widget are set to zoom
+    times the size they had when first zoomed (kept as originalFontSize)
+    '''
+    for child in widget.findChildren(QWidget):
+        if not isinstance(child, (QLabel, QPushButton, QCheckBox, QRadioButton, QComboBox)):
+            continue
+        font = child.font()
+        if not hasattr(child, 'originalFontSize'):
+            child.originalFontSize = font.pointSizeF()
+        if child.originalFontSize > 0:  # If a point size is set
+            font.setPointSizeF(child.originalFontSize * zoom)
+            child.setFont(font)
 
 
 # -----------------------------------------------------------------------------
 # -----------------------------------------------------------------------------
 
 class NeckWindow(QDialog):
+    # rendered after the degree frames, whose colours it takes
+    render_order = 1
+
     def __init__(self, mainWindowInstance, scale_factor=1.0):
         super().__init__()
         self.setWindowTitle("🎸 Neck general view")
         self.mainWindowInstance = mainWindowInstance
         self.scale_factor = scale_factor
+        self.zoom = 1.0
 
         self.once = True
         self.neckSceneRect = ''
@@ -55,6 +91,7 @@ class NeckWindow(QDialog):
 
         self.modeIndex = 0
         self.modeScale = list()
+        self.modeMask = 0
 
         self.rootNote = ''
 
@@ -69,6 +106,10 @@ class NeckWindow(QDialog):
         self.colour_degrees = DEGREE_COLOUR
         self.fanBase = 0
         self.fanHeight = 1000000
+        # inlays shown by the next drawing instead of the chosen ones (hovered in their combobox)
+        self.inlays_preview = False
+        # what the borders, frets, strings and inlays shown were drawn for
+        self.staticLayers = None
 
         self.labelFont = QFont()
         self.labelFont.setPointSize(20*self.scale_factor)
@@ -79,6 +120,8 @@ class NeckWindow(QDialog):
         self.create_graphic_item_groups()
 
         self.identifiedNotes = dict()
+        # Colouring state of the notes by (string, fret), kept across redraws
+        self.notes_colouring_store = NoteColouringStore()
 
         # Initialisation
         self.set_tuning(self.mainWindowInstance.currentTuningName, init=True)
@@ -160,7 +203,7 @@ class NeckWindow(QDialog):
         label.setAlignment(Qt.AlignLeft)
         label.setFont(self.labelFont)
         self.inlays_combobox = QComboBox()
-        self.inlays_combobox.addItems(inlays.keys())
+        self.inlays_combobox.addItems(inlayStyles)
         self.inlays_combobox.setCurrentText(".strandberg＊")
         self.inlays_combobox.currentTextChanged.connect(lambda: self.draw_neck())
         self.inlays_combobox.highlighted.connect(self.show_highlighted_inlays)
@@ -194,15 +237,20 @@ class NeckWindow(QDialog):
         self.neck_graphics_view.setScene(self.neck_scene)
 
     def create_graphic_item_groups(self):
-        # Groups to help manage graphic items
-        self.neck_diagram_background_group = QGraphicsItemGroup()
-        self.neck_diagram_inlays_group = QGraphicsItemGroup()
-        self.neck_diagram_notes_group = QGraphicsItemGroup()
+        # Groups to help manage graphic items, the static ones being cached
+        # so that hovers and highlights only paint the notes again
+        self.neck_diagram_background_group = LayerGroup(cacheMode=QGraphicsItem.DeviceCoordinateCache)
+        self.neck_diagram_inlays_group = LayerGroup(cacheMode=QGraphicsItem.DeviceCoordinateCache)
+        self.neck_diagram_notes_group = LayerGroup()
         self.neck_diagram_notes_group.setHandlesChildEvents(False)
-        self.neck_diagram_colours_group = QGraphicsItemGroup()
+        self.neck_diagram_colours_group = LayerGroup()
         self.neck_diagram_colours_group.setHandlesChildEvents(False)
-        self.neck_diagram_degrees_group = QGraphicsItemGroup()
-        self.neck_diagram_tuning_group = QGraphicsItemGroup()
+        self.neck_diagram_degrees_group = LayerGroup()
+        self.neck_diagram_tuning_group = LayerGroup()
+        # Note items of cleared groups, reused by the next drawing
+        self.note_items_pool = NoteItemPool(self)
+        # Colours the notes sharing the pitch class of a hovered note
+        self.note_highlighter = NoteHighlighter(self)
 
 # -----------------------------------------------------------------------------
 
@@ -218,7 +266,6 @@ class NeckWindow(QDialog):
         self.set_modeScale()
 
         self.draw_neck()
-        self.label_degrees_on_neck()
 
     def set_mode(self, modeIndex):
         self.modeIndex = modeIndex
@@ -226,16 +273,14 @@ class NeckWindow(QDialog):
         self.set_modeScale()
 
         self.draw_neck()
-        self.label_degrees_on_neck()
 
     def set_modeScale(self):
-        self.modeScale = self.scale
-        for i in range(self.modeIndex):
-            self.rotate_mode_scale(+1)
+        self.modeMask = scaleToMask(self.scale)
+        self.rotate_mode_scale(self.modeIndex)
 
     def set_arrangement(self, arrangement):
         self.currentArrangement = arrangement
-        self.label_degrees_on_neck()
+        self.invalidate("degree")
 
     def set_tuning(self, tuning_name, init=False):
         '''
@@ -250,40 +295,42 @@ class NeckWindow(QDialog):
 
     def setRootNote(self, rootNoteValue=-1):
         # All this will be useful to draw a more realistic neck
-        tuningNotesComposition = self.currentTuningName.split('\t')[1].split()
-        notesByIndex = {value: key for key, value in notes.items()}
-        firstTuningNote = ''
-        if len(tuningNotesComposition)>0:
-            if tuningNotesComposition[0][1] == '♯':
-                #print("debug 0")
-                firstTuningNote = notesByIndex[notes[tuningNotesComposition[0][0]]+1]
-            elif tuningNotesComposition[0][1] == '♭':
-                #print("debug 1")
-                firstTuningNote = notesByIndex[notes[tuningNotesComposition[0][0]]-1]
-            else:
-                #print("debug 3")
-                firstTuningNote = tuningNotesComposition[0][0]
-        firstTuningNoteValue = notes[firstTuningNote]
-        self.lowStringNoteIndex = firstTuningNoteValue
+        self.lowStringNoteIndex = lowStringNoteValue(self.currentTuningName)
         if rootNoteValue == -1:
             rootNoteValue = notes[self.root_note_combobox.currentText()]
         self.rootNote = self.root_note_combobox.currentText()
-        self.first_root_position = (rootNoteValue - firstTuningNoteValue)-1
-        self.mainWindowInstance.refresh()
+        self.first_root_position = firstRootPosition(self.currentTuningName, rootNoteValue)
+        # the names of the chords of the degree frames begin with the note of their degree
+        for vFrame in self.mainWindowInstance.degreesFrames:
+            vFrame.invalidate("chords")
 
         self.draw_neck()
-        self.label_degrees_on_neck()
 
     def set_degrees_colour(self):
         self.colour_degrees = self.degrees_colours_combobox.currentText()
-        self.label_degrees_on_neck()
         self.mainWindowInstance.changeColourDegrees(self.colour_degrees)
-        self.changeNotesColours()
+        self.invalidate("colours")
+
+    def invalidate(self, *layers):
+        self.mainWindowInstance.render_scheduler.invalidate(self, *layers)
+
+    def render_layers(self, layers):
+        '''
+        Redraws the layers marked as dirty since the last render pass: the
+        notes for a new scale (mode, root or neck option included) or tuning,
+        the degree labels and the colours of the notes for all of them
+        '''
+        if layers & NECK_NOTES_LAYERS:
+            self.draw_notes_on_neck(inlaysType=self.inlays_preview)
+        self.label_degrees_on_neck()
+        if layers & (NECK_NOTES_LAYERS | {"colours"}):
+            self.changeNotesColours()
 
 # -----------------------------------------------------------------------------
 
     def rotate_mode_scale(self, rotation):
-        self.modeScale = sorted([(inScale +(12-self.modeScale[rotation]))%12 for inScale in self.modeScale])
+        self.modeMask = rotateMask(self.modeMask, rotation)
+        self.modeScale = maskToScale(self.modeMask)
 
 # -----------------------------------------------------------------------------
 
@@ -298,9 +345,16 @@ class NeckWindow(QDialog):
         halfNeckHeight = ((STRING_SPACING * (self.num_strings - 1))/2)*self.scale_factor
         return x - (self.fanBase*self.scale_factor-x)*(y-halfNeckHeight)/(self.fanHeight*self.scale_factor)
 
+    def fan_projection(self):
+        '''
+        transFan for whole arrays of coordinates, cached for the current fan and neck
+        '''
+        return fanProjection(self.fanBase, self.fanHeight, self.num_strings, self.scale_factor, STRING_SPACING)
+
     def draw_neck(self, inlaysType=False):
         '''
         General function called when the QSlider value changes.
+        The neck is redrawn by the next render pass
         '''
         if self.fan_frets_checkbox.isChecked():
             self.fanBase   = self.fan_apex_slider.value()
@@ -311,40 +365,45 @@ class NeckWindow(QDialog):
             self.fanBase   = 0
             self.fanHeight = 1000000*self.scale_factor
             self.fan_apex_slider.hide()
-        self.draw_notes_on_neck(inlaysType=inlaysType)
-        self.set_degrees_colour()
+        self.inlays_preview = inlaysType
+        self.invalidate("scale")
 
     def draw_neck_background(self, rootUndefined=True, inlaysType=False):
         '''
-        Draws all the elements of the neck except the notes
+        Draws all the elements of the neck except the notes. The borders,
+        frets, strings and inlays are only drawn again when the neck they
+        show changes (strings, frets, fan, inlays or scale_factor)
         '''
-        self.clear_group(self.neck_diagram_background_group)
-        self.clear_group(self.neck_diagram_inlays_group)
-        self.clear_group(self.neck_diagram_tuning_group)
+        if not inlaysType:
+            inlaysType = self.inlays_combobox.currentText()
+        staticLayers = (self.num_strings, self.num_frets, self.scale_factor, self.fanBase, self.fanHeight,
+                        self.reg_frets_checkbox.isChecked(), inlaysType)
+        if staticLayers != self.staticLayers or self.neck_diagram_background_group.scene() is not self.neck_scene:
+            self.staticLayers = staticLayers
+            self.neck_diagram_background_group.clear()
+            self.neck_diagram_inlays_group.clear()
 
-        # Draw neck borders
-        self.draw_neck_borders()
+            # Draw neck borders
+            self.draw_neck_borders()
 
-        # Draw frets
-        self.draw_frets()
+            # Draw frets
+            self.draw_frets()
 
-        # Draw inlays
-        if not inlaysType:
-            inlaysType = self.inlays_combobox.currentText()
-        self.draw_inlays(type=inlaysType)
+            # Draw inlays
+            self.draw_inlays(type=inlaysType)
 
-        # Draw strings
-        self.draw_strings()
+            # Draw strings
+            self.draw_strings()
 
+        self.neck_diagram_tuning_group.clear()
         if self.show_tuning_checkbox.isChecked():
             self.draw_tuning()
 
-        if self.neck_diagram_inlays_group not in self.neck_scene.items():
-            self.neck_scene.addItem(self.neck_diagram_inlays_group)
-        if self.neck_diagram_tuning_group not in self.neck_scene.items():
-            self.neck_scene.addItem(self.neck_diagram_tuning_group)
-        if self.neck_diagram_background_group not in self.neck_scene.items():
-            self.neck_scene.addItem(self.neck_diagram_background_group)
+        self.neck_diagram_inlays_group.addToScene(self.neck_scene)
+        self.neck_diagram_tuning_group.addToScene(self.neck_scene)
+        self.neck_diagram_background_group.addToScene(self.neck_scene)
+        # the tuning stays between the inlays and the background when only it is drawn again
+        self.neck_diagram_tuning_group.stackBefore(self.neck_diagram_background_group)
 
     def draw_neck_borders(self):
         neck_width  = FRET_SPACING   * (self.num_frets + 1)*self.scale_factor
@@ -384,7 +443,6 @@ class NeckWindow(QDialog):
 
     def draw_frets(self):
         neck_height = (STRING_SPACING * (self.num_strings - 1))*self.scale_factor
-        neck_length = FRET_SPACING * (self.num_frets + 1)*self.scale_factor
         strings_thickness = stringSets[stringGaugeFromNumberOfString[self.num_strings]]
         highStringThicknessAllowance = (strings_thickness[0]/20)*self.scale_factor
         lowStringThicknessAllowance = (strings_thickness[-1]/20)*self.scale_factor
@@ -414,20 +472,17 @@ class NeckWindow(QDialog):
 
         # Draw frets
         fret_darkGray_pen.setWidth(3*self.scale_factor)      # Set the pen width
-        for i in range(0, self.num_frets + 1):
-            if self.reg_frets_checkbox.isChecked():
-                x = i * FRET_SPACING * self.scale_factor
-            else:
-                x = 4/3*neck_length - (4/3*neck_length / (2**(i/12)))
-
-            widthAdjustment = NECK_WIDENING*(i/(self.num_frets + 1))*self.scale_factor
-            top    = -(FRET_OVERSHOOT*self.scale_factor + widthAdjustment + highStringThicknessAllowance)
-            # visual debug
-            if i%12 == 0:
-                top = top -20
-            bottom = neck_height+(FRET_OVERSHOOT*self.scale_factor + widthAdjustment + lowStringThicknessAllowance)
-            xTop = self.transFan(x, top)
-            xBottom = self.transFan(x, bottom)
+        geometry = fretGeometry(self.num_frets, FRET_SPACING, self.scale_factor, self.reg_frets_checkbox.isChecked())
+        frets = np.arange(0, self.num_frets + 1)
+        xs = geometry.positions[1:]
+        widthAdjustments = NECK_WIDENING*(frets/(self.num_frets + 1))*self.scale_factor
+        tops    = -(FRET_OVERSHOOT*self.scale_factor + widthAdjustments + highStringThicknessAllowance)
+        # visual debug
+        tops[frets%12 == 0] -= 20
+        bottoms = neck_height+(FRET_OVERSHOOT*self.scale_factor + widthAdjustments + lowStringThicknessAllowance)
+        fan = self.fan_projection()
+        coordinates = (fan.project(xs, tops), tops, fan.project(xs, bottoms), bottoms)
+        for (xTop, top, xBottom, bottom) in zip(*(array.tolist() for array in coordinates)):
             line = QGraphicsLineItem(xTop, top, xBottom, bottom)
             line.setPen(fret_darkGray_pen)
             self.neck_diagram_background_group.addToGroup(line)
@@ -435,57 +490,29 @@ class NeckWindow(QDialog):
     def draw_inlays(self, type="black_dot"):
         stringNumbersAdjustmentRatio = self.num_strings/6.0
         neck_height = STRING_SPACING * (self.num_strings - 1)*self.scale_factor
-        neck_length = FRET_SPACING * (self.num_frets + 1)*self.scale_factor
         halfNeckHeight = neck_height/2
+        geometry = fretGeometry(self.num_frets, FRET_SPACING, self.scale_factor, self.reg_frets_checkbox.isChecked())
 
         strings_thickness = stringSets[stringGaugeFromNumberOfString[self.num_strings]]
         highStringThicknessAllowance = (strings_thickness[0]/20)*self.scale_factor
         lowStringThicknessAllowance = (strings_thickness[-1]/20)*self.scale_factor
 
-        for i in range(0, self.num_frets):
-            adjustmentForFret = (NECK_WIDENING*i/self.num_frets)*self.scale_factor
-            # Neck Inlays
-            if i in inlays[type].keys():
-                for inlayMark in inlays[type][i]:
-                    if self.reg_frets_checkbox.isChecked():
-                        x = ((FRET_SPACING*inlayMark['delta_x']) + i * FRET_SPACING)*self.scale_factor
-                    else:
-                        x = 4/3*neck_length - (4/3*neck_length / (2**(i/12)))
-                        nextX = 4/3*neck_length - (4/3*neck_length / (2**((1+i)/12)))
-                        thisFretSpacing = nextX - x
-                        x = (x + ((thisFretSpacing*inlayMark['delta_x']))) * self.scale_factor
-
-                    if inlayMark['delta_y'] < 0:
-                        adjustmentForFret = -adjustmentForFret
-                    elif inlayMark['delta_y'] == 0:
-                        adjustmentForFret = 0
-                    y = halfNeckHeight + halfNeckHeight*inlayMark['delta_y']*stringNumbersAdjustmentRatio + adjustmentForFret
-                    newX = self.transFan(x, y)
-                    point = QPointF(newX, y)
-                    inlay = inlayMark['type'](QRectF(point - QPointF(inlayMark['size_x']/2*self.scale_factor, inlayMark['size_y']/2*self.scale_factor), QSizeF(inlayMark['size_x']*self.scale_factor, inlayMark['size_y']*self.scale_factor)))
-                    inlay.setBrush(inlayMark['color'])
-                    if 'pen' in inlayMark.keys():
-                        inlay.setPen(inlayMark['pen'])
-                    self.neck_diagram_inlays_group.addToGroup(inlay)
-            # Side inlays
-            if i in sideInlays[type].keys():
-                for inlayMark in sideInlays[type][i]:
-                    if self.reg_frets_checkbox.isChecked():
-                        x = ((FRET_SPACING*inlayMark['delta_x']) + i * FRET_SPACING)*self.scale_factor
-                    else:
-                        x = 4/3*neck_length - (4/3*neck_length / (2**(i/12)))
-                        nextX = 4/3*neck_length - (4/3*neck_length / (2**((1+i)/12)))
-                        thisFretSpacing = nextX - x
-                        x = (x + ((thisFretSpacing*inlayMark['delta_x']))) * self.scale_factor
-
-                    y = halfNeckHeight + halfNeckHeight*inlayMark['delta_y'] + abs(adjustmentForFret) + lowStringThicknessAllowance
-                    newX = self.transFan(x, y)
-                    point = QPointF(newX, y)
-                    inlay = inlayMark['type'](QRectF(point - QPointF(inlayMark['size_x']/2*self.scale_factor, inlayMark['size_y']/2*self.scale_factor), QSizeF(inlayMark['size_x']*self.scale_factor, inlayMark['size_y']*self.scale_factor)))
-                    inlay.setBrush(inlayMark['color'])
-                    if 'pen' in inlayMark.keys():
-                        inlay.setPen(inlayMark['pen'])
-                    self.neck_diagram_inlays_group.addToGroup(inlay)
+        for inlayMark in compiledInlays(type):
+            i = inlayMark.fret
+            if i >= self.num_frets:
+                continue
+            adjustmentForFret = inlayMark.widening*(NECK_WIDENING*i/self.num_frets)*self.scale_factor
+            x = geometry.position(i) + geometry.spacing(i)*inlayMark.deltaX
+            if inlayMark.side:
+                # Side inlays
+                y = halfNeckHeight + halfNeckHeight*inlayMark.deltaY + adjustmentForFret + lowStringThicknessAllowance
+            else:
+                # Neck Inlays
+                y = halfNeckHeight + halfNeckHeight*inlayMark.deltaY*stringNumbersAdjustmentRatio + adjustmentForFret
+            newX = self.transFan(x, y)
+            point = QPointF(newX, y)
+            inlay = inlayItem(inlayMark, QRectF(point - QPointF(inlayMark.sizeX/2*self.scale_factor, inlayMark.sizeY/2*self.scale_factor), QSizeF(inlayMark.sizeX*self.scale_factor, inlayMark.sizeY*self.scale_factor)))
+            self.neck_diagram_inlays_group.addToGroup(inlay)
 
     def draw_strings(self):
         neck_width  = FRET_SPACING   * (self.num_frets + 1)*self.scale_factor
@@ -494,15 +521,12 @@ class NeckWindow(QDialog):
         string_darkGray_pen = QPen(Qt.darkGray)  # Set the pen color
 
         # Draw strings
-        for i in range(self.num_strings):
-            xBegin = -15*self.scale_factor
-            yBegin = i * STRING_SPACING * self.scale_factor
-            widthAdjustmentProportion = (yBegin-(neck_height/2))/(neck_height/2)
-            xEnd = neck_width
-            yEnd = yBegin+(widthAdjustmentProportion*NECK_WIDENING)
-
-            xBegin = self.transFan(xBegin, yBegin)
-
+        yBegins = np.arange(self.num_strings) * STRING_SPACING * self.scale_factor
+        widthAdjustmentProportions = (yBegins-(neck_height/2))/(neck_height/2)
+        yEnds = yBegins+(widthAdjustmentProportions*NECK_WIDENING)
+        xBegins = self.fan_projection().project(-15*self.scale_factor, yBegins)
+        xEnd = neck_width
+        for (i, xBegin, yBegin, yEnd) in zip(range(self.num_strings), xBegins.tolist(), yBegins.tolist(), yEnds.tolist()):
             line = QGraphicsLineItem(xBegin, yBegin, xEnd, yEnd)
             string_darkGray_pen.setWidth((strings_thickness[i]/10.0)*self.scale_factor)
             line.setPen(string_darkGray_pen)
@@ -517,7 +541,6 @@ class NeckWindow(QDialog):
         if not isinstance(inlaysType, str):
             inlaysType = self.inlays_combobox.currentText()
 
-        neck_width  = FRET_SPACING   * (self.num_frets + 1)*self.scale_factor
         neck_height = STRING_SPACING * (self.num_strings - 1)*self.scale_factor
 
 
@@ -525,10 +548,8 @@ class NeckWindow(QDialog):
 
         self.keepNotesColouringParameters()
         self.identifiedNotes = {each: list() for each in range(12)}
-        self.clear_group(self.neck_diagram_notes_group)
+        self.note_items_pool.release(self.neck_diagram_notes_group.clear())
 
-        adjustmentForString = 0.0
-        adjustmentForFret = 0.0
         noteRadius = (STRING_SPACING / 2.0) *self.scale_factor
         halfNeckHeight = neck_height/2
 
@@ -539,70 +560,62 @@ class NeckWindow(QDialog):
 
         base   = FRET_SPACING * self.scale_factor
         height = neck_height * 20
+        geometry = fretGeometry(self.num_frets, FRET_SPACING, self.scale_factor, self.reg_frets_checkbox.isChecked())
+
+        # only the cells holding a note of the mode are visited,
+        # from low to high strings, then from low to high frets
+        pitches = pitchMatrix(self.currentTuning, self.num_frets, self.first_root_position)
+        strings, frets, semitones = pitches.playableArrays(self.modeMask)
+
+        # coordinates of all the notes at once
+        fan = self.fan_projection()
+        ys = neck_height - (strings * STRING_SPACING*self.scale_factor)
+        adjustmentsForString = (ys-halfNeckHeight)/halfNeckHeight #(for a 6 strings: -1, -0.6, -0.2, 0.2, 0.6, 1)
+        adjustmentsForFret = (frets+.5)/(self.num_frets) #(should go 0 to 1)
+        xs = geometry.midpoints[frets+1]
+        newYs = ys + NECK_WIDENING * (adjustmentsForString * adjustmentsForFret)
+        newXs = fan.project(xs, newYs)
+        # corners of the rectangles of the notes generated by fret 0
+        yTops = newYs - STRING_SPACING*self.scale_factor/2
+        yBots = newYs + STRING_SPACING*self.scale_factor/2
+        xLefts = xs + zeroFretNoteXadjustment
+        xRights = xs + zeroFretNoteXadjustment + noteRadius/2
+        coordinates = (strings, frets, semitones, newXs, newYs, yTops, yBots,
+                       fan.project(xLefts, yTops), fan.project(xRights, yTops),
+                       fan.project(xLefts, yBots), fan.project(xRights, yBots))
+
+        for (i, j, semitone_text, newX, newY, yTop, yBot, xTopLeft, xTopRight, xBotLeft, xBotRight) in zip(*(array.tolist() for array in coordinates)):
+            point = QPointF(newX, newY)
+            if j == -1:
+                # Notes generated by fret 0, shown as rectangles just below fret 0
+                rectangle = QPolygonF()
+                rectangle.append(QPointF(xTopLeft,yTop))
+                rectangle.append(QPointF(xTopRight,yTop))
+                rectangle.append(QPointF(xBotRight,yBot))
+                rectangle.append(QPointF(xBotLeft,yBot))
+                note_point = self.note_items_pool.acquire(fretZeroNoteItem, rectangle)
+
+            elif self.show_root_checkbox.isChecked() and semitone_text % 12 == self.modeScale[0]:
+                # Root Notes potentially shown as triangles
+                triangle = QPolygonF()
+                triangle.append(QPointF(noteRadius, 0))  # Top point
+                triangle.append(QPointF(STRING_SPACING*self.scale_factor, STRING_SPACING*self.scale_factor))  # Bottom right point
+                triangle.append(QPointF(0, STRING_SPACING*self.scale_factor))  # Bottom left point
+                note_point = self.note_items_pool.acquire(TriangleNoteItem, triangle)
+                note_point.setPos(newX - noteRadius, newY - noteRadius)
 
-        # from low to high strings
-        for i in range(self.num_strings):
-            y = neck_height - (i * STRING_SPACING*self.scale_factor)
-            adjustmentForString = (y-halfNeckHeight)/halfNeckHeight #(for a 6 strings: -1, -0.6, -0.2, 0.2, 0.6, 1)
-            # from low to high frets
-            for j in range(-1, self.num_frets):
-                if self.reg_frets_checkbox.isChecked():
-                    x = (j * FRET_SPACING*self.scale_factor) + (FRET_SPACING*self.scale_factor / 2.0)
-                else:
-                    x = 4/3*neck_width - (4/3*neck_width / (2**(j/12)))
-                    nextX = 4/3*neck_width - (4/3*neck_width / (2**((1+j)/12)))
-                    thisFretSpacing = nextX - x
-                    x = x + ((thisFretSpacing / 2.0))
-
-                adjustmentForFret = (j+.5)/(self.num_frets) #(should go 0 to 1)
-                semitone_text = (self.currentTuning[i] + j) - self.first_root_position
-                if semitone_text % 12 in self.modeScale:
-                    adjustment = adjustmentForString * adjustmentForFret
-                    pixAdjustment = NECK_WIDENING * adjustment
-
-                    newY = y + pixAdjustment
-                    newX = self.transFan(x, newY)
-
-                    point = QPointF(newX, newY)
-                    if j == -1:
-                        # Notes generated by fret 0, shown as rectangles just below fret 0
-                        yTop = newY - STRING_SPACING*self.scale_factor/2
-                        yBot = newY + STRING_SPACING*self.scale_factor/2
-                        xLeft = x + zeroFretNoteXadjustment
-                        xRight = x + zeroFretNoteXadjustment + noteRadius/2
-                        xTopLeft = self.transFan(xLeft, yTop)
-                        xTopRight = self.transFan(xRight, yTop)
-                        xBotLeft = self.transFan(xLeft, yBot)
-                        xBotRight = self.transFan(xRight, yBot)
-                        rectangle = QPolygonF()
-                        rectangle.append(QPointF(xTopLeft,yTop))
-                        rectangle.append(QPointF(xTopRight,yTop))
-                        rectangle.append(QPointF(xBotRight,yBot))
-                        rectangle.append(QPointF(xBotLeft,yBot))
-                        note_point = fretZeroNoteItem(rectangle, embeddingWidget=self)
-
-                    elif self.show_root_checkbox.isChecked() and semitone_text % 12 == self.modeScale[0]:
-                        # Root Notes potentially shown as triangles
-                        triangle = QPolygonF()
-                        triangle.append(QPointF(noteRadius, 0))  # Top point
-                        triangle.append(QPointF(STRING_SPACING*self.scale_factor, STRING_SPACING*self.scale_factor))  # Bottom right point
-                        triangle.append(QPointF(0, STRING_SPACING*self.scale_factor))  # Bottom left point
-                        note_point = TriangleNoteItem(triangle, embeddingWidget=self)
-                        note_point.setPos(newX - noteRadius, newY - noteRadius)
-
-                    else:
-                        # playable Notes shown as cercles
-                        note_point = NoteItem(QRectF(point - QPointF(noteRadius, noteRadius), QSizeF(STRING_SPACING*self.scale_factor, STRING_SPACING*self.scale_factor)), embeddingWidget=self)
+            else:
+                # playable Notes shown as cercles
+                note_point = self.note_items_pool.acquire(NoteItem, QRectF(point - QPointF(noteRadius, noteRadius), QSizeF(STRING_SPACING*self.scale_factor, STRING_SPACING*self.scale_factor)))
 
-                    note_point.note = semitone_text%12
-                    note_point.setPen(QPen(Qt.transparent))
-                    self.identifiedNotes[semitone_text % 12].append([note_point, semitone_text, i, j])
+            note_point.note = semitone_text%12
+            note_point.setPen(QPen(Qt.transparent))
+            self.identifiedNotes[semitone_text % 12].append([note_point, semitone_text, i, j])
 
-                    self.neck_diagram_notes_group.addToGroup(note_point)
+            self.neck_diagram_notes_group.addToGroup(note_point)
         self.color_notes_by_default()
         self.applyNotesColouringParameters()
-        if self.neck_diagram_notes_group not in self.neck_scene.items():
-            self.neck_scene.addItem(self.neck_diagram_notes_group)
+        self.neck_diagram_notes_group.addToScene(self.neck_scene)
         if self.once:
             self.once = False
         else:
@@ -623,7 +636,7 @@ class NeckWindow(QDialog):
         font.setPointSize(.8*(STRING_SPACING*self.scale_factor))
         brush = QBrush(Qt.white, bs=Qt.SolidPattern)
 
-        self.clear_group(self.neck_diagram_tuning_group)
+        self.neck_diagram_tuning_group.clear()
 
         referenceVFrame = self.mainWindowInstance.degreesFrames[0]
         colourCorrection = self.scale[referenceVFrame.degreeIndex]-self.scale[self.modeIndex]
@@ -651,17 +664,18 @@ class NeckWindow(QDialog):
             text_item = QGraphicsSimpleTextItem(note_text)
             text_item.setFont(font)
             text_item.setPos(point - QPointF(text_item.boundingRect().width()/2.0, text_item.boundingRect().height()/2.0))
-            text_item.setFlags(QGraphicsItem.ItemIgnoresTransformations)
 
             self.neck_diagram_tuning_group.addToGroup(text_item)
 
     def label_degrees_on_neck(self):
-        neck_width  = FRET_SPACING   * (self.num_frets + 1)*self.scale_factor
         neck_height = STRING_SPACING*self.scale_factor * (self.num_strings - 1)
 
         self.identifiedDegrees = {each: list() for each in range(12)}
-        self.clear_group(self.neck_diagram_degrees_group)
-        self.clear_group(self.neck_diagram_colours_group)
+        self.neck_diagram_degrees_group.clear()
+        self.note_items_pool.release(self.neck_diagram_colours_group.clear())
+        # colour rectangles of a previous labelling are recycled, forget them
+        for semitone_on_octave in self.identifiedNotes.keys():
+            self.identifiedNotes[semitone_on_octave] = [identifiedNote for identifiedNote in self.identifiedNotes[semitone_on_octave] if identifiedNote[2] != -1]
 
         font = QFont()
         font.setFamily(FONT)
@@ -669,39 +683,34 @@ class NeckWindow(QDialog):
 
         brush = QBrush(Qt.white, bs=Qt.SolidPattern)
 
-        # Label for used Degrees in arrangement
-        for j in range(-1, self.num_frets):
-            if self.reg_frets_checkbox.isChecked():
-                x = (FRET_SPACING*self.scale_factor/2.0) + j * FRET_SPACING*self.scale_factor
-            else:
-                x = 4/3*neck_width - (4/3*neck_width / (2**(j/12)))
-                nextX = 4/3*neck_width - (4/3*neck_width / (2**((1+j)/12)))
-                thisFretSpacing = nextX - x
-                x = x + ((thisFretSpacing / 2.0))
-
-            y = neck_height + 2.1 * STRING_SPACING*self.scale_factor
-
-            yTop = y - STRING_SPACING/2*self.scale_factor
-            yBot = y + STRING_SPACING/2*self.scale_factor
-            xLeft = x-FRET_SPACING/2*self.scale_factor
-            xRight = x+FRET_SPACING/2*self.scale_factor
+        # semitones of the lowest string, from fret 0 (-1) to the last fret
+        lowStringSemitones = pitchMatrix(self.currentTuning, self.num_frets, self.first_root_position).semitones[0].tolist()
 
-            if not self.reg_frets_checkbox.isChecked():
-                if j==-1:
-                    xLeft = x
-                else:
-                    xLeft = x - thisFretSpacing/2.0
-                #print('xleft: %s'%xLeft)
-                xRight = x+thisFretSpacing/2.0
-
-            xTopLeft = self.transFan(xLeft, yTop)
-            xTopRight = self.transFan(xRight, yTop)
-            xBotLeft = self.transFan(xLeft, yBot)
-            xBotRight = self.transFan(xRight, yBot)
+        # coordinates of the labels and their coloured rectangles, for frets -1 to the last one
+        geometry = fretGeometry(self.num_frets, FRET_SPACING, self.scale_factor, self.reg_frets_checkbox.isChecked())
+        y = neck_height + 2.1 * STRING_SPACING*self.scale_factor
+        yTop = y - STRING_SPACING/2*self.scale_factor
+        yBot = y + STRING_SPACING/2*self.scale_factor
+        xs = geometry.midpoints[:self.num_frets+1]
+        if self.reg_frets_checkbox.isChecked():
+            xLefts = xs-FRET_SPACING/2*self.scale_factor
+            xRights = xs+FRET_SPACING/2*self.scale_factor
+        else:
+            thisFretSpacings = geometry.spacings[:self.num_frets+1]
+            xLefts = xs - thisFretSpacings/2.0
+            xLefts[0] = xs[0]
+            xRights = xs+thisFretSpacings/2.0
             # better position first label in-f any
-            if not self.reg_frets_checkbox.isChecked() and j==-1:
-                x = xLeft + (xRight - xLeft)/2.0
-            xLabel = self.transFan(x, y)
+            xs = xs.copy()
+            xs[0] = xLefts[0] + (xRights[0] - xLefts[0])/2.0
+        fan = self.fan_projection()
+        coordinates = (fan.project(xLefts, yTop), fan.project(xRights, yTop),
+                       fan.project(xLefts, yBot), fan.project(xRights, yBot),
+                       fan.project(xs, y))
+
+        # Label for used Degrees in arrangement
+        for (j, xTopLeft, xTopRight, xBotLeft, xBotRight, xLabel) in zip(range(-1, self.num_frets), *(array.tolist() for array in coordinates)):
+            semitone = lowStringSemitones[j+1]
 
             rectangle = QPolygonF()
             rectangle.append(QPointF(xTopLeft,yTop))
@@ -709,11 +718,11 @@ class NeckWindow(QDialog):
             rectangle.append(QPointF(xBotRight,yBot))
             rectangle.append(QPointF(xBotLeft,yBot))
 
-            colorect = fretZeroNoteItem(rectangle, embeddingWidget=self)
+            colorect = self.note_items_pool.acquire(fretZeroNoteItem, rectangle)
 
             referenceVFrame = self.mainWindowInstance.degreesFrames[0]
             colourCorrection = self.scale[referenceVFrame.degreeIndex]-self.scale[self.modeIndex]
-            colourAngle = ((self.currentTuning[0] + j - self.first_root_position - colourCorrection)*math.pi/6.0)
+            colourAngle = ((semitone - colourCorrection)*math.pi/6.0)
 
             brush.setColor(referenceVFrame.generate_colour_for_angle(colourAngle, includeRotation=True, colours=customColours[self.colour_degrees]))
             colorect.setBrush(brush)
@@ -721,19 +730,17 @@ class NeckWindow(QDialog):
 
             self.neck_diagram_colours_group.addToGroup(colorect)
 
-            semitone = (self.currentTuning[0] + j) - self.first_root_position
             colorect.note = semitone%12
             self.identifiedNotes[semitone%12].append([colorect, semitone, -1, j])
-            if (semitone%12 in self.modeScale) and (self.first_root_position <= j <= self.num_frets - self.first_root_position):
+            if maskContains(self.modeMask, semitone) and (self.first_root_position <= j <= self.num_frets - self.first_root_position):
                 #print("j: %s"%j)
                 point = QPointF(xLabel, y+3)
 
                 # Creation of label object for the note
-                degreeLabel = degrees[(self.modeScale.index(semitone%12))%self.scaleLength]
+                degreeLabel = degrees[degreeIndex(self.modeMask, semitone)%self.scaleLength]
                 text_item = QGraphicsSimpleTextItem(degreeLabel)
                 text_item.setFont(font)
                 text_item.setPos(point - QPointF(text_item.boundingRect().width()/2.0, text_item.boundingRect().height()/2.0))
-                text_item.setFlags(QGraphicsItem.ItemIgnoresTransformations)
                 # We add the label object to the record of the note
                 self.identifiedDegrees[semitone%12].append([text_item, semitone, 0, j])
 
@@ -741,44 +748,17 @@ class NeckWindow(QDialog):
 
         self.color_degrees(firstOnly=False)
 
-        if self.neck_diagram_colours_group not in self.neck_scene.items():
-            self.neck_scene.addItem(self.neck_diagram_colours_group)
-        if self.neck_diagram_degrees_group not in self.neck_scene.items():
-            self.neck_scene.addItem(self.neck_diagram_degrees_group)
+        self.neck_diagram_colours_group.addToScene(self.neck_scene)
+        self.neck_diagram_degrees_group.addToScene(self.neck_scene)
         self.center_neck_view()
 
 # -----------------------------------------------------------------------------
 
-    def clear_group(self, group):
-        '''
-        remove all the item from a group and remove the group from the scene
-        '''
-        for item in group.childItems():
-            if item in self.neck_scene.items():
-                self.neck_scene.removeItem(item)
-            group.removeFromGroup(item)
-        if group in self.neck_scene.items():
-            self.neck_scene.removeItem(group)
-
     def keepNotesColouringParameters(self):
-        self.notesColouringParameters = dict()
-        for semitone_on_octave in self.identifiedNotes.keys():
-            self.notesColouringParameters[semitone_on_octave] = list()
-            for (note, semitone, i, j) in self.identifiedNotes[semitone_on_octave]:
-                continuouslyColoured = note.continuouslyColoured
-                originalColour = note.originalColour
-                colour = note.colour
-                self.notesColouringParameters[semitone_on_octave].append((semitone, i, j, continuouslyColoured, originalColour, colour))
+        self.notes_colouring_store.keep(self.identifiedNotes)
 
     def applyNotesColouringParameters(self):
-        for semitone_on_octave in self.identifiedNotes.keys():
-            for (note, semitone, i, j) in self.identifiedNotes[semitone_on_octave]:
-                if semitone_on_octave in self.notesColouringParameters.keys():
-                    for (semitone_old, i_old, j_old, continuouslyColoured, originalColour, colour) in self.notesColouringParameters[semitone_on_octave]:
-                        if semitone==semitone_old and i==i_old and j==j_old:
-                            note.continuouslyColoured = continuouslyColoured
-                            note.originalColour = originalColour
-                            note.colour = colour
+        self.notes_colouring_store.apply(self.identifiedNotes)
 
     def color_notes_by_default(self):
         transblack = QColor(Qt.black)
@@ -793,7 +773,7 @@ class NeckWindow(QDialog):
             first = True
             for (text_item, semitone_text, string, fret) in self.identifiedDegrees[semiTone]:
                 if first:
-                    currentRelativeDegree = ((self.modeScale.index(semiTone))%self.scaleLength) + 1
+                    currentRelativeDegree = (degreeIndex(self.modeMask, semiTone)%self.scaleLength) + 1
                     if (currentRelativeDegree in self.currentArrangement):
                         text_item.setBrush(Qt.white)
                         text_item.setPen(white_pen)
@@ -820,10 +800,10 @@ class NeckWindow(QDialog):
         # Get the bounding rectangle of all items in the scene
         rect = self.neck_scene.itemsBoundingRect()
         # Calculate the center point of the bounding rectangle
-        self.setFixedSize(self.width(), (480 + (self.num_strings-6)*STRING_SPACING)*self.scale_factor)
+        self.setFixedSize(self.width(), (480 + (self.num_strings-6)*STRING_SPACING)*self.scale_factor*self.zoom)
         center = rect.center()
-        # Get the size of the viewport
-        view_size = self.neck_graphics_view.viewport().size()
+        # Get the size of the viewport, in scene units
+        view_size = QSizeF(self.neck_graphics_view.viewport().size())/self.zoom
         # Calculate the new position for the scene
         scene_pos = center - QPointF(view_size.width() / 2, view_size.height() / 2)
         # Set the new position for the scene
@@ -833,6 +813,16 @@ class NeckWindow(QDialog):
     def keyPressEvent(self, event):
         self.mainWindowInstance.keyPressEvent(event)
 
+    def set_zoom(self, zoom):
+        '''
+        Zooms the view over the neck drawn at scale_factor, without redrawing it
+        '''
+        self.zoom = zoom
+        self.neck_graphics_view.setTransform(QTransform.fromScale(zoom, zoom))
+        zoomFonts(self, zoom)
+        self.setFixedSize(1500*self.scale_factor*zoom, self.height())
+        self.center_neck_view()
+
     def refresh(self, scale_factor=1.0):
         self.scale_factor = scale_factor
         padding = 15
@@ -842,7 +832,6 @@ class NeckWindow(QDialog):
         self.draw_neck()
         self.mainVBoxLayout.update()
         self.update()
-        self.center_neck_view()
 
     def closeEvent(self, event):
         self.mainWindowInstance.full_neck_radioButton.setChecked(False)
@@ -865,7 +854,52 @@ class NeckWindow(QDialog):
 # -----------------------------------------------------------------------------
 # -----------------------------------------------------------------------------
 
+@lru_cache(maxsize=NECK_BACKGROUNDS_CACHE_SIZE)
+def neckBackgroundPicture(tuning, num_frets, scale_factor):
+    '''
+    (QPicture, bounds) of the strings and frets of the neck of the degree
+    frames, recorded once for all the frames showing tuning with num_frets
+    at scale_factor. The bounds are the ones line items would have: their
+    lines widened by half their pen width, square caps included
+    '''
+    num_strings = len(tuning)
+    neck_width = FRET_SPACING * (num_frets + 1) *scale_factor
+    neck_height = STRING_SPACING * (num_strings - 1) *scale_factor
+    strings_thickness = stringSets[stringGaugeFromNumberOfString[num_strings]]
+
+    picture = QPicture()
+    painter = QPainter(picture)
+    bounds = QRectF()
+
+    # Draw strings
+    darkGray_pen = QPen(Qt.darkGray)  # Set the pen color
+    for i in range(num_strings):
+        y = i * STRING_SPACING *scale_factor
+        darkGray_pen.setWidth((strings_thickness[i]/10.0)*scale_factor)
+        painter.setPen(darkGray_pen)
+        painter.drawLine(QLineF(0, y, neck_width, y))
+        margin = darkGray_pen.widthF()/2
+        bounds |= QRectF(0, y, neck_width, 0).adjusted(-margin, -margin, margin, margin)
+
+    # Draw frets
+    darkGray_pen = QPen(Qt.darkGray)  # Set the pen color
+    darkGray_pen.setWidth(3*scale_factor)      # Set the pen width
+    painter.setPen(darkGray_pen)
+    margin = darkGray_pen.widthF()/2
+    geometry = fretGeometry(num_frets, FRET_SPACING, scale_factor, True)
+    for i in range(1, num_frets + 1):
+        x = geometry.position(i)
+        painter.drawLine(QLineF(x, -5*scale_factor, x, neck_height+(5*scale_factor)))
+        bounds |= QRectF(x, -5*scale_factor, 0, neck_height+(10*scale_factor)).adjusted(-margin, -margin, margin, margin)
+
+    painter.end()
+    return picture, bounds
+
+# -----------------------------------------------------------------------------
+
 class CircleAndNeckVBoxFrame(QFrame):
+    render_order = 0
+
     def __init__(self, topApp, degree=1, visible=False, name="frame0", scale_factor=1.0):
         super().__init__()
 
@@ -873,6 +907,7 @@ class CircleAndNeckVBoxFrame(QFrame):
         self.topApp = topApp
         self.name = name
         self.scale_factor = scale_factor
+        self.zoom = 1.0
 
         self.once = True
         self.minimumNumberLowerStringsNumber = 4
@@ -891,12 +926,14 @@ class CircleAndNeckVBoxFrame(QFrame):
 
         self.scaleName = ""
         self.shownScale = list()
+        self.shownMask = 0
         self.scaleLength = 0
         self.notesOnCircle = {}
 
         self.modeIndex = 0
         self.modeRotation = 0
         self.modeScale = list()
+        self.modeMask = 0
 
         self.colour_degrees = self.topApp.colour_degrees
 
@@ -908,9 +945,13 @@ class CircleAndNeckVBoxFrame(QFrame):
 
         self.chordIndex = 0
         self.chord_positions = list()
+        self.chord_voicings = iter(())
+        self.chord_positions_source = None
 
-        # Draw circle and guitar neck backgrounds
-        self.draw_scale_circle()
+        # Layers to redraw once the frame is shown
+        self.pending_layers = set()
+        # (tuning, num_frets, scale_factor) of the neck background shown
+        self.neckBackground = None
 
         # Initialisation
         self.set_tuning("Standard 6 \tEADGBE", init=True)
@@ -1020,14 +1061,18 @@ class CircleAndNeckVBoxFrame(QFrame):
 
     def create_graphic_item_groups(self):
         # Groups to hold graphical parts such as general background, note points, line items and center pivot
-        self.scale_circle_background = QGraphicsItemGroup()
-        self.notes_group = QGraphicsItemGroup()
+        self.scale_circle_background = LayerGroup()
+        self.notes_group = LayerGroup()
         self.notes_group.setHandlesChildEvents(False)
-        self.scale_circle_background_group = QGraphicsItemGroup()
-        self.scale_circle_center_group = QGraphicsItemGroup()
-        self.neck_diagram_background_group = QGraphicsItemGroup()
-        self.neck_diagram_notes_group = QGraphicsItemGroup()
+        self.scale_circle_background_group = LayerGroup()
+        self.scale_circle_center_group = LayerGroup()
+        self.neck_diagram_background_group = LayerGroup()
+        self.neck_diagram_notes_group = LayerGroup()
         self.neck_diagram_notes_group.setHandlesChildEvents(False)
+        # Note items of cleared groups, reused by the next drawing
+        self.note_items_pool = NoteItemPool(self)
+        # Colours the notes sharing the pitch class of a hovered note
+        self.note_highlighter = NoteHighlighter(self)
 
 # -----------------------------------------------------------------------------
 
@@ -1047,20 +1092,20 @@ class CircleAndNeckVBoxFrame(QFrame):
         self.scaleName = scale_name
         self.shownScale = scales[self.scaleName]
         self.modeScale = scales[self.scaleName]
+        self.shownMask = scaleToMask(self.shownScale)
+        self.modeMask = self.shownMask
         self.scaleLength = len(self.shownScale)
         # and set back degree and mode
         self.set_mode(modeIndex)
         self.set_degree((degreeIndex-modeIndex)%self.scaleLength)
 
-        self.draw_scale()
-        self.draw_notes_on_neck()
+        self.invalidate("scale")
 
     def set_tuning(self, tuning_name, init=False):
         self.currentTuning = tunings[tuning_name]
         self.currentTuningName = tuning_name
         if not init:
-            self.draw_notes_on_neck()
-            self.show_chord()
+            self.invalidate("tuning")
 
     def set_degree(self, degreeIndex, movingRef=False):
         if not movingRef:
@@ -1068,26 +1113,12 @@ class CircleAndNeckVBoxFrame(QFrame):
         currentDegreeIndex = self.degreeIndex
         self.degreeIndex = degreeIndex
 
-        # keep current selected chord if any
-        self.chordBeforeChange = self.chords_combobox.currentText()
-
-        if currentDegreeIndex > degreeIndex:
-            for i in range(currentDegreeIndex - degreeIndex):
-                self.shownScale = self.rotate_notes(-1, self.shownScale)
-                self.degreeRotation = (self.degreeRotation-1)%self.scaleLength
-        elif currentDegreeIndex < degreeIndex:
-            for i in range(degreeIndex-currentDegreeIndex):
-                self.shownScale = self.rotate_notes(1, self.shownScale)
-                self.degreeRotation = (self.degreeRotation+1)%self.scaleLength
-        else:
-            pass
-        self.draw_scale()
-        self.draw_notes_on_neck()
-
-        # set back selected chord if any and available
-        for index in range(self.chords_combobox.count()):
-            if self.chordBeforeChange == self.chords_combobox.itemText(index):
-                self.chords_combobox.setCurrentIndex(index)
+        # a single table lookup whatever the number of degrees to rotate
+        if currentDegreeIndex != degreeIndex:
+            self.shownMask = rotateMask(self.shownMask, degreeIndex-currentDegreeIndex)
+            self.shownScale = maskToScale(self.shownMask)
+            self.degreeRotation = (self.degreeRotation+degreeIndex-currentDegreeIndex)%self.scaleLength
+        self.invalidate("degree")
 
     def set_mode(self, modeIndex):
         deltaDegreeToMode = (self.degreeIndex)-(self.modeIndex)
@@ -1096,18 +1127,56 @@ class CircleAndNeckVBoxFrame(QFrame):
         currentModeIndex = self.modeIndex
         self.modeIndex = modeIndex
 
-        if currentModeIndex > modeIndex:
-            for i in range(currentModeIndex - modeIndex):
-                self.modeScale = self.rotate_notes(-1, self.modeScale)
-                self.modeRotation = (self.modeRotation-1)%self.scaleLength
-        elif currentModeIndex < modeIndex:
-            for i in range(modeIndex-currentModeIndex):
-                self.modeScale = self.rotate_notes(1, self.modeScale)
-                self.modeRotation = (self.modeRotation+1)%self.scaleLength
-        else:
-            pass
+        if currentModeIndex != modeIndex:
+            self.modeMask = rotateMask(self.modeMask, modeIndex-currentModeIndex)
+            self.modeScale = maskToScale(self.modeMask)
+            self.modeRotation = (self.modeRotation+modeIndex-currentModeIndex)%self.scaleLength
         self.set_degree(CurrentDegreeToSet, movingRef=True)
 
+    def invalidate(self, *layers):
+        self.topApp.render_scheduler.invalidate(self, *layers)
+
+    def render_layers(self, layers):
+        '''
+        Redraws the layers marked as dirty since the last render pass: the
+        circle for a new scale, degree or colours, the neck for these or a new
+        tuning, the chords for all of them, showing again the selected chord
+        if still available. A frame not shown yet keeps its dirty layers to
+        be drawn once when it is first displayed
+        '''
+        if not self.isVisible():
+            self.pending_layers.update(layers)
+            return
+        layers = layers | self.pending_layers
+        self.pending_layers = set()
+        # keep current selected chord if any, by its semitones since its
+        # name starts with the note of the degree
+        chordBeforeChange = self.chords_combobox.currentData()
+        if layers & CIRCLE_LAYERS:
+            # lists the chords of the mode too
+            self.draw_scale()
+            self.center_scale_view()
+        elif "chords" in layers:
+            self.get_chords_in_mode()
+        if layers & FRAME_NECK_LAYERS:
+            self.draw_notes_on_neck()
+        self.select_chord(chordBeforeChange)
+
+    def select_chord(self, chord):
+        '''
+        Shows the chord of semitones chord on the neck, if available
+        '''
+        index = self.chords_combobox.findData(chord)
+        if index < 0 or index == self.chords_combobox.currentIndex():
+            self.show_chord()
+            return
+        self.chords_combobox.setCurrentIndex(index)
+
+    def showEvent(self, event):
+        if self.pending_layers:
+            self.render_layers(set())
+        super().showEvent(event)
+
 
 # -----------------------------------------------------------------------------
 
@@ -1123,8 +1192,7 @@ class CircleAndNeckVBoxFrame(QFrame):
         scale_circle.setBrush(Qt.white)
         scale_circle.setPen(pen)
         self.scale_circle_background_group.addToGroup(scale_circle)
-        if self.scale_circle_background_group not in self.circle_scene.items():
-            self.circle_scene.addItem(self.scale_circle_background_group)
+        self.scale_circle_background_group.addToScene(self.circle_scene)
 
     def draw_scale_circle_center(self):
         center = QPointF(0, 0)
@@ -1147,15 +1215,11 @@ class CircleAndNeckVBoxFrame(QFrame):
         scale_circle.setBrush(Qt.white)
         scale_circle.setPen(pen)
         self.scale_circle_center_group.addToGroup(scale_circle)
-        if self.scale_circle_center_group not in self.circle_scene.items():
-            self.circle_scene.addItem(self.scale_circle_center_group)
+        self.scale_circle_center_group.addToScene(self.circle_scene)
 
     def draw_scale(self):
         scale = self.shownScale
-        if tuple(scale) in modes.keys():
-            self.modeName = modes[tuple(scale)]
-        else:
-            self.modeName = ""
+        self.modeName = modeName(self.shownMask)
         DegreeLabel = degrees[self.degreeRotation-self.modeRotation]
         labelContent = DegreeLabel + " / " + self.modeName
         self.labelModeName.setText(labelContent)
@@ -1174,9 +1238,9 @@ class CircleAndNeckVBoxFrame(QFrame):
         pen = QPen(Qt.black)  # Set the pen color
         pen.setWidth(2*self.scale_factor)      # Set the pen width
 
-        self.clear_group(self.notes_group)
-        self.clear_group(self.scale_circle_center_group)
-        self.clear_group(self.scale_circle_background_group)
+        self.note_items_pool.release(self.notes_group.clear())
+        self.scale_circle_center_group.clear()
+        self.scale_circle_background_group.clear()
 
         self.draw_scale_circle()
 
@@ -1199,7 +1263,7 @@ class CircleAndNeckVBoxFrame(QFrame):
             self.notes_group.addToGroup(line_item)
 
             # Draw note point
-            note_point = NoteItem(QRectF(point - QPointF(noteSize/2.0, noteSize/2.0), QSizeF(noteSize, noteSize)), embeddingWidget=self)
+            note_point = self.note_items_pool.acquire(NoteItem, QRectF(point - QPointF(noteSize/2.0, noteSize/2.0), QSizeF(noteSize, noteSize)))
             note_point.note = note
             note_point.angle = angle
             note_colour = self.color_for_angle(angle, mode=self.colour_degrees)
@@ -1211,42 +1275,25 @@ class CircleAndNeckVBoxFrame(QFrame):
 
             self.notesOnCircle[note].append((note_point, line_item, note_colour))
 
-        if self.notes_group not in self.circle_scene.items():
-            self.circle_scene.addItem(self.notes_group)
+        self.notes_group.addToScene(self.circle_scene)
 
         self.draw_scale_circle_center()
         self.get_chords_in_mode()
 
     def draw_neck_background(self):
-        neck_width = FRET_SPACING * (self.num_frets + 1) *self.scale_factor
-        neck_height = STRING_SPACING * (self.num_strings - 1) *self.scale_factor
-        strings_thickness = stringSets[stringGaugeFromNumberOfString[self.num_strings]]
-
-        self.clear_group(self.neck_diagram_background_group)
-
-        # Draw strings
-        darkGray_pen = QPen(Qt.darkGray)  # Set the pen color
-        darkGray_pen.setWidth(1*self.scale_factor)      # Set the pen width
-
-        for i in range(self.num_strings):
-            y = i * STRING_SPACING *self.scale_factor
-            line = QGraphicsLineItem(0, y, neck_width, y)
-            darkGray_pen.setWidth((strings_thickness[i]/10.0)*self.scale_factor)
-            line.setPen(darkGray_pen)
-            self.neck_diagram_background_group.addToGroup(line)
-
-        # Draw frets
-        darkGray_pen = QPen(Qt.darkGray)  # Set the pen color
-        darkGray_pen.setWidth(3*self.scale_factor)      # Set the pen width
-
-        for i in range(1, self.num_frets + 1):
-            x = i * FRET_SPACING*self.scale_factor
-            line = QGraphicsLineItem(x, -5*self.scale_factor, x, neck_height+(5*self.scale_factor))
-            line.setPen(darkGray_pen)
-            self.neck_diagram_background_group.addToGroup(line)
-
-        if self.neck_diagram_background_group not in self.neck_scene.items():
-            self.neck_scene.addItem(self.neck_diagram_background_group)
+        '''
+        Strings and frets, as an item replaying the picture shared by the
+        frames with the same tuning, number of frets and scale_factor. Kept
+        as is while these do not change
+        '''
+        neckBackground = (tuple(self.currentTuning), self.num_frets, self.scale_factor)
+        if neckBackground == self.neckBackground and self.neck_diagram_background_group.scene() is self.neck_scene:
+            return
+        self.neckBackground = neckBackground
+        self.neck_diagram_background_group.clear()
+        picture, bounds = neckBackgroundPicture(*neckBackground)
+        self.neck_diagram_background_group.addToGroup(PictureItem(picture, bounds))
+        self.neck_diagram_background_group.addToScene(self.neck_scene)
 
     def draw_notes_on_neck(self):
         if self.once:
@@ -1264,64 +1311,60 @@ class CircleAndNeckVBoxFrame(QFrame):
         self.identifiedNotes = {each: list() for each in range(12)}
         self.identifiedNoteTexts = {each: list() for each in range(12)}
 
-        self.clear_group(self.neck_diagram_notes_group)
+        self.note_items_pool.release(self.neck_diagram_notes_group.clear())
 
         font = QFont()
         font.setFamily(FONT)
         font.setPointSize(.95*(STRING_SPACING - 15)*self.scale_factor)
 
-        # from low to high strings
-        for i in range(self.num_strings):
+        # only the cells holding a note of the scale are visited,
+        # from low to high strings, then from low to high frets
+        pitches = pitchMatrix(self.currentTuning, self.num_frets, 2, firstFret=1)
+        geometry = fretGeometry(self.num_frets, FRET_SPACING, self.scale_factor, True)
+        for (i, j, semitone_text) in pitches.playablePositions(self.shownMask):
             y = (neck_height - (i * STRING_SPACING)*self.scale_factor)
-            # from low to high frets
-            for j in range(1, self.num_frets):
-                x = ((FRET_SPACING/2.0) + j * FRET_SPACING)*self.scale_factor
-                semitone_text = (self.currentTuning[i] + j) -2
-                # If the value in semi-tone modulo 12 (whatever the octave) is part of the scale
-                if semitone_text%12 in self.shownScale:
-                    point = QPointF(x, y)
-                    # If the note is the root note, let's plot a triangle
-                    half_string_spacing = (STRING_SPACING/2.0)*self.scale_factor
-                    string_spacing = STRING_SPACING*self.scale_factor
-                    if semitone_text%12 == 0:
-                        triangle = QPolygonF()
-                        triangle.append(QPointF(half_string_spacing, 0))  # Top point
-                        triangle.append(QPointF(string_spacing, string_spacing))  # Bottom right point
-                        triangle.append(QPointF(0, string_spacing))  # Bottom left point
-                        note_point = TriangleNoteItem(triangle, embeddingWidget=self)
-                        note_point.setPos(x-half_string_spacing, y-half_string_spacing)
-                    # else, let's plot a simple circle
-                    else:
-                        note_point = NoteItem(QRectF(point - QPointF(half_string_spacing, half_string_spacing), QSizeF(string_spacing, string_spacing)), embeddingWidget=self)
-                    # We record the symbol object, its note value and string and fret positions by note semi-tone value in the scale
-                    note_point.note = semitone_text%12
-                    note_point.colour = self.notesOnCircle[note_point.note][0][2]
-                    self.identifiedNotes[semitone_text%12].append([note_point, semitone_text, i, j])
-                    self.neck_diagram_notes_group.addToGroup(note_point)
-
-                    # Generation of label for the note
-                    note_number = (1+self.shownScale.index((semitone_text%12)))
-                    alteration = self.shownScale[note_number-1] - self.referenceScale[note_number-1]
-                    note_value = self.noteValues[note_number-1]
-                    if semitone_text > 12 and note_value%2 == 0:
-                        note_value+=7
-
-                    # Creation of label object for the note
-                    text_item = QGraphicsSimpleTextItem("%s"%(alterations[alteration]+str(note_value)))
-                    text_item.setFont(font)
-                    if semitone_text%12 == 0:
-                        point = QPointF(x, y+5)
-                    text_item.setPos(point - QPointF(text_item.boundingRect().width()/2.0, text_item.boundingRect().height()/2.0))
-                    text_item.setFlags(QGraphicsItem.ItemIgnoresTransformations)
-                    text_item.setFont(font)
-                    # We add the label object to the record of the note
-                    self.identifiedNotes[semitone_text%12][-1].append(text_item)
-                    self.neck_diagram_notes_group.addToGroup(text_item)
+            x = geometry.midpoint(j)
+            point = QPointF(x, y)
+            # If the note is the root note, let's plot a triangle
+            half_string_spacing = (STRING_SPACING/2.0)*self.scale_factor
+            string_spacing = STRING_SPACING*self.scale_factor
+            if semitone_text%12 == 0:
+                triangle = QPolygonF()
+                triangle.append(QPointF(half_string_spacing, 0))  # Top point
+                triangle.append(QPointF(string_spacing, string_spacing))  # Bottom right point
+                triangle.append(QPointF(0, string_spacing))  # Bottom left point
+                note_point = self.note_items_pool.acquire(TriangleNoteItem, triangle)
+                note_point.setPos(x-half_string_spacing, y-half_string_spacing)
+            # else, let's plot a simple circle
+            else:
+                note_point = self.note_items_pool.acquire(NoteItem, QRectF(point - QPointF(half_string_spacing, half_string_spacing), QSizeF(string_spacing, string_spacing)))
+            # We record the symbol object, its note value and string and fret positions by note semi-tone value in the scale
+            note_point.note = semitone_text%12
+            note_point.colour = self.notesOnCircle[note_point.note][0][2]
+            self.identifiedNotes[semitone_text%12].append([note_point, semitone_text, i, j])
+            self.neck_diagram_notes_group.addToGroup(note_point)
+
+            # Generation of label for the note
+            note_number = 1+degreeIndex(self.shownMask, semitone_text)
+            alteration = self.shownScale[note_number-1] - self.referenceScale[note_number-1]
+            note_value = self.noteValues[note_number-1]
+            if semitone_text > 12 and note_value%2 == 0:
+                note_value+=7
+
+            # Creation of label object for the note
+            text_item = QGraphicsSimpleTextItem("%s"%(alterations[alteration]+str(note_value)))
+            text_item.setFont(font)
+            if semitone_text%12 == 0:
+                point = QPointF(x, y+5)
+            text_item.setPos(point - QPointF(text_item.boundingRect().width()/2.0, text_item.boundingRect().height()/2.0))
+            text_item.setFont(font)
+            # We add the label object to the record of the note
+            self.identifiedNotes[semitone_text%12][-1].append(text_item)
+            self.neck_diagram_notes_group.addToGroup(text_item)
 
         self.color_notes_by_default()
 
-        if self.neck_diagram_notes_group not in self.neck_scene.items():
-            self.neck_scene.addItem(self.neck_diagram_notes_group)
+        self.neck_diagram_notes_group.addToScene(self.neck_scene)
 
         if self.once:
             self.once = False
@@ -1332,9 +1375,7 @@ class CircleAndNeckVBoxFrame(QFrame):
 # -----------------------------------------------------------------------------
 
     def get_maximum_semitone_difference_in_tuning(self):
-        self.maximum_semitone_difference_in_tuning = 0
-        for i in range(len(self.currentTuning)-2):
-            self.maximum_semitone_difference_in_tuning = max(self.maximum_semitone_difference_in_tuning, self.currentTuning[i+1]-self.currentTuning[i])
+        self.maximum_semitone_difference_in_tuning = maximumSemitoneDifference(self.currentTuning)
 
     def get_mode_composition(self):
         modeComposition = [""] * self.scaleLength
@@ -1379,10 +1420,7 @@ class CircleAndNeckVBoxFrame(QFrame):
 
     def get_chords_in_mode(self):
         note = self.get_note_for_current_degree()
-        self.availableChords = []
-        for chord in chords.keys():
-            if set(chord).issubset(tuple(self.shownScale)):
-                self.availableChords.append(chord)
+        self.availableChords = chordsInMask(self.shownMask)
         self.enrichedChords = {}
         if self.highStringLimit > 4:
             self.get_enriched_chords_in_mode()
@@ -1396,60 +1434,22 @@ class CircleAndNeckVBoxFrame(QFrame):
             self.chords_combobox.addItem(chordName, userData=self.enrichedChords[enrichedChord])
 
     def get_enriched_chords_in_mode(self):
-        self.enrichedChords = {}
-        for chord in self.availableChords:
-            if chords[chord]["notation"] in enrichments.keys():
-                for enrichment in enrichments[chords[chord]["notation"]]:
-                    if enrichment["semitones"][0] % 12 in self.shownScale:
-                        enrichedChord =[semitone for semitone in chord]
-                        enrichedChord.append(enrichment["semitones"][0])
-                        self.enrichedChords[enrichment["notation"]] = enrichedChord
+        self.enrichedChords = dict(enrichedChordsInMask(self.shownMask))
 
 
 # -----------------------------------------------------------------------------
 
 
-    def interpolate_colors(self, color1, color2, ratio):
-        # Convert hex colors to RGB
-        rgb_color1 = self.hex_to_rgb(color1)
-        rgb_color2 = self.hex_to_rgb(color2)
-
-        # Interpolate between RGB values based on the ratio
-        interpolated_rgb = tuple(int(color1 + (color2 - color1) * ratio) for color1, color2 in zip(rgb_color1, rgb_color2))
-
-        # Convert interpolated RGB colors back to hex
-        interpolated_hex_color = '#' + ''.join(format(color, '02x') for color in interpolated_rgb)
-
-        return interpolated_hex_color
-
     def generate_colour_for_angle(self, angle, includeRotation=True, colours=customColours[DEGREE_COLOUR]):
-        # Normalize angle to be between 0 and 360 degrees
-        angle = 360*(angle/(2*math.pi))
+        '''
+        QColor of the note at angle (in radians, semitone steps), from the prebuilt
+        table of the palette; shared, not to be modified
+        '''
+        semitone = semitoneForAngle(angle)
         # How about rotating colours too :-)
         if includeRotation:
-            #rotation = (self.modeRotation + self.degreeRotation)%self.scaleLength
-            angleOfRotation = 30*scales[self.scaleName][self.degreeRotation]
-            angle += angleOfRotation
-        angle %= 360
-
-        number_of_colours = len(colours)-1 #-1 because first and last are the same, it's a circle of colours
-        angle_between_colours = 360.0/number_of_colours
-        index1 = int(angle // angle_between_colours)
-        index2 = int((index1 + 1)%number_of_colours)
-        ratio = (angle - (index1 * angle_between_colours)) / angle_between_colours
-        colour = self.interpolate_colors(colours[index1], colours[index2], ratio)
-        return colour
-
-    def hex_to_rgb(self, hex_color):
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-
-    def hex_to_qcolor(self, hex_color):
-        # Remove '#' from the beginning of the hexadecimal string if present
-        color = self.hex_to_rgb(hex_color)
-        # Create a QColor object with the RGB values
-        qcolor = QColor(color[0], color[1], color[2])
-        return qcolor
+            semitone += scales[self.scaleName][self.degreeRotation]
+        return colourTable(colours)[semitone % 12]
 
     def angle_to_hue(self, angle):
         """
@@ -1480,22 +1480,9 @@ class CircleAndNeckVBoxFrame(QFrame):
             hue = self.angle_to_hue(angle)
             colour = QColor.fromHsvF(hue / 360, 1, 1)
         else:
-            colour = self.hex_to_qcolor(self.generate_colour_for_angle(angle, colours=customColours[mode]))
+            colour = self.generate_colour_for_angle(angle, colours=customColours[mode])
         return colour
 
-    def clear_group(self, group):
-        for item in group.childItems():
-            if item in self.circle_scene.items():
-                self.circle_scene.removeItem(item)
-            if item in self.neck_scene.items():
-                self.neck_scene.removeItem(item)
-            group.removeFromGroup(item)
-
-        if group in self.circle_scene.items():
-            self.circle_scene.removeItem(group)
-        if group in self.neck_scene.items():
-            self.neck_scene.removeItem(group)
-
     def color_notes_by_default(self):
         black_pen = QPen(Qt.black)
         gray_pen = QPen(Qt.gray)
@@ -1517,13 +1504,32 @@ class CircleAndNeckVBoxFrame(QFrame):
                 line_item.setPen(colour_pen)
 
     def color_chord_notes(self, chord):
+        '''
+        Starts a new stream of positions for the chord and colours the one at chordIndex
+        '''
         notes_positions = self.get_positions_of_chord_notes(chord)
-        self.chord_positions = self.get_positions_combinations_for_chord(chord, notes_positions)
+        self.chord_voicings = self.get_positions_combinations_for_chord(chord, notes_positions)
+        self.chord_positions = list()
+        self.chord_positions_source = self.identifiedNotes
+        # one more than shown, to know if there are alternates
+        self.get_chord_positions(self.chordIndex+2)
+        if self.chordIndex >= len(self.chord_positions):
+            self.chordIndex = 0
         self.colour_chord(self.chord_positions)
 
+    def get_chord_positions(self, count):
+        '''
+        Takes positions from the stream until count of them are known, if available
+        '''
+        while len(self.chord_positions) < count:
+            chord_position = next(self.chord_voicings, None)
+            if chord_position is None:
+                break
+            self.chord_positions.append(chord_position)
+
     def changeColourDegrees(self, colour):
         self.colour_degrees = colour
-        self.refresh(scale_factor=self.scale_factor)
+        self.invalidate("colours")
 
     def get_positions_of_chord_notes(self, chord):
         notes_positions = {}
@@ -1531,76 +1537,25 @@ class CircleAndNeckVBoxFrame(QFrame):
             notes_positions[note] = []
             # for each position of the note
             for (note_marker, semitone, string, fret, note_label) in self.identifiedNotes[note%12]:
-                authorizedString = (self.lowStringLimit-1 <= string <= self.highStringLimit-1)
-                authorizedFret = (fret < 6)
-                authorizedSemitoneByNumberOfStrings = (0 <= semitone <= semitonesToConsiderByNumberOfStrings[self.num_strings])
-                if authorizedString and authorizedFret and authorizedSemitoneByNumberOfStrings:
+                if isChordPosition(string, fret, semitone, self.lowStringLimit, self.highStringLimit, self.num_strings):
                     notes_positions[note].append((string, fret, note_marker, note_label))
         return notes_positions
 
     def get_positions_combinations_for_chord(self, chord, notes_positions):
-        # detection of note of chord with a single position
-        reserved_strings_for_note = {}
-        for note in chord:
-            if len(notes_positions[note]) == 1:
-                reserved_strings_for_note[notes_positions[note][0][2]] = note
-
-        # notes positions that respect the single position of other notes
-        notes_positions_respecting_notes_with_single_occurence = {}
-        for note in chord:
-            #notes_positions_respecting_notes_with_single_occurence[note] = []
-            for (string, fret, note_marker, note_label) in notes_positions[note]:
-                reservedString = (string in reserved_strings_for_note.keys())
-                # we keep the note in all cases except when the string is reserved but the note does not correspond
-                if not (reservedString and not (reserved_strings[string] == note)):
-                    if not string in notes_positions_respecting_notes_with_single_occurence.keys():
-                        notes_positions_respecting_notes_with_single_occurence[string] = []
-                    notes_positions_respecting_notes_with_single_occurence[string].append((note, fret, note_marker, note_label))
-
-        # Generate all the possible notes position combinations
-        # Create a new list where each tuple is paired with its key
-        notes_positions_with_note = {string: [(string, note, fret, note_marker, note_label) for (note, fret, note_marker, note_label) in tuples] for string, tuples in notes_positions_respecting_notes_with_single_occurence.items()}
-        # Extract the keyed lists
-        stringIndexesSorted = sorted(notes_positions_with_note.keys())
-        #lists = list(notes_positions_with_note.values())
-        lists = [notes_positions_with_note[stringIndex] for stringIndex in stringIndexesSorted]
-        # Use itertools.product to generate combinations of keyed tuples
-        potential_chord_positions = list(itertools.product(*lists))
-
-        # We need to eliminate all the combinations that do not have all the note of the chord
-
-        #print('\n')
-        #print(chord)
-        potential_complete_chord_positions = []
-        for potential_chord_position in potential_chord_positions:
-            foundAllNote = True
-            for note in chord:
-                foundNote = False
-                for (string, noteOnNeck, fret, note_marker, note_label) in potential_chord_position:
-                    foundNote = (foundNote or (noteOnNeck == note))
-                foundAllNote = (foundAllNote and foundNote)
-            if foundAllNote:
-                potential_complete_chord_positions.append(potential_chord_position)
-
-        # We need to compute the intrinsic distance of the chord position to rank them
-        # distance will be the sum of the absolute difference of fret from one string to the next
-        weighted_chord_positions = []
-        for potential_chord_position in potential_complete_chord_positions:
-            distance = 0
-            for i in range(1, len(potential_chord_position)-1):
-                distance += abs(potential_chord_position[i-1][2] - potential_chord_position[i][2])
-            #print(distance, potential_chord_position)
-            weighted_chord_positions.append((distance,potential_chord_position))
-        weighted_chord_positions = sorted(weighted_chord_positions, key=lambda x: x[0])
-        #print(weighted_chord_positions)
-        return weighted_chord_positions
+        '''
+        Returns a generator of the positions of the chord, as (distance, chord position),
+        from the shortest distance on, each one computed only when asked for
+        The distance is the sum of the absolute difference of fret from one string to the next
+        '''
+        return iterVoicings(chord, notes_positions)
 
     def colour_chord(self, chord_positions):
         white_pen = QPen(Qt.white)
         gray_pen = QPen(Qt.gray)
         trans_pen = QPen(Qt.transparent)
 
-        #print(chord_positions[self.chordIndex])
+        if not chord_positions:
+            return
 
         for (string, note, fret, note_marker, note_label) in chord_positions[self.chordIndex][1]:
             note_marker.setBrush(Qt.white)
@@ -1617,8 +1572,8 @@ class CircleAndNeckVBoxFrame(QFrame):
         # Calculate the center point of the bounding rectangle
         center = rect.center()
         # Set the size of the viewport
-        self.neck_graphics_view.viewport().setFixedSize(GRAPHICSVIEW_WIDTH*self.scale_factor, GRAPHICSVIEW_HEIGHT*self.scale_factor)
-        view_size = self.neck_graphics_view.viewport().size()
+        self.neck_graphics_view.viewport().setFixedSize(GRAPHICSVIEW_WIDTH*self.scale_factor*self.zoom, GRAPHICSVIEW_HEIGHT*self.scale_factor*self.zoom)
+        view_size = QSizeF(self.neck_graphics_view.viewport().size())/self.zoom
         # Calculate the new position for the scene
         scene_pos = center - QPointF(view_size.width() / 2, view_size.height() / 2)
         # Set the new position for the scene
@@ -1630,26 +1585,34 @@ class CircleAndNeckVBoxFrame(QFrame):
         # Calculate the center point of the bounding rectangle
         center = rect.center()
         # Set the size of the viewport
-        self.circle_graphics_view.viewport().setFixedSize(GRAPHICSVIEW_WIDTH*self.scale_factor, GRAPHICSVIEW_HEIGHT*self.scale_factor)
-        view_size = self.circle_graphics_view.viewport().size()
+        self.circle_graphics_view.viewport().setFixedSize(GRAPHICSVIEW_WIDTH*self.scale_factor*self.zoom, GRAPHICSVIEW_HEIGHT*self.scale_factor*self.zoom)
+        view_size = QSizeF(self.circle_graphics_view.viewport().size())/self.zoom
         # Calculate the new position for the scene
         scene_pos = center - QPointF(view_size.width() / 2, view_size.height() / 2)
         # Set the new position for the scene
         self.circle_scene.setSceneRect(scene_pos.x(), scene_pos.y(), view_size.width(), view_size.height())
 
     def refresh(self, scale_factor=1.0):
-        print("scale_factor: %s" % scale_factor)
         self.scale_factor = scale_factor
-        self.circle_graphics_view.setFixedSize(GRAPHICSVIEW_WIDTH*self.scale_factor, GRAPHICSVIEW_HEIGHT*self.scale_factor)
+        self.circle_graphics_view.setFixedSize(GRAPHICSVIEW_WIDTH*self.scale_factor*self.zoom, GRAPHICSVIEW_HEIGHT*self.scale_factor*self.zoom)
         self.circle_graphics_view.viewport().update()
-        self.neck_graphics_view.setFixedSize(GRAPHICSVIEW_WIDTH*self.scale_factor, GRAPHICSVIEW_HEIGHT*self.scale_factor)
+        self.neck_graphics_view.setFixedSize(GRAPHICSVIEW_WIDTH*self.scale_factor*self.zoom, GRAPHICSVIEW_HEIGHT*self.scale_factor*self.zoom)
         self.neck_graphics_view.viewport().update()
         self.thisVBoxLayout.update()
         self.centralHBoxLayout.update()
         self.update()
-        self.draw_scale()
-        self.draw_notes_on_neck()
-        self.get_chords_in_mode()
+        self.invalidate(*RENDER_LAYERS)
+
+    def set_zoom(self, zoom):
+        '''
+        Zooms the views over the circle and the neck drawn at scale_factor,
+        without redrawing them
+        '''
+        self.zoom = zoom
+        for view in (self.circle_graphics_view, self.neck_graphics_view):
+            view.setTransform(QTransform.fromScale(zoom, zoom))
+            view.setFixedSize(GRAPHICSVIEW_WIDTH*self.scale_factor*zoom, GRAPHICSVIEW_HEIGHT*self.scale_factor*zoom)
+        zoomFonts(self, zoom)
         self.center_neck_view()
         self.center_scale_view()
 
@@ -1657,8 +1620,7 @@ class CircleAndNeckVBoxFrame(QFrame):
 
     @Slot(int)
     def rotate_notes(self, rotation, scale):
-        scale = sorted([(inScale +(12-scale[rotation]))%12 for inScale in scale])
-        return scale
+        return maskToScale(rotateMask(scaleToMask(scale), rotation))
 
     @Slot(int)
     def strings_for_chord(self, increment):
@@ -1673,21 +1635,14 @@ class CircleAndNeckVBoxFrame(QFrame):
             else:
                 self.highStringLimit = max(self.highStringLimit-1, self.minimumNumberLowerStringsNumber)
         self.chordLabel.setText("Chords using %s strings:" % (self.highStringLimit-self.lowStringLimit+1))
-        self.chordBeforeChange = self.chords_combobox.currentText()
-        self.color_notes_by_default()
-        self.get_chords_in_mode()
-        self.color_chord_notes(self.chords_combobox.currentData())
-        for index in range(self.chords_combobox.count()):
-            if self.chordBeforeChange == self.chords_combobox.itemText(index):
-                self.chords_combobox.setCurrentIndex(index)
+        self.invalidate("chords")
 
     @Slot()
     def show_chord(self):
         self.color_notes_by_default()
         if self.chords_combobox.currentText() != "":
-            if len(self.chord_positions) > 1:
-                self.alt_chords.setEnabled(True)
             self.color_chord_notes(self.chords_combobox.currentData())
+            self.alt_chords.setEnabled(len(self.chord_positions) > 1)
         else:
             self.alt_chords.setEnabled(False)
             self.chordIndex = 0
@@ -1695,21 +1650,23 @@ class CircleAndNeckVBoxFrame(QFrame):
     @Slot()
     def show_alternate_chord(self):
         self.color_notes_by_default()
-        #print("chordIndex: %s" % self.chordIndex)
-        #print("len(self.chord_positions): %s" % len(self.chord_positions))
-
-        self.chordIndex = (self.chordIndex+1)%len(self.chord_positions)
-        #print("chordIndex: %s" % self.chordIndex)
-
-        self.color_chord_notes(self.chords_combobox.currentData())
+        self.chordIndex += 1
+        if self.chord_positions_source is self.identifiedNotes:
+            # only the next position is computed, the first one is shown again after the last
+            self.get_chord_positions(self.chordIndex+1)
+            if self.chordIndex >= len(self.chord_positions):
+                self.chordIndex = 0
+            self.colour_chord(self.chord_positions)
+        else:
+            # notes were redrawn since the positions were computed
+            self.color_chord_notes(self.chords_combobox.currentData())
 
     @Slot(int)
     def show_highlighted_chord(self, index):
         self.color_notes_by_default()
-        if len(self.chord_positions) > 1:
-            self.alt_chords.setEnabled(True)
         self.chordIndex = 0
         self.color_chord_notes(self.chords_combobox.itemData(index))
+        self.alt_chords.setEnabled(len(self.chord_positions) > 1)
 
 
 
@@ -1720,12 +1677,51 @@ class CircleAndNeckVBoxFrame(QFrame):
 # -----------------------------------------------------------------------------
 # -----------------------------------------------------------------------------
 
+class TraceOverlay(QLabel):
+    '''
+    Report of the last user action recorded by the redraw tracer, shown over
+    the main window; tracing is on while it is shown (or when asked for by
+    SCALE_CIRCLE_TRACE)
+    '''
+    def __init__(self, parent):
+        super().__init__(parent)
+        font = QFont("monospace")
+        font.setStyleHint(QFont.Monospace)
+        font.setPointSize(9)
+        self.setFont(font)
+        self.setStyleSheet("background: rgba(255, 255, 240, 225); color: black; padding: 6px;")
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.move(10, 10)
+        self.hide()
+        tracer.listeners.append(self.show_action)
+
+    def show_action(self, action):
+        if self.isVisible():
+            self.setText(tracer.report(action))
+            self.adjustSize()
+
+    def toggle(self):
+        if self.isVisible():
+            self.hide()
+            tracer.enabled = TRACE_FILE is not None
+        else:
+            tracer.enabled = True
+            self.setText("Tracing, waiting for a user action\nF12: hide, F11: write the trace file")
+            self.adjustSize()
+            self.show()
+            self.raise_()
+
+# -----------------------------------------------------------------------------
+
 class MainWindow(QMainWindow):
     def __init__(self, scale_factor=1.0):
         super().__init__()
 
         self.scale_factor = scale_factor
         self.last_scale_Factor = scale_factor
+        self.zoom = ZOOM
+        # Setters mark what is to redraw, drawn once per event loop turn
+        self.render_scheduler = RenderScheduler()
         self.initUI()
 
         self.neckGeneralView = ''
@@ -1746,10 +1742,12 @@ class MainWindow(QMainWindow):
         self.labelFont.setFamily(FONT)
 
         self.create_gui()
+        self.traceOverlay = TraceOverlay(self)
 
-        # Create a first frame for the first Degree to show
+        # Frames are created by set_arrangement, and drawn when first shown;
+        # those left aside by a shorter arrangement wait hidden for the next one
         self.degreesFrames = list()
-        vframe = self.addDegreeFrame(visible=True, name="frame_1")
+        self.spareDegreesFrames = list()
 
         # Initialisation
         self.set_scale("Natural")
@@ -1917,20 +1915,21 @@ class MainWindow(QMainWindow):
             self.neckGeneralView.set_mode(modeIndex)
 
     def set_arrangement(self, arrangement, arrIndex):
-        height = 500*self.scale_factor
-        width = 940*self.scale_factor
+        height = 500*self.scale_factor*self.zoom
+        width = 940*self.scale_factor*self.zoom
         self.arrangementString = arrangement
         self.arrangement = degreeArrangements[arrIndex]
-        self.clearDegreeFrames()
         self.setFixedSize(height * len(self.arrangement), width)
-        for i in range(len(self.arrangement)):
-            name = "frame_%s"%(1+i)
-            vFrame = self.addDegreeFrame(name=name)
-            # One needs to re-apply all the settings for the frames were recreated
-            vFrame.set_scale(self.scales_combobox.currentText())
-            vFrame.set_mode(self.mode_combobox.currentIndex())
-            vFrame.set_degree(self.arrangement[i]-1)
-            vFrame.set_tuning(self.tunings_combobox.currentText())
+        # The frames already shown are kept, only their degree changes
+        while len(self.degreesFrames) > len(self.arrangement):
+            vFrame = self.degreesFrames.pop()
+            vFrame.hide()
+            self.spareDegreesFrames.append(vFrame)
+        while len(self.degreesFrames) < len(self.arrangement):
+            self.takeDegreeFrame(name="frame_%s"%(1+len(self.degreesFrames)))
+        for vFrame, degree in zip(self.degreesFrames, self.arrangement):
+            if vFrame.degreeIndex != (degree-1 + vFrame.modeIndex)%vFrame.scaleLength:
+                vFrame.set_degree(degree-1)
             vFrame.show()
         if not self.neckGeneralView == "":
             self.neckGeneralView.set_arrangement(self.arrangement)
@@ -1944,16 +1943,43 @@ class MainWindow(QMainWindow):
             self.neckGeneralView.set_tuning(self.currentTuningName, init=init)
 
     def clearDegreeFrames(self):
-        for vFrame in self.degreesFrames:
+        for vFrame in self.degreesFrames + self.spareDegreesFrames:
             self.midHBoxLayout.removeWidget(vFrame)
+            self.render_scheduler.discard(vFrame)
             vFrame.deleteLater()
         self.degreesFrames = list()
+        self.spareDegreesFrames = list()
+
+    def takeDegreeFrame(self, name=""):
+        '''
+        Adds a frame to the shown ones: the first spare frame if any, else a
+        new one, and applies to it the scale, mode, tuning, colours and zoom
+        set since it was hidden (or built)
+        '''
+        if self.spareDegreesFrames:
+            vFrame = self.spareDegreesFrames.pop()
+            vFrame.name = name
+            self.degreesFrames.append(vFrame)
+            if vFrame.zoom != self.zoom:
+                vFrame.set_zoom(self.zoom)
+                vFrame.setFixedSize(483*self.scale_factor*self.zoom, 854*self.scale_factor*self.zoom)
+            if vFrame.colour_degrees != self.colour_degrees:
+                vFrame.changeColourDegrees(self.colour_degrees)
+        else:
+            vFrame = self.addDegreeFrame(name=name)
+        vFrame.set_scale(self.scales_combobox.currentText())
+        vFrame.set_mode(self.mode_combobox.currentIndex())
+        vFrame.set_degree(self.arrangement[len(self.degreesFrames)-1]-1)
+        vFrame.set_tuning(self.tunings_combobox.currentText())
+        return vFrame
 
     def addDegreeFrame(self, visible=False, name=""):
-        width = 483*self.scale_factor
-        height = 854*self.scale_factor
+        width = 483*self.scale_factor*self.zoom
+        height = 854*self.scale_factor*self.zoom
         vBoxFrame = CircleAndNeckVBoxFrame(self, 1, visible=visible, name=name, scale_factor=self.scale_factor)
         self.degreesFrames.append(vBoxFrame)
+        if self.zoom != 1.0:
+            vBoxFrame.set_zoom(self.zoom)
         vBoxFrame.setFixedSize(width, height)
         self.midHBoxLayout.addWidget(vBoxFrame)
         return vBoxFrame
@@ -1976,8 +2002,8 @@ class MainWindow(QMainWindow):
         self.neckGeneralView.refresh(scale_factor=self.scale_factor)
 
     def create_neck_general_view(self):
-        width = 1500*self.scale_factor
-        height = 440*self.scale_factor
+        width = 1500*self.scale_factor*self.zoom
+        height = 440*self.scale_factor*self.zoom
         self.neckGeneralView = NeckWindow(self, scale_factor=self.scale_factor)
         self.refresh()
         self.neckGeneralView.set_scale(self.scaleName)
@@ -1985,25 +2011,46 @@ class MainWindow(QMainWindow):
         self.neckGeneralView.set_mode(self.modeIndex)
         self.neckGeneralView.set_arrangement(self.arrangement)
         self.neckGeneralView.setFixedSize(width, height)
+        if self.zoom != 1.0:
+            self.neckGeneralView.set_zoom(self.zoom)
         self.neckGeneralView.show()
 
     def keyPressEvent(self, event):
-        print("event.key: %s" % event.key())
         if event.key() == 43:
-            print("scale up")
-            self.last_scale_Factor = self.scale_factor
-            self.scale_factor += .1
-            #self.zoomIn()
-            self.refresh()
+            self.zoomIn()
         elif event.key() == 95:
-            print("scale down")
-            self.last_scale_Factor = self.scale_factor
-            self.scale_factor -= .1
-            #self.zoomOut()
-            self.refresh()
+            self.zoomOut()
+        elif event.key() == Qt.Key_F12:
+            self.traceOverlay.toggle()
+        elif event.key() == Qt.Key_F11:
+            path = tracer.dump()
+            if self.traceOverlay.isVisible():
+                self.traceOverlay.setText("%s\n\ntrace written to %s" % (self.traceOverlay.text(), path))
+                self.traceOverlay.adjustSize()
         else:
             super().keyPressEvent(event)
 
+    def set_zoom(self, zoom):
+        '''
+        Zooms the whole application through the transforms of its views, the
+        scenes staying drawn at scale_factor: nothing is redrawn nor rebuilt.
+        refresh() is still the way to rebuild them for another scale_factor
+        '''
+        self.zoom = min(MAXIMUM_ZOOM, max(MINIMUM_ZOOM, round(zoom, 2)))
+        zoomFonts(self, self.zoom)
+        for vFrame in self.degreesFrames:
+            vFrame.set_zoom(self.zoom)
+            vFrame.setFixedSize(483*self.scale_factor*self.zoom, 854*self.scale_factor*self.zoom)
+        self.setFixedSize(500*self.scale_factor*self.zoom * len(self.arrangement), 940*self.scale_factor*self.zoom)
+        if not self.neckGeneralView == '':
+            self.neckGeneralView.set_zoom(self.zoom)
+
+    def zoomIn(self):
+        self.set_zoom(self.zoom + ZOOM_STEP)
+
+    def zoomOut(self):
+        self.set_zoom(self.zoom - ZOOM_STEP)
+
     def scale_all_labels(self):
         relative_scale_factor = self.scale_factor/self.last_scale_Factor
         for widget in self.findChildren(QLabel):
@@ -2034,20 +2081,15 @@ class MainWindow(QMainWindow):
                 font.setPointSize(original_point_size * self.scale_factor/self.last_scale_Factor)
                 widget.setFont(font)
             '''
-            print("widget.style elements: %s" % dir(widget.style()))
-            print("widget.style layout spacing: %s" % widget.style().__getattribute__('layoutSpacing'))
-
             #widget.setStyleSheet(f"padding: {int(5 * relative_scale_factor)}px; margin: {int(5 * relative_scale_factor)}px;")
 
             widget.setFixedSize(new_width, new_height)
 
     def scale_all_pushbuttons(self):
         for widget in self.findChildren(QPushButton):
-            print("scale_all_pushbuttons: %s" % widget)
             font = widget.font()
             font_metrics = QFontMetrics(font)
             original_point_size = font_metrics.height()
-            print(original_point_size)
             if original_point_size > 0:  # If a point size is set
                 font.setPointSize(int(original_point_size * self.scale_factor/self.last_scale_Factor))
                 widget.setFont(font)
@@ -2080,8 +2122,8 @@ class MainWindow(QMainWindow):
             layout.setSpacing(current_spacing* self.scale_factor/self.last_scale_Factor)
 
     def refresh(self):
-        width = 510 * self.scale_factor
-        height = 940 * self.scale_factor
+        width = 510 * self.scale_factor*self.zoom
+        height = 940 * self.scale_factor*self.zoom
         self.labelFont.setPointSize(20*self.scale_factor)
         #self.scale_all_labels()
         #self.scale_all_comboboxes()
@@ -2092,21 +2134,24 @@ class MainWindow(QMainWindow):
 
         self.central_widget.update()
 
+        # The frames are built anew for the scale_factor, spare ones included
         currentArrangement = self.arrangement_combobox.currentText()
         currentArrangementIndex = self.arrangement_combobox.currentIndex()
-        self.set_arrangement('II', 1)
+        self.clearDegreeFrames()
         #for vFrame in self.degreesFrames:
         #    vFrame.refresh(scale_factor=self.scale_factor)
         self.set_arrangement(currentArrangement, currentArrangementIndex)
         if not self.neckGeneralView == '':
-            width = 1500*self.scale_factor
-            height = 440*self.scale_factor
+            width = 1500*self.scale_factor*self.zoom
+            height = 440*self.scale_factor*self.zoom
             self.neckGeneralView.setFixedSize(width, height)
             self.neckGeneralView.refresh(scale_factor=self.scale_factor)
 
     def closeEvent(self, event):
         if not self.neckGeneralView == '':
             self.neckGeneralView.close()
+        if TRACE_FILE is not None:
+            tracer.dump()
         event.accept()
 
 
@@ -2115,6 +2160,10 @@ class MainWindow(QMainWindow):
 
 
 
+# The drawing, refresh and setting methods are timed by the redraw tracer when it is enabled
+for tracedClass in (NeckWindow, CircleAndNeckVBoxFrame, MainWindow):
+    traceMethods(tracedClass)
+
 # -----------------------------------------------------------------------------
 # -----------------------------------------------------------------------------
 # -----------------------------------------------------------------------------
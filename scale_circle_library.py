@@ -7,8 +7,21 @@
 # ࿄ ࿅ ࿇
 # -----------------------------------------------------------------------------
 
-from PySide6.QtWidgets import QGraphicsPolygonItem, QGraphicsEllipseItem
-from catalogs import scales, modes
+from qt_exports import lazyQtExports
+
+# Time allowed to (un)highlight the notes of a hover event, in seconds (half a 60 Hz frame)
+HOVER_LATENCY_BUDGET = 0.008
+
+# Layers of the windows the setters mark as dirty, redrawn by the next render pass
+RENDER_LAYERS = ("scale", "degree", "tuning", "colours", "chords")
+
+# Qt side of the library, in note_items: graphic item classes, hover
+# highlighter, colouring store and render scheduler, only imported (with Qt)
+# when first asked for
+QT_NAMES = ('PolgonNoteItem', 'RounNoteItem', 'fretZeroNoteItem', 'NoteItem', 'TriangleNoteItem', 'LayerGroup', 'PictureItem',
+            'NoteHighlighter', 'NoteColouringStore', 'RenderScheduler', 'colourToText', 'textToColour')
+
+__getattr__ = lazyQtExports(__name__, 'note_items', QT_NAMES)
 
 # -----------------------------------------------------------------------------
 
@@ -22,31 +35,23 @@ class GenericNoteItem:
         self.relatedNotesOnNeckOriginalColours = []
         self.continuouslyColoured = False
 
+    def resetNote(self):
+        '''
+        Puts back a recycled item in the state of a newly built one (its
+        graphic state is reset by the Qt item classes of note_items)
+        '''
+        self.note = ''
+        self.angle = ''
+        self.colour = ''
+        self.originalColour = ''
+        self.relatedNotesOnNeckOriginalColours = []
+        self.continuouslyColoured = False
+
     def colourNotes(self):
         '''
         Colours momentarly all the same notes on the neck
         '''
-        if hasattr(self.embeddingWidget, "mainWindowInstance"):
-            referenceVFrame = self.embeddingWidget.mainWindowInstance.degreesFrames[0]
-            colourCorrection = self.embeddingWidget.scale[referenceVFrame.degreeIndex]-self.embeddingWidget.scale[self.embeddingWidget.modeIndex]
-        else:
-            colourCorrection = 0
-        for note in self.embeddingWidget.identifiedNotes[self.note]:
-            color = None
-            # If notes should be back to normal when leaving
-            if self.continuouslyColoured is False:
-                note[0].originalColour = note[0].brush().color()
-                #color = note[0].brush().color()
-            if hasattr(self.embeddingWidget, 'mainWindowInstance'):
-                note2 = (self.note - colourCorrection)%12
-                if note2 in referenceVFrame.notesOnCircle.keys():
-                    color = referenceVFrame.notesOnCircle[note2][0][2]
-                else:
-                    color = self.colour
-            else:
-                color = self.colour
-            if color:
-                note[0].setBrush(color)
+        self.embeddingWidget.note_highlighter.highlight(self)
 
     def uncolourNotesConditionally(self):
         '''
@@ -54,9 +59,7 @@ class GenericNoteItem:
         if no continuouslyColoured set by a simple click
         '''
         if self.continuouslyColoured is False:
-            for note in self.embeddingWidget.identifiedNotes[self.note]:
-                if hasattr(note[0], "originalColour"):
-                    note[0].setBrush(note[0].originalColour)
+            self.embeddingWidget.note_highlighter.unhighlight(self)
             self.relatedNotesOnNeckOriginalColours = []
 
     def hoverEnterEvent(self, event):
@@ -78,33 +81,36 @@ class GenericNoteItem:
                 note[0].continuouslyColoured = True
         super().mousePressEvent(event)
 
-class PolgonNoteItem(GenericNoteItem, QGraphicsPolygonItem):
-    def __init__(self,  parenta=None, noteOnNeck=False, embeddingWidget=None):
-        GenericNoteItem.__init__(self, noteOnNeck=noteOnNeck, embeddingWidget=embeddingWidget)
-        QGraphicsPolygonItem.__init__(self, parenta)
-        self.setAcceptHoverEvents(True)
-
-class RounNoteItem(GenericNoteItem, QGraphicsEllipseItem):
-    def __init__(self,  parenta=None, noteOnNeck=False, embeddingWidget=None):
-        GenericNoteItem.__init__(self, noteOnNeck=noteOnNeck, embeddingWidget=embeddingWidget)
-        QGraphicsEllipseItem.__init__(self, parenta)
-        self.setAcceptHoverEvents(True)
-
-fretZeroNoteItem = PolgonNoteItem
-NoteItem = RounNoteItem
-TriangleNoteItem = PolgonNoteItem
-
-def linkModesToScales():
-    modesListByScaleDic = dict()
-    for scaleName in scales.keys():
-        modesListByScaleDic[scaleName] = list()
-        scale =  scales[scaleName]
-        scaleLength = len(scale)
-        rotatedScale = scale
-        for i in range(scaleLength):
-            if tuple(rotatedScale) in modes.keys():
-                modesListByScaleDic[scaleName].append(modes[tuple(rotatedScale)])
-            rotatedScale = sorted([(inScale +(12-rotatedScale[1]))%12 for inScale in rotatedScale])
-    return modesListByScaleDic
+class NoteItemPool:
+    '''
+    Recycles the note items of a widget by shape: items given back when their
+    layer is cleared are handed out again, reshaped and reset, instead of
+    building new Qt objects on every redraw
+    '''
+    def __init__(self, embeddingWidget):
+        self.embeddingWidget = embeddingWidget
+        self.freeItems = dict()
+
+    def acquire(self, itemClass, shape):
+        '''
+        Returns an item of itemClass (NoteItem, TriangleNoteItem or
+        fretZeroNoteItem) with shape (QRectF for round items, QPolygonF for
+        polygonal ones)
+        '''
+        freeItems = self.freeItems.get(itemClass)
+        if not freeItems:
+            return itemClass(shape, embeddingWidget=self.embeddingWidget)
+        item = freeItems.pop()
+        item.resetNote()
+        item.setShape(shape)
+        return item
+
+    def release(self, items):
+        '''
+        Takes back the note items among items (e.g. returned by LayerGroup.clear)
+        '''
+        for item in items:
+            if isinstance(item, GenericNoteItem):
+                self.freeItems.setdefault(type(item), list()).append(item)
 
 # -----------------------------------------------------------------------------
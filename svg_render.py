@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+#
+# -----------------------------------------------------------------------------
+# Author: Gregoire Vandenschrick
+# Date:   17/10/2026
+# ࿄ ࿅ ࿇
+# -----------------------------------------------------------------------------
+'''
+Qt-free SVG version of the drawings of the application: the scale circle of a
+degree frame (CircleAndNeckVBoxFrame.draw_scale) and the neck of the neck
+window (NeckWindow.draw_frets, draw_inlays, draw_strings, draw_notes_on_neck
+and label_degrees_on_neck), fanned frets and inlay styles included.
+The drawings are generators of SVG text, written as they are produced; the
+parts of the neck that do not depend on the scale, mode and root are built
+once per neck and kept in an LRU cache.
+Pen widths and font sizes are truncated to integers as Qt does, so that the
+SVG matches the Qt drawings.
+
+    python svg_render.py neck --tuning "Standard 6 \tEADGBE" --root A --scale Natural --mode 5 > neck.svg
+'''
+
+from functools import lru_cache
+from xml.sax.saxutils import escape
+import math
+import sys
+import numpy as np
+
+from catalogs import notes, scales, tunings, degrees, stringSets, stringGaugeFromNumberOfString
+from pitch_class_sets import scaleToMask, rotateMask, maskToScale, maskContains, degreeIndex
+from fretboard import pitchMatrix, fretGeometry, fanProjection, lowStringNoteValue, firstRootPosition
+from fretboard import SCALE_CIRCLE_RADIUS, FRET_SPACING, FRET_OVERSHOOT, STRING_SPACING, NECK_WIDENING, FONT
+from colour_tables import hexTable, DEGREE_COLOUR
+from Inlays import compiledInlays, customColours
+
+# -----------------------------------------------------------------------------
+
+MARGIN = 10
+NUM_FRETS = 24
+
+# Qt colours used by the drawings
+BACKGROUND = "#c0c0c0" # Qt.lightGray, background of the views
+DARK_GRAY = "#808080"  # Qt.darkGray
+NOTE_FILL = 'fill="#000000" fill-opacity="0.502"' # Qt.black with an alpha of 128
+
+# -----------------------------------------------------------------------------
+
+def penWidth(width):
+    '''
+    Width of a QPen set to width: truncated, 0 standing for a 1 pixel line
+    '''
+    return int(width) or 1
+
+def fontSize(pointSize):
+    '''
+    Size in pixels of a QFont set to pointSize (truncated) on a 96 dpi screen
+    '''
+    return int(pointSize)*4/3
+
+def points(xs, ys):
+    return " ".join("%.2f,%.2f" % point for point in zip(xs, ys))
+
+def svgHeader(left, top, right, bottom, background):
+    left, top, right, bottom = left-MARGIN, top-MARGIN, right+MARGIN, bottom+MARGIN
+    yield ('<svg xmlns="http://www.w3.org/2000/svg" width="%d" height="%d" viewBox="%.2f %.2f %.2f %.2f">\n'
+           % (math.ceil(right-left), math.ceil(bottom-top), left, top, right-left, bottom-top))
+    if background:
+        yield '<rect x="%.2f" y="%.2f" width="%.2f" height="%.2f" fill="%s"/>\n' % (left, top, right-left, bottom-top, background)
+
+def writeSvg(chunks, output=sys.stdout):
+    '''
+    Writes the chunks of a drawing to output, a path or an open text file
+    '''
+    if isinstance(output, str):
+        with open(output, 'w', encoding='utf-8') as outputFile:
+            outputFile.writelines(chunks)
+    else:
+        output.writelines(chunks)
+
+# -----------------------------------------------------------------------------
+
+def circleSvg(scaleName, modeIndex=0, degree=1, palette=DEGREE_COLOUR, scaleFactor=1.0, background=BACKGROUND):
+    '''
+    Scale circle of the frame showing degree (1 based) of the mode modeIndex
+    (0 based) of scaleName, coloured with a palette of Inlays.customColours
+    '''
+    scale = scales[scaleName]
+    shownDegreeIndex = (degree - 1 + modeIndex)%len(scale)
+    shownScale = maskToScale(rotateMask(scaleToMask(scale), shownDegreeIndex))
+    colours = hexTable(customColours[palette])
+    radius = SCALE_CIRCLE_RADIUS*scaleFactor
+    extent = radius + 3*scaleFactor
+
+    yield from svgHeader(-extent, -extent, extent, extent, background)
+    yield ('<circle cx="0" cy="0" r="%.2f" fill="#ffffff" stroke="#000000" stroke-width="%d"/>\n'
+           % (radius, penWidth(3*scaleFactor)))
+    yield '<g stroke="#000000">\n'
+    for note in shownScale:
+        angle = note*math.pi/6
+        noteSize = (20 if note == shownScale[0] else 10)*scaleFactor
+        lineLength = radius - noteSize/2 - 5*scaleFactor
+        yield ('<line x1="0" y1="0" x2="%.2f" y2="%.2f" stroke-width="1"/>\n'
+               '<circle cx="%.2f" cy="%.2f" r="%.2f" fill="%s" stroke-width="%d"/>\n'
+               % (lineLength*math.sin(angle), -lineLength*math.cos(angle),
+                  radius*math.sin(angle), -radius*math.cos(angle), noteSize/2,
+                  colours[(note + scale[shownDegreeIndex])%12], penWidth(2*scaleFactor)))
+    yield '</g>\n'
+    penCentre = penWidth(2*scaleFactor)
+    yield ('<circle cx="0" cy="0" r="%.2f" fill="#ffffff" stroke="#ffffff" stroke-width="%d"/>\n'
+           '<circle cx="0" cy="0" r="%.2f" fill="#ffffff" stroke="#000000" stroke-width="%d"/>\n'
+           '<circle cx="0" cy="0" r="%.2f" fill="#ffffff" stroke="#000000" stroke-width="%d"/>\n'
+           % (12*scaleFactor, penCentre, 10*scaleFactor, penCentre, 5*scaleFactor, penCentre))
+    yield '</svg>\n'
+
+# -----------------------------------------------------------------------------
+
+class NeckLayout:
+    '''
+    Dimensions of a neck drawing, as in NeckWindow, and the projection of its
+    fanned frets
+    '''
+    def __init__(self, numStrings, numFrets, scaleFactor, fanned, fanBase, regularFrets):
+        self.numStrings = numStrings
+        self.numFrets = numFrets
+        self.scaleFactor = scaleFactor
+        self.regularFrets = regularFrets
+        self.width = FRET_SPACING*(numFrets + 1)*scaleFactor
+        self.height = STRING_SPACING*(numStrings - 1)*scaleFactor
+        self.halfHeight = self.height/2
+        self.stringsThickness = stringSets[stringGaugeFromNumberOfString[numStrings]]
+        self.highStringThicknessAllowance = (self.stringsThickness[0]/20)*scaleFactor
+        self.lowStringThicknessAllowance = (self.stringsThickness[-1]/20)*scaleFactor
+        if fanned:
+            fanHeight = (60 - (numStrings-6)*20) * (STRING_SPACING * (numStrings - 1) * scaleFactor)
+        else:
+            fanBase = 0
+            fanHeight = 1000000*scaleFactor
+        self.fan = fanProjection(fanBase, fanHeight, numStrings, scaleFactor, STRING_SPACING)
+        self.geometry = fretGeometry(numFrets, FRET_SPACING, scaleFactor, regularFrets)
+
+    def labelsRow(self):
+        '''
+        y of the row of degree labels, top and bottom of its coloured
+        rectangles, x of the labels and of the sides of the rectangles for
+        frets -1 to the last one
+        '''
+        scaleFactor = self.scaleFactor
+        y = self.height + 2.1 * STRING_SPACING*scaleFactor
+        yTop = y - STRING_SPACING/2*scaleFactor
+        yBot = y + STRING_SPACING/2*scaleFactor
+        xs = self.geometry.midpoints[:self.numFrets+1]
+        if self.regularFrets:
+            xLefts = xs-FRET_SPACING/2*scaleFactor
+            xRights = xs+FRET_SPACING/2*scaleFactor
+        else:
+            thisFretSpacings = self.geometry.spacings[:self.numFrets+1]
+            xLefts = xs - thisFretSpacings/2.0
+            xLefts[0] = xs[0]
+            xRights = xs+thisFretSpacings/2.0
+            xs = xs.copy()
+            xs[0] = xLefts[0] + (xRights[0] - xLefts[0])/2.0
+        return y, yTop, yBot, xs, xLefts, xRights
+
+    def bounds(self, showTuning):
+        '''
+        left, top, right, bottom of all that is drawn
+        '''
+        scaleFactor = self.scaleFactor
+        top = -(FRET_OVERSHOOT+1)*scaleFactor - NECK_WIDENING*scaleFactor - self.highStringThicknessAllowance - 20
+        y, yTop, yBot, xs, xLefts, xRights = self.labelsRow()
+        nutX = self.fan.project(-15*scaleFactor, np.array((top, yBot)))
+        left = min(nutX.min() - 5*scaleFactor, self.fan.project(xLefts[0], yBot), self.fan.project(xLefts[0], yTop))
+        if showTuning:
+            left = min(left, self.fan.project(-2*FRET_SPACING*scaleFactor, (top, yBot)).min())
+        right = max(self.width, self.fan.project(xRights[-1], yTop), self.fan.project(xRights[-1], yBot))
+        return float(left), float(top), float(right), float(yBot)
+
+@lru_cache(maxsize=64)
+def neckLayout(numStrings, numFrets, scaleFactor, fanned, fanBase, regularFrets):
+    return NeckLayout(numStrings, numFrets, scaleFactor, fanned, fanBase, regularFrets)
+
+@lru_cache(maxsize=64)
+def neckBackground(tuningName, numFrets, scaleFactor, inlays, fanned, fanBase, regularFrets, showTuning):
+    '''
+    SVG text of the inlays, tuning, borders, frets and strings of a neck,
+    in the order of the NeckWindow layers
+    '''
+    tuning = tunings[tuningName]
+    layout = neckLayout(len(tuning), numFrets, scaleFactor, fanned, fanBase, regularFrets)
+    fan = layout.fan
+    geometry = layout.geometry
+    chunks = list()
+
+    # Inlays
+    stringNumbersAdjustmentRatio = layout.numStrings/6.0
+    for inlayMark in compiledInlays(".strandberg＊" if fanned else inlays):
+        i = inlayMark.fret
+        if i >= numFrets:
+            continue
+        adjustmentForFret = inlayMark.widening*(NECK_WIDENING*i/numFrets)*scaleFactor
+        x = geometry.position(i) + geometry.spacing(i)*inlayMark.deltaX
+        if inlayMark.side:
+            y = layout.halfHeight + layout.halfHeight*inlayMark.deltaY + adjustmentForFret + layout.lowStringThicknessAllowance
+        else:
+            y = layout.halfHeight + layout.halfHeight*inlayMark.deltaY*stringNumbersAdjustmentRatio + adjustmentForFret
+        x = float(fan.project(x, y))
+        if inlayMark.pen is None:
+            stroke = 'stroke="none"'
+        else:
+            stroke = 'stroke="%s" stroke-width="%d"' % (inlayMark.pen[0], penWidth(inlayMark.pen[1]))
+        sizeX = inlayMark.sizeX*scaleFactor
+        sizeY = inlayMark.sizeY*scaleFactor
+        if inlayMark.shape == 'ellipse':
+            chunks.append('<ellipse cx="%.2f" cy="%.2f" rx="%.2f" ry="%.2f" fill="%s" %s/>\n'
+                          % (x, y, sizeX/2, sizeY/2, inlayMark.colour, stroke))
+        else:
+            chunks.append('<rect x="%.2f" y="%.2f" width="%.2f" height="%.2f" fill="%s" %s/>\n'
+                          % (x - sizeX/2, y - sizeY/2, sizeX, sizeY, inlayMark.colour, stroke))
+
+    # Tuning
+    if showTuning:
+        notesByIndex = {value: key for key, value in notes.items()}
+        lowStringNoteIndex = lowStringNoteValue(tuningName)
+        x = (-2 * FRET_SPACING*scaleFactor) + (FRET_SPACING*scaleFactor / 2.0)
+        chunks.append('<g font-family="%s" font-size="%.2f" text-anchor="middle" dominant-baseline="central" fill="#000000">\n'
+                      % (FONT, fontSize(.8*(STRING_SPACING*scaleFactor))))
+        for i in range(layout.numStrings):
+            y = layout.height - (i * STRING_SPACING*scaleFactor)
+            adjustmentForString = (y-layout.halfHeight)/layout.halfHeight
+            y += NECK_WIDENING * adjustmentForString * (-.5)/numFrets
+            chunks.append('<text x="%.2f" y="%.2f">%s</text>\n'
+                          % (fan.project(x, y), y, escape(notesByIndex[(lowStringNoteIndex + tuning[i])%12])))
+        chunks.append('</g>\n')
+
+    chunks.append('<g stroke="%s" stroke-linecap="square">\n' % DARK_GRAY)
+    # Borders
+    fretOvershoot = (FRET_OVERSHOOT+1)*scaleFactor
+    for (yBegin, yEnd) in ((-fretOvershoot-layout.highStringThicknessAllowance,
+                            -fretOvershoot-NECK_WIDENING*scaleFactor-layout.highStringThicknessAllowance),
+                           (layout.height+fretOvershoot+layout.lowStringThicknessAllowance,
+                            layout.height+fretOvershoot+NECK_WIDENING*scaleFactor+layout.lowStringThicknessAllowance)):
+        chunks.append('<line x1="%.2f" y1="%.2f" x2="%.2f" y2="%.2f" stroke-width="%d"/>\n'
+                      % (fan.project(-15*scaleFactor, yBegin), yBegin, layout.width, yEnd, penWidth(0.5*scaleFactor)))
+
+    # Fret 0 and nut
+    for (x, top, bottom, width) in ((0, -FRET_OVERSHOOT*scaleFactor, layout.height+FRET_OVERSHOOT*scaleFactor, 4),
+                                    (-15*scaleFactor, (-FRET_OVERSHOOT+4)*scaleFactor, layout.height+(FRET_OVERSHOOT-4)*scaleFactor, 10)):
+        top -= layout.highStringThicknessAllowance
+        bottom += layout.lowStringThicknessAllowance
+        chunks.append('<line x1="%.2f" y1="%.2f" x2="%.2f" y2="%.2f" stroke-width="%d"/>\n'
+                      % (fan.project(x, top), top, fan.project(x, bottom), bottom, penWidth(width*scaleFactor)))
+
+    # Frets
+    frets = np.arange(0, numFrets + 1)
+    xs = geometry.positions[1:]
+    widthAdjustments = NECK_WIDENING*(frets/(numFrets + 1))*scaleFactor
+    tops = -(FRET_OVERSHOOT*scaleFactor + widthAdjustments + layout.highStringThicknessAllowance)
+    tops[frets%12 == 0] -= 20
+    bottoms = layout.height+(FRET_OVERSHOOT*scaleFactor + widthAdjustments + layout.lowStringThicknessAllowance)
+    fretWidth = penWidth(3*scaleFactor)
+    for (xTop, top, xBottom, bottom) in zip(*(array.tolist() for array in (fan.project(xs, tops), tops, fan.project(xs, bottoms), bottoms))):
+        chunks.append('<line x1="%.2f" y1="%.2f" x2="%.2f" y2="%.2f" stroke-width="%d"/>\n' % (xTop, top, xBottom, bottom, fretWidth))
+
+    # Strings
+    yBegins = np.arange(layout.numStrings) * STRING_SPACING * scaleFactor
+    yEnds = yBegins+((yBegins-layout.halfHeight)/layout.halfHeight*NECK_WIDENING)
+    xBegins = fan.project(-15*scaleFactor, yBegins)
+    for (i, xBegin, yBegin, yEnd) in zip(range(layout.numStrings), xBegins.tolist(), yBegins.tolist(), yEnds.tolist()):
+        chunks.append('<line x1="%.2f" y1="%.2f" x2="%.2f" y2="%.2f" stroke-width="%d"/>\n'
+                      % (xBegin, yBegin, layout.width, yEnd, penWidth((layout.stringsThickness[i]/10.0)*scaleFactor)))
+    chunks.append('</g>\n')
+    return "".join(chunks)
+
+def neckSvg(tuningName, rootNote, scaleName, modeIndex=0, arrangement=(1,), inlays=".strandberg＊",
+            palette=DEGREE_COLOUR, numFrets=NUM_FRETS, scaleFactor=1.0, showRoot=True, showTuning=False,
+            fanned=False, fanBase=FRET_SPACING, regularFrets=True, background=BACKGROUND):
+    '''
+    Whole neck of the neck window for a tuning and root note (names of
+    catalogs.tunings and catalogs.notes), showing the mode modeIndex (0 based)
+    of scaleName, the degrees of arrangement being labelled.
+    fanBase is the position of the apex of the fanned frets, as given by the
+    slider of the neck window; fanned necks always use the .strandberg＊ inlays
+    '''
+    tuning = tunings[tuningName]
+    layout = neckLayout(len(tuning), numFrets, scaleFactor, fanned, fanBase, regularFrets)
+    fan = layout.fan
+    scale = scales[scaleName]
+    scaleLength = len(scale)
+    modeMask = rotateMask(scaleToMask(scale), modeIndex)
+    rootPosition = firstRootPosition(tuningName, notes[rootNote])
+    pitches = pitchMatrix(tuning, numFrets, rootPosition)
+    colours = hexTable(customColours[palette])
+
+    yield from svgHeader(*layout.bounds(showTuning), background)
+    yield neckBackground(tuningName, numFrets, scaleFactor, inlays, fanned, fanBase, regularFrets, showTuning)
+
+    # Notes
+    noteRadius = (STRING_SPACING / 2.0)*scaleFactor
+    stringSpacing = STRING_SPACING*scaleFactor
+    zeroFretNoteXadjustment = (15.2 if regularFrets else 39.8)*scaleFactor
+    strings, frets, semitones = pitches.playableArrays(modeMask)
+    ys = layout.height - (strings * stringSpacing)
+    adjustmentsForString = (ys-layout.halfHeight)/layout.halfHeight
+    adjustmentsForFret = (frets+.5)/numFrets
+    xs = layout.geometry.midpoints[frets+1]
+    newYs = ys + NECK_WIDENING * (adjustmentsForString * adjustmentsForFret)
+    yTops = newYs - stringSpacing/2
+    yBots = newYs + stringSpacing/2
+    xLefts = xs + zeroFretNoteXadjustment
+    xRights = xs + zeroFretNoteXadjustment + noteRadius/2
+    coordinates = (frets, semitones, fan.project(xs, newYs), newYs, yTops, yBots,
+                   fan.project(xLefts, yTops), fan.project(xRights, yTops),
+                   fan.project(xLefts, yBots), fan.project(xRights, yBots))
+    yield '<g %s stroke="none">\n' % NOTE_FILL
+    for (j, semitone, x, y, yTop, yBot, xTopLeft, xTopRight, xBotLeft, xBotRight) in zip(*(array.tolist() for array in coordinates)):
+        if j == -1:
+            yield '<polygon points="%s"/>\n' % points((xTopLeft, xTopRight, xBotRight, xBotLeft), (yTop, yTop, yBot, yBot))
+        elif showRoot and semitone % 12 == 0:
+            yield '<polygon points="%s"/>\n' % points((x, x + noteRadius, x - noteRadius), (y - noteRadius, y + noteRadius, y + noteRadius))
+        else:
+            yield '<circle cx="%.2f" cy="%.2f" r="%.2f"/>\n' % (x, y, noteRadius)
+    yield '</g>\n'
+
+    # Coloured rectangles and degree labels below the neck, from the lowest string
+    lowStringSemitones = pitches.semitones[0].tolist()
+    y, yTop, yBot, xs, xLefts, xRights = layout.labelsRow()
+    coordinates = (fan.project(xLefts, yTop), fan.project(xRights, yTop),
+                   fan.project(xLefts, yBot), fan.project(xRights, yBot), fan.project(xs, y))
+    labels = list()
+    yield '<g stroke="none">\n'
+    for (j, xTopLeft, xTopRight, xBotLeft, xBotRight, xLabel) in zip(range(-1, numFrets), *(array.tolist() for array in coordinates)):
+        semitone = lowStringSemitones[j+1]
+        yield ('<polygon points="%s" fill="%s"/>\n'
+               % (points((xTopLeft, xTopRight, xBotRight, xBotLeft), (yTop, yTop, yBot, yBot)), colours[(semitone + scale[modeIndex])%12]))
+        if maskContains(modeMask, semitone) and (rootPosition <= j <= numFrets - rootPosition):
+            degree = degreeIndex(modeMask, semitone)%scaleLength
+            if degree + 1 in arrangement:
+                labels.append('<text x="%.2f" y="%.2f">%s</text>\n' % (xLabel, y+3, degrees[degree]))
+    yield '</g>\n'
+    yield ('<g font-family="%s" font-size="%.2f" text-anchor="middle" dominant-baseline="central" fill="#ffffff" stroke="#ffffff">\n'
+           % (FONT, fontSize(.95*(STRING_SPACING*scaleFactor))))
+    yield from labels
+    yield '</g>\n'
+    yield '</svg>\n'
+
+# -----------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="SVG drawing of a scale circle or neck, written to the standard output")
+    parser.add_argument("view", choices=("circle", "neck"))
+    parser.add_argument("--scale", choices=list(scales.keys()), default="Natural")
+    parser.add_argument("--mode", type=int, default=1, help="mode of the scale, from 1")
+    parser.add_argument("--degree", type=int, default=1, help="degree shown by the circle, from 1")
+    parser.add_argument("--tuning", choices=list(tunings.keys()), default="Standard 6 \tEADGBE")
+    parser.add_argument("--root", choices=list(notes.keys()), default="E")
+    parser.add_argument("--inlays", default=".strandberg＊")
+    parser.add_argument("--palette", choices=list(customColours.keys()), default=DEGREE_COLOUR)
+    parser.add_argument("--fanned", action="store_true")
+    parser.add_argument("--scale-factor", type=float, default=1.0)
+    arguments = parser.parse_args()
+
+    if arguments.view == "circle":
+        chunks = circleSvg(arguments.scale, arguments.mode-1, arguments.degree, arguments.palette, arguments.scale_factor)
+    else:
+        chunks = neckSvg(arguments.tuning, arguments.root, arguments.scale, arguments.mode-1, inlays=arguments.inlays,
+                         palette=arguments.palette, scaleFactor=arguments.scale_factor, fanned=arguments.fanned)
+    writeSvg(chunks)
@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+#
+# -----------------------------------------------------------------------------
+# Author: Gregoire Vandenschrick
+# Date:   17/10/2026
+# ࿄ ࿅ ࿇
+# -----------------------------------------------------------------------------
+'''
+Qt-free HTTP/JSON service answering questions on the neck (see neck_queries),
+for other tools, on localhost by default:
+
+    GET /positions?tuning=Standard 7&root=D&scale=Natural&mode=Dorian
+        notes of a mode on the whole neck, as in the neck window
+    GET /chords?scale=Harmonic&mode=1&degree=5[&root=A][&strings=1-5]
+        chords of a degree of a mode, as in the chords combobox of its frame
+    GET /voicings?scale=Natural&mode=6&degree=1&root=A&chord=Am7&strings=2-5&limit=5
+        best voicings of one of these chords, searched on the neck of the
+        degree frame: frameFret is the fret on that neck, fret and note the
+        ones on the real neck, only given with a root
+    GET /catalogs
+        names of the scales, modes, tunings and notes
+    GET /stats
+        state of the response cache
+
+tuning is a catalog name or its part before the tab, mode a number from 1 or
+(the beginning of) a mode name, strings are numbered from the lowest one (1).
+Connections are served concurrently by asyncio and kept alive; the queries
+are answered in the threads of the default executor, so that a long voicing
+search does not hold the other connections, and the answers are kept in an
+LRU cache keyed by path and parameters.
+
+    python theory_service.py [--port 8765] [--cache-size 4096]
+'''
+
+from functools import lru_cache
+from urllib.parse import urlsplit, parse_qsl
+import argparse
+import asyncio
+import json
+
+from catalogs import notes, scales, tunings, chords, degrees
+from pitch_class_sets import maskToScale, degreeIndex
+from pitch_class_index import modeName
+from neck_queries import NOTES_BY_INDEX, MODES_BY_SCALE, findTuning, findMode, degreeMask, degreeNote
+from neck_queries import neckPositions, chordsOfDegree, chordVoicings, neckFretShift
+
+HOST = "127.0.0.1"
+PORT = 8765
+RESPONSE_CACHE_SIZE = 4096
+MAXIMUM_VOICINGS = 100
+BODY_CHUNK_SIZE = 65536 # bytes of a request body dropped at once
+
+class QueryError(Exception):
+    '''
+    Query that cannot be answered, told to the client with a 400 status
+    '''
+
+# -----------------------------------------------------------------------------
+
+def scaleParameter(query):
+    scaleName = query.get("scale", "Natural")
+    if scaleName not in scales:
+        raise QueryError("unknown scale %r" % scaleName)
+    return scaleName
+
+def modeParameter(query, scaleName):
+    modeIndex = findMode(scaleName, query.get("mode", "1"))
+    if modeIndex is None:
+        raise QueryError("unknown mode %r of scale %r" % (query.get("mode"), scaleName))
+    return modeIndex
+
+def integerParameter(query, name, default, minimum, maximum):
+    try:
+        value = int(query.get(name, default))
+    except ValueError:
+        raise QueryError("%s must be an integer" % name)
+    if not minimum <= value <= maximum:
+        raise QueryError("%s must be between %s and %s" % (name, minimum, maximum))
+    return value
+
+def tuningParameter(query):
+    tuningName = findTuning(query.get("tuning", "Standard 6"))
+    if tuningName is None:
+        raise QueryError("unknown tuning %r" % query.get("tuning"))
+    return tuningName
+
+def rootParameter(query, default=None):
+    rootNote = query.get("root", default)
+    if rootNote is not None and rootNote not in notes:
+        raise QueryError("unknown root note %r" % rootNote)
+    return rootNote
+
+def stringsParameter(query, numberOfStrings):
+    '''
+    (lowest, highest) strings of "low-high", as the string limits of the degree frames
+    '''
+    try:
+        lowStringLimit, highStringLimit = (int(string) for string in query.get("strings", "1-4").split("-"))
+    except ValueError:
+        raise QueryError("strings must be given as low-high, e.g. 2-5")
+    if not 1 <= lowStringLimit <= highStringLimit <= numberOfStrings:
+        raise QueryError("strings must be within 1-%s" % numberOfStrings)
+    return lowStringLimit, highStringLimit
+
+def noteNames(rootNote, semitones):
+    if rootNote is None:
+        return None
+    return [NOTES_BY_INDEX[(notes[rootNote] + semitone)%12] for semitone in semitones]
+
+# -----------------------------------------------------------------------------
+
+def positionsQuery(query):
+    tuningName = tuningParameter(query)
+    rootNote = rootParameter(query, "E")
+    scaleName = scaleParameter(query)
+    modeIndex = modeParameter(query, scaleName)
+    numFrets = integerParameter(query, "frets", 24, 1, 36)
+    modeScale = maskToScale(degreeMask(scaleName, modeIndex))
+    positions = [{"string": string + 1,
+                  "fret": fret,
+                  "note": NOTES_BY_INDEX[(notes[rootNote] + semitone)%12],
+                  "degree": degrees[degree]}
+                 for (string, fret, semitone, degree) in neckPositions(tuningName, rootNote, scaleName, modeIndex, numFrets)]
+    return {"tuning": tuningName,
+            "root": rootNote,
+            "scale": scaleName,
+            "mode": MODES_BY_SCALE[scaleName][modeIndex],
+            "notes": noteNames(rootNote, modeScale),
+            "positions": positions}
+
+def degreeChords(query):
+    '''
+    Parameters of a degree frame and the chords of its chords combobox
+    '''
+    scaleName = scaleParameter(query)
+    modeIndex = modeParameter(query, scaleName)
+    degree = integerParameter(query, "degree", 1, 1, len(scales[scaleName]))
+    rootNote = rootParameter(query)
+    tuningName = tuningParameter(query)
+    lowStringLimit, highStringLimit = stringsParameter(query, len(tunings[tuningName]))
+    mask = degreeMask(scaleName, modeIndex, degree)
+    note = degreeNote(rootNote, scaleName, modeIndex, degree) if rootNote is not None else ''
+    availableChords = [(note + notation, notation, chord) for (notation, chord) in chordsOfDegree(mask, highStringLimit)]
+    return scaleName, modeIndex, degree, note, tuningName, (lowStringLimit, highStringLimit), mask, availableChords
+
+def chordsQuery(query):
+    scaleName, modeIndex, degree, note, tuningName, strings, mask, availableChords = degreeChords(query)
+    return {"scale": scaleName,
+            "mode": MODES_BY_SCALE[scaleName][modeIndex],
+            "degree": degrees[degree-1],
+            "degreeMode": modeName(mask),
+            "note": note or None,
+            "chords": [{"name": name,
+                        "notation": notation,
+                        "description": chords[chord]["name"] if chord in chords else None,
+                        "semitones": list(chord),
+                        "notes": noteNames(note or None, chord)}
+                       for (name, notation, chord) in availableChords]}
+
+def voicingsQuery(query):
+    scaleName, modeIndex, degree, note, tuningName, strings, mask, availableChords = degreeChords(query)
+    wanted = query.get("chord", "")
+    matching = [(name, chord) for (name, notation, chord) in availableChords if wanted in (name, notation)]
+    if not matching:
+        raise QueryError("no chord %r on degree %s, see /chords" % (wanted, degrees[degree-1]))
+    name, chord = matching[0]
+    limit = integerParameter(query, "limit", 5, 1, MAXIMUM_VOICINGS)
+    voicings = chordVoicings(tunings[tuningName], mask, chord, strings[0], strings[1], limit)
+    scaleLength = len(scales[scaleName])
+    answeredVoicings = list()
+    for (distance, voicing) in voicings:
+        # frets of the neck of the degree frame, moved on the real neck once the note of the degree is known
+        fretShift = neckFretShift(tuningName, notes[note], [fret for (string, chordNote, fret, semitone, label) in voicing]) if note else None
+        answeredVoicings.append({"distance": distance,
+                                 "positions": [{"string": string + 1,
+                                                "fret": fret + fretShift if note else None,
+                                                "frameFret": fret,
+                                                "degree": degrees[degreeIndex(mask, chordNote)%scaleLength],
+                                                "note": NOTES_BY_INDEX[(notes[note] + chordNote)%12] if note else None}
+                                               for (string, chordNote, fret, semitone, label) in voicing]})
+    return {"chord": name,
+            "semitones": list(chord),
+            "tuning": tuningName,
+            "strings": "%s-%s" % strings,
+            "voicings": answeredVoicings}
+
+def catalogsQuery(query):
+    return {"scales": {scaleName: MODES_BY_SCALE[scaleName] for scaleName in scales.keys()},
+            "tunings": list(tunings.keys()),
+            "notes": list(notes.keys())}
+
+QUERIES = {
+    "/positions": positionsQuery,
+    "/chords": chordsQuery,
+    "/voicings": voicingsQuery,
+    "/catalogs": catalogsQuery,
+}
+
+# -----------------------------------------------------------------------------
+
+@lru_cache(maxsize=RESPONSE_CACHE_SIZE)
+def response(path, query):
+    '''
+    (status, json body as bytes) of a query given as a path and a sorted
+    tuple of (parameter, value); kept in an LRU cache
+    '''
+    if path not in QUERIES:
+        return 404, encode({"error": "unknown path %r, use one of %s" % (path, ", ".join(QUERIES.keys()))})
+    try:
+        return 200, encode(QUERIES[path](dict(query)))
+    except QueryError as error:
+        return 400, encode({"error": str(error)})
+
+def encode(answer):
+    return json.dumps(answer, ensure_ascii=False).encode('utf-8')
+
+def cacheStatistics():
+    cacheInfo = response.cache_info()
+    return {"hits": cacheInfo.hits, "misses": cacheInfo.misses, "size": cacheInfo.currsize, "maximumSize": cacheInfo.maxsize}
+
+def answer(target):
+    '''
+    (status, body) for the target (path and query string) of a GET request
+    '''
+    url = urlsplit(target)
+    if url.path == "/stats":
+        return 200, encode(cacheStatistics())
+    return response(url.path, tuple(sorted(parse_qsl(url.query))))
+
+STATUS_TEXTS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}
+
+async def readRequest(reader):
+    '''
+    (method, target, version, headers) of the next request of a connection,
+    None once the client has closed it. The body, which no query uses, is read
+    and dropped so that the next request is read from its beginning.
+    Raises QueryError for a request that cannot be read
+    '''
+    requestLine = await reader.readline()
+    if not requestLine.strip():
+        return None
+    headers = dict()
+    while True:
+        headerLine = await reader.readline()
+        if headerLine in (b"\r\n", b"\n", b""):
+            break
+        key, _, value = headerLine.decode('latin-1').partition(":")
+        headers[key.strip().lower()] = value.strip().lower()
+    if "transfer-encoding" in headers:
+        raise QueryError("bodies must be sent with a Content-Length")
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        length = -1
+    if length < 0:
+        raise QueryError("invalid Content-Length")
+    while length > 0:
+        length -= len(await reader.readexactly(min(length, BODY_CHUNK_SIZE)))
+    try:
+        method, target, version = requestLine.decode('latin-1').split()
+    except ValueError:
+        raise QueryError("malformed request line")
+    return method, target, version, headers
+
+def responseBytes(status, body, keepAlive):
+    return ("HTTP/1.1 %s %s\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            "Content-Length: %s\r\n"
+            "Connection: %s\r\n\r\n" % (status, STATUS_TEXTS[status], len(body), "keep-alive" if keepAlive else "close")).encode('latin-1') + body
+
+async def handleConnection(reader, writer):
+    '''
+    Serves the requests of a connection, one after the other, until the
+    client closes it or asks not to keep it alive. A request that cannot be
+    read is answered with a 400 status and closes the connection, what
+    follows it in the stream not being trustworthy
+    '''
+    try:
+        while True:
+            try:
+                request = await readRequest(reader)
+            except QueryError as error:
+                writer.write(responseBytes(400, encode({"error": str(error)}), False))
+                await writer.drain()
+                break
+            except (ValueError, asyncio.LimitOverrunError):
+                # readline beyond the limit of the stream
+                writer.write(responseBytes(400, encode({"error": "request line or header too long"}), False))
+                await writer.drain()
+                break
+            if request is None:
+                break
+            method, target, version, headers = request
+            if method == "GET":
+                # a voicing search may take a while, the other connections are served meanwhile
+                status, body = await asyncio.get_running_loop().run_in_executor(None, answer, target)
+            else:
+                status, body = 405, encode({"error": "only GET is served"})
+            keepAlive = (version == "HTTP/1.1" and headers.get("connection") != "close") or headers.get("connection") == "keep-alive"
+            writer.write(responseBytes(status, body, keepAlive))
+            await writer.drain()
+            if not keepAlive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+async def serve(host=HOST, port=PORT):
+    server = await asyncio.start_server(handleConnection, host, port)
+    print("Serving on http://%s:%s" % (host, port))
+    async with server:
+        await server.serve_forever()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HTTP/JSON service of neck and chord queries")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--cache-size", type=int, default=RESPONSE_CACHE_SIZE, help="number of answers kept")
+    arguments = parser.parse_args()
+    if arguments.cache_size != RESPONSE_CACHE_SIZE:
+        response = lru_cache(maxsize=arguments.cache_size)(response.__wrapped__)
+    try:
+        asyncio.run(serve(arguments.host, arguments.port))
+    except KeyboardInterrupt:
+        pass